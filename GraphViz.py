@@ -1,14 +1,62 @@
+import sys
+
+if __name__ == "__main__" and len(sys.argv) > 1 and sys.argv[1] == "batch":
+    # Dávkový režim nepotrebuje Tk ani matplotlib, spustí sa ešte pred ich importom.
+    from batch import main
+    sys.exit(main(sys.argv[2:]))
+
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog, filedialog
-import networkx as nx
-import matplotlib
 import math
+import os
 import gzip
-from show_grafy import get_sample_graph_1, get_sample_graph_2, get_directed_graph, get_complex_graph
+import threading
+import time
+from instrumentation import Instrumentation
+from trace_io import LazyTrace, TraceReader, save_trace, graph_fingerprint
+from trace_store import TraceStore, DEFAULT_MEMORY_BUDGET_MB, DEFAULT_DISK_BUDGET_MB, format_memory_report
+from step_events import format_details, format_stack_item, resolve_step
+from widgets import VirtualListView
+
+# Počet krokov pred a za aktuálnym, ktoré sa vykreslia vopred na pozadí.
+PRERENDER_STEPS = 3
+TRACE_GRANULARITIES = (
+    ("auto", "automaticky podľa rozpočtu krokov"),
+    ("fine", "všetky kroky"),
+    ("node", "po vrcholoch"),
+    ("phase", "po fázach (SCC)"),
+)
+
+
+def load_modules():
+    # networkx, numpy a matplotlib sa načítajú až po zobrazení okna vo vlákne na pozadí.
+    # Moduly importované iba v jednotlivých metódach sa tu len prednačítajú do sys.modules.
+    global nx, algorithms, renderers, show_grafy, PositionStore
+    import networkx as nx
+    import algorithms
+    from positions import PositionStore
+    import renderers
+    import show_grafy
+    import all_pairs, condensation, frame_export, multi_query, graph_arrays, graph_io, heuristics, importers, rendering
+
+
+class BatchEdit:
+    # Úpravy vnútri bloku sa iba zaznamenajú; zneplatnenie vyrovnávacích pamätí
+    # a prekreslenie prebehne raz pri opustení najvonkajšieho bloku.
+    def __init__(self, app):
+        self.app = app
+
+    def __enter__(self):
+        self.app.batch_depth += 1
+        return self.app
+
+    def __exit__(self, *exc):
+        self.app.batch_depth -= 1
+        if self.app.batch_depth == 0 and self.app.batch_dirty:
+            self.app.batch_dirty = False
+            self.app.commit_edits()
+        return False
 
-matplotlib.use('TkAgg')
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib.pyplot as plt
 
 class GraphVisualizerApp:
     def __init__(self, master):
@@ -21,21 +69,88 @@ class GraphVisualizerApp:
 
         self.is_directed = False
         self.show_edges = True
-        self.graph = nx.Graph()
+        self.graph = None
+        self.renderer = None
         self.positions = {}         
         self.node_list = []         
         self.current_step_index = -1  
         self.algorithm_steps = []   
+        self.current_pseudocode = ""
+        self.trace_title = ""
+        self._trace_started = None
+        self.details_cache = {}
+        self.trace_memory_budget_mb = DEFAULT_MEMORY_BUDGET_MB
+        self.trace_disk_budget_mb = DEFAULT_DISK_BUDGET_MB
+        self.graph_version = 0
+        self.graph_cache = {}
+        self.landmark_count = 8
+        self.distance_source = None
+        self.trace_step_budget = 200_000
+        self.trace_version = 0
+        self.scc_trace = None
+        self.coarse_trace = None
 
         self.show_weights = True
         self.node_id = 0
+        self.batch_depth = 0
+        self.batch_dirty = False
+        self.selected_nodes = set()
+        self.scc_components = None
+        self.condensation = None
         self.add_node_mode = False
         self.add_edge_mode = False
         self.edge_start_node = None
+        self.instrumentation = Instrumentation()
         self.create_widgets()
+        self.load_modules_in_background()
+
+    def load_modules_in_background(self):
+        # Okno a menu sú viditeľné hneď, plátno a graf sa vytvoria po načítaní knižníc.
+        self.set_controls_state(tk.DISABLED)
+        self.update_status("Načítavam knižnice...")
+        started = self.instrumentation.start("načítanie knižníc")
+        progress = {'error': None, 'finished': False}
+
+        def worker():
+            try:
+                load_modules()
+            except Exception as e:
+                progress['error'] = e
+            progress['finished'] = True
+
+        def poll():
+            if not progress['finished']:
+                self.master.after(50, poll)
+                return
+            self.instrumentation.stop("načítanie knižníc", started)
+            if progress['error'] is not None:
+                messagebox.showerror("Chyba", f"Načítanie knižníc zlyhalo: {progress['error']}")
+                self.update_status("Načítanie knižníc zlyhalo.")
+                return
+            self.finish_startup()
+
+        threading.Thread(target=worker, daemon=True).start()
+        self.master.after(50, poll)
+
+    def finish_startup(self):
+        self.graph = nx.DiGraph() if self.is_directed else nx.Graph()
+        self.positions = PositionStore()
+        self.loading_label.destroy()
+        self.context_menu = tk.Menu(self.master, tearoff=0)
+        self.context_menu.add_command(label="Zmazať vrchol", command=self.delete_node)
+        self.context_menu.add_command(label="Zmazať hranu", command=self.delete_edge)
+        self.create_renderer()
+        self.set_controls_state(tk.NORMAL)
+        self.update_status("Vitajte! Vyberte si algoritmus pre vizualizáciu.")
+
+    def set_controls_state(self, state):
+        for label in ("Súbor", "Úpravy", "Algoritmy", "Režim"):
+            self.menubar.entryconfig(label, state=state)
+        self.add_node_button.config(state=state)
+        self.add_edge_button.config(state=state)
 
     def clear_step_visualization(self):
-        self.stack_listbox.delete(0, tk.END)
+        self.stack_view.clear()
         self.details_text.config(state=tk.NORMAL)
         self.details_text.delete("1.0", tk.END)
         self.details_text.config(state=tk.DISABLED)
@@ -51,7 +166,8 @@ class GraphVisualizerApp:
         self.paned_window.add(self.main_area, weight=1)
 
         self.create_sidebar_components()
-        self.create_canvas()
+        self.loading_label = ttk.Label(self.main_area, text="Načítavam knižnice...", anchor=tk.CENTER)
+        self.loading_label.pack(fill=tk.BOTH, expand=True)
         self.create_menu()
         self.create_toolbar()
         self.create_status_bar()
@@ -65,8 +181,8 @@ class GraphVisualizerApp:
 
         stack_label = ttk.Label(self.sidebar, text="Vizualizácia dátovej štruktúry", font=("Arial", 12, "bold"))
         stack_label.pack(anchor=tk.W, pady=(0, 5))
-        self.stack_listbox = tk.Listbox(self.sidebar, height=10, width=40)
-        self.stack_listbox.pack(fill=tk.BOTH, pady=(0, 10))
+        self.stack_view = VirtualListView(self.sidebar, height=10, width=40)
+        self.stack_view.pack(fill=tk.BOTH, pady=(0, 10))
 
         details_label = ttk.Label(self.sidebar, text="Detailný popis kroku", font=("Arial", 12, "bold"))
         details_label.pack(anchor=tk.W, pady=(0, 5))
@@ -74,91 +190,354 @@ class GraphVisualizerApp:
         self.details_text.pack(fill=tk.BOTH, pady=(0, 10))
         self.details_text.config(state=tk.DISABLED)
 
-    def create_canvas(self):
-        self.figure = plt.Figure(figsize=(6, 4))
-        self.ax = self.figure.add_subplot(111)
-        self.ax.set_axis_on()
-        self.ax.grid(True)
-        self.ax.set_aspect('equal')
-        self.fixed_margin = 10
-        self.fixed_limits = (-self.fixed_margin, self.fixed_margin, -self.fixed_margin, self.fixed_margin)
-        self.ax.set_xlim(self.fixed_limits[0], self.fixed_limits[1])
-        self.ax.set_ylim(self.fixed_limits[2], self.fixed_limits[3])
-
-        self.canvas = FigureCanvasTkAgg(self.figure, self.main_area)
-        self.canvas.draw()
-        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-
-        self.annot = self.ax.annotate("", xy=(0, 0), xytext=(10, 10),
-                                      textcoords="offset points",
-                                      bbox=dict(boxstyle="round", fc="w"),
-                                      arrowprops=dict(arrowstyle="->"))
-        self.annot.set_visible(False)
-        self.canvas.mpl_connect("motion_notify_event", self.on_hover)
-        self.canvas.mpl_connect("button_press_event", self.on_canvas_click)
-        self.canvas.mpl_connect("pick_event", self.on_pick)
-
-        self.canvas.get_tk_widget().bind("<Button-3>", self.show_context_menu)
-        self.context_menu = tk.Menu(self.master, tearoff=0)
-        self.context_menu.add_command(label="Zmazať vrchol", command=self.delete_node)
-        self.context_menu.add_command(label="Zmazať hranu", command=self.delete_edge)
+        self.create_instrumentation_panel()
+
+    def create_instrumentation_panel(self):
+        self.instrumentation_toggle = ttk.Button(self.sidebar, text="▸ Meranie výkonu", command=self.toggle_instrumentation_panel)
+        self.instrumentation_toggle.pack(anchor=tk.W, pady=(0, 5))
+        self.instrumentation_frame = ttk.Frame(self.sidebar)
+
+        self.instrumentation_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(self.instrumentation_frame, text="Zapnúť meranie", variable=self.instrumentation_var,
+                        command=self.toggle_instrumentation).pack(anchor=tk.W)
+        self.profile_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(self.instrumentation_frame, text="Profilovať ďalší beh (cProfile)", variable=self.profile_var,
+                        command=self.toggle_profile_next_run).pack(anchor=tk.W)
+
+        self.instrumentation_text = tk.Text(self.instrumentation_frame, wrap=tk.NONE, height=8, width=40, background="#F5F5F5")
+        self.instrumentation_text.pack(fill=tk.X, pady=(5, 5))
+        self.instrumentation_text.config(state=tk.DISABLED)
+
+        buttons = ttk.Frame(self.instrumentation_frame)
+        buttons.pack(fill=tk.X)
+        ttk.Button(buttons, text="Vynulovať", command=self.reset_instrumentation).pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Button(buttons, text="Exportovať JSON...", command=self.export_instrumentation).pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Button(buttons, text="Profil", command=self.show_profile_report).pack(side=tk.LEFT)
+        self.instrumentation_visible = False
+        self._instrumentation_job = None
+
+    def toggle_instrumentation_panel(self):
+        self.instrumentation_visible = not self.instrumentation_visible
+        if self.instrumentation_visible:
+            self.instrumentation_toggle.config(text="▾ Meranie výkonu")
+            self.instrumentation_frame.pack(fill=tk.X, pady=(0, 10), after=self.instrumentation_toggle)
+            self.refresh_instrumentation_panel()
+        else:
+            self.instrumentation_toggle.config(text="▸ Meranie výkonu")
+            self.instrumentation_frame.pack_forget()
+
+    def toggle_instrumentation(self):
+        self.instrumentation.enabled = self.instrumentation_var.get()
+        self.refresh_instrumentation_panel()
+
+    def toggle_profile_next_run(self):
+        self.instrumentation.profile_next_run = self.profile_var.get()
+
+    def reset_instrumentation(self):
+        self.instrumentation.reset()
+        self.refresh_instrumentation_panel()
 
-    def on_hover(self, event):
-        if event.inaxes != self.ax:
-            self.annot.set_visible(False)
-            self.canvas.draw_idle()
+    def refresh_instrumentation_panel(self):
+        if not self.instrumentation_visible:
             return
-        threshold = 0.3
-        vis = False
-        if event.xdata is None or event.ydata is None:
-            self.annot.set_visible(False)
-            self.canvas.draw_idle()
+        lines = self.instrumentation.format_lines()
+        if not self.instrumentation.enabled:
+            lines.insert(0, "Meranie je vypnuté.")
+        self.instrumentation_text.config(state=tk.NORMAL)
+        self.instrumentation_text.delete("1.0", tk.END)
+        self.instrumentation_text.insert(tk.END, "\n".join(lines))
+        self.instrumentation_text.config(state=tk.DISABLED)
+        if self._instrumentation_job is not None:
+            self.master.after_cancel(self._instrumentation_job)
+            self._instrumentation_job = None
+        if self.instrumentation.enabled:
+            self._instrumentation_job = self.master.after(500, self.refresh_instrumentation_panel)
+
+    def show_profile_report(self):
+        if not self.instrumentation.profile_report:
+            messagebox.showinfo("Profil", "Zatiaľ nebol zaznamenaný žiadny profil. Zapnite 'Profilovať ďalší beh' a spustite algoritmus.")
             return
-        for node in self.node_list:
-            pos = self.positions.get(node)
-            if pos is None:
-                continue
-            dx = pos[0] - event.xdata
-            dy = pos[1] - event.ydata
-            if math.hypot(dx, dy) < threshold:
-                self.annot.xy = pos
-                self.annot.set_text(f"vrchol: {node}")
-                self.annot.get_bbox_patch().set_facecolor("lightyellow")
-                self.annot.get_bbox_patch().set_alpha(0.9)
-                vis = True
-                break
-        self.annot.set_visible(vis)
-        self.canvas.draw_idle()
+        profile_win = tk.Toplevel(self.master)
+        profile_win.title("Profil posledného behu")
+        profile_win.geometry("900x500")
+        profile_text = tk.Text(profile_win, wrap=tk.NONE, font=("Courier", 10))
+        profile_text.pack(fill=tk.BOTH, expand=True)
+        profile_text.insert(tk.END, self.instrumentation.profile_report)
+        profile_text.config(state=tk.DISABLED)
+
+    def export_instrumentation(self):
+        file_path = filedialog.asksaveasfilename(defaultextension=".json",
+                                                 filetypes=[("JSON súbory", "*.json"), ("Všetky súbory", "*.*")])
+        if file_path:
+            try:
+                self.instrumentation.export_json(file_path)
+                self.update_status(f"Meranie exportované do {file_path}.")
+            except Exception as e:
+                messagebox.showerror("Chyba", f"Export merania zlyhal: {e}")
+
+    def redraw_canvas(self):
+        with self.instrumentation.timer("canvas.draw"):
+            self.renderer.refresh()
+
+    def close_trace(self):
+        if isinstance(self.algorithm_steps, LazyTrace):
+            self.algorithm_steps.close()
+        self.discard_coarse_trace()
+        self.algorithm_steps = []
+        self.trace_version += 1
+        self.details_cache = {}
+
+    def begin_trace(self):
+        self.close_trace()
+        measure = "tracemalloc" if self.tracemalloc_var.get() else "estimate"
+        self.algorithm_steps = TraceStore(self.trace_memory_budget_mb, disk_budget_mb=self.trace_disk_budget_mb,
+                                          measure=measure)
+        self.scc_trace = None
+        self.instrumentation.reset_counters()
+        self.instrumentation.stop_profile()
+        self.instrumentation.start_profile()
+        self._trace_started = self.instrumentation.start("generovanie trasy")
+
+    def abort_trace(self):
+        # Algoritmus skončil chybou: meranie a profil sa uzavrú, čiastočná trasa sa zahodí.
+        self.instrumentation.stop("generovanie trasy", self._trace_started)
+        self._trace_started = None
+        self.instrumentation.stop_profile()
+        if self.profile_var.get() and not self.instrumentation.profile_next_run:
+            self.profile_var.set(False)
+        if isinstance(self.algorithm_steps, TraceStore):
+            self.algorithm_steps.finish()
+        self.close_trace()
+        self.scc_trace = None
+        self.refresh_instrumentation_panel()
+
+    def finish_trace(self, message):
+        self.instrumentation.stop("generovanie trasy", self._trace_started)
+        self.instrumentation.stop_profile()
+        if self.profile_var.get() and not self.instrumentation.profile_next_run:
+            self.profile_var.set(False)
+        self.trace_title = message
+        self.current_step_index = -1
+        self.next_step_button.config(state=tk.NORMAL)
+        self.prev_step_button.config(state=tk.DISABLED)
+        if isinstance(self.algorithm_steps, TraceStore):
+            report = self.algorithm_steps.finish()
+            self.instrumentation.record_trace_memory(report)
+            message += " " + format_memory_report(report)
+        self.update_status(message)
+        self.refresh_instrumentation_panel()
+
+    def export_trace(self):
+        if not len(self.algorithm_steps):
+            messagebox.showwarning("Upozornenie", "Nie je k dispozícii žiadna trasa algoritmu.")
+            return
+        file_path = filedialog.asksaveasfilename(defaultextension=".gvtrace",
+                                                 filetypes=[("Trasy algoritmov", "*.gvtrace"), ("Všetky súbory", "*.*")])
+        if not file_path:
+            return
+        compressed = messagebox.askyesno("Export trasy", "Komprimovať kroky trasy?")
+        header = {
+            'title': self.trace_title,
+            'pseudocode': self.current_pseudocode,
+            'fingerprint': graph_fingerprint(self.graph, self.positions),
+            'directed': self.is_directed,
+            'show_weights': self.show_weights,
+            'steps': len(self.algorithm_steps),
+        }
+        try:
+            save_trace(file_path, self.algorithm_steps, header, compressed)
+            self.update_status(f"Trasa ({len(self.algorithm_steps)} krokov) uložená do {file_path}.")
+        except Exception as e:
+            messagebox.showerror("Chyba", f"Export trasy zlyhal: {e}")
+
+    def export_step_animation(self):
+        if not len(self.algorithm_steps):
+            messagebox.showwarning("Upozornenie", "Nie je k dispozícii žiadna trasa algoritmu.")
+            return
+        from frame_export import export_animation, graph_snapshot, ffmpeg_available
+        filetypes = [("Animovaný GIF", "*.gif"), ("Postupnosť PNG do priečinka", "*.png")]
+        if ffmpeg_available():
+            filetypes.insert(1, ("Video MP4", "*.mp4"))
+        file_path = filedialog.asksaveasfilename(defaultextension=".gif", filetypes=filetypes)
+        if not file_path:
+            return
+        transition_frames = 0
+        if messagebox.askyesno("Export animácie", "Exportovať aj prechodové snímky medzi krokmi?"):
+            transition_frames = 10
+        figsize, dpi = self.renderer.figure_size()
+        snapshot = graph_snapshot(self.graph, self.positions, self.show_weights, figsize=figsize, dpi=dpi)
+        progress = {'done': 0, 'total': 0, 'error': None, 'finished': False}
+
+        def report(done, total):
+            progress['done'], progress['total'] = done, total
+
+        def worker():
+            try:
+                export_animation(self.algorithm_steps, snapshot, file_path, transition_frames, progress=report)
+            except Exception as e:
+                progress['error'] = e
+            progress['finished'] = True
+
+        def poll():
+            if not progress['finished']:
+                self.update_status(f"Export animácie: snímok {progress['done']} z {progress['total']}...")
+                self.master.after(250, poll)
+            elif progress['error'] is not None:
+                messagebox.showerror("Chyba", f"Export animácie zlyhal: {progress['error']}")
+                self.update_status("Export animácie zlyhal.")
+            else:
+                self.update_status(f"Animácia ({progress['total']} snímok) uložená do {file_path}.")
+
+        threading.Thread(target=worker, daemon=True).start()
+        poll()
+
+    def import_trace(self):
+        file_path = filedialog.askopenfilename(defaultextension=".gvtrace",
+                                               filetypes=[("Trasy algoritmov", "*.gvtrace"), ("Všetky súbory", "*.*")])
+        if not file_path:
+            return
+        try:
+            trace = TraceReader(file_path)
+        except Exception as e:
+            messagebox.showerror("Chyba", f"Načítanie trasy zlyhalo: {e}")
+            return
+        if trace.fingerprint != graph_fingerprint(self.graph, self.positions):
+            if not messagebox.askyesno("Upozornenie", "Trasa bola vytvorená pre iný graf. Chcete ju napriek tomu prehrať?"):
+                trace.close()
+                return
+        self.clear_step_visualization()
+        self.close_trace()
+        self.algorithm_steps = trace
+        self.show_weights = trace.header.get('show_weights', True)
+        self.display_pseudocode(trace.pseudocode)
+        self.draw_graph()
+        self.finish_trace(f"Trasa načítaná z {file_path}: {len(trace)} krokov.")
+        self.trace_title = trace.header.get('title', "")
+
+    def create_renderer(self):
+        # Tk plátno upravuje existujúce položky na mieste; matplotlib ostáva pre export a porovnanie.
+        if self.renderer_kind.get() == "matplotlib":
+            renderer_class = renderers.MatplotlibRenderer
+        else:
+            renderer_class = renderers.TkCanvasRenderer
+        self.renderer = renderer_class(self.main_area, self.on_canvas_click, self.on_hover)
+        self.renderer.widget.pack(fill=tk.BOTH, expand=True)
+        self.renderer.widget.bind("<Button-3>", self.show_context_menu)
+
+    def switch_renderer(self):
+        condensation = self.condensation
+        self.renderer.destroy()
+        self.create_renderer()
+        self.draw_graph()
+        if condensation is not None:
+            self.condensation = condensation
+            self.draw_condensation()
+        elif 0 <= self.current_step_index < len(self.algorithm_steps):
+            self.draw_graph_with_step(self.algorithm_steps[self.current_step_index], self.current_step_index)
+        self.update_status(f"Vykresľovanie: {self.renderer.name}.")
+
+    def on_hover(self, x, y):
+        if self.condensation is not None:
+            item = None if x is None else self.condensation.find(x, y)
+            if item is None:
+                self.renderer.hide_tooltip()
+            else:
+                self.renderer.show_tooltip(self.condensation.position(item), self.condensation.describe(item))
+            return
+        node = None if x is None else self.find_node_at(x, y)
+        if node is None:
+            self.renderer.hide_tooltip()
+        else:
+            self.renderer.show_tooltip(self.positions[node], self.hover_text(node))
 
     def create_menu(self):
-        menubar = tk.Menu(self.master)
+        menubar = self.menubar = tk.Menu(self.master)
 
         file_menu = tk.Menu(menubar, tearoff=0)
         file_menu.add_command(label="Nový graf", command=self.new_graph)
         file_menu.add_command(label="Otvoriť graf...", command=self.open_graph)
         file_menu.add_command(label="Uložiť graf...", command=self.save_graph)
+        file_menu.add_command(label="Importovať graf (DIMACS, SNAP, CSV, GraphML)...", command=self.import_graph)
+        file_menu.add_command(label="Exportovať trasu algoritmu...", command=self.export_trace)
+        file_menu.add_command(label="Importovať trasu algoritmu...", command=self.import_trace)
+        file_menu.add_command(label="Exportovať animáciu krokov...", command=self.export_step_animation)
         file_menu.add_separator()
         file_menu.add_command(label="Ukončiť", command=self.master.quit)
         file_menu.add_separator()
-        file_menu.add_command(label="Načítať neorientovaný graf 1", command=lambda: self.load_sample_graph(get_sample_graph_1))
-        file_menu.add_command(label="Načítať neorientovaný graf 2", command=lambda: self.load_sample_graph(get_sample_graph_2))
-        file_menu.add_command(label="Načítať orientovaný graf 1", command=lambda: self.load_sample_graph(get_directed_graph))
-        file_menu.add_command(label="Načítať orientovaný graf 2", command=lambda: self.load_sample_graph(get_complex_graph))
+        file_menu.add_command(label="Načítať neorientovaný graf 1", command=lambda: self.load_sample_graph(show_grafy.get_sample_graph_1))
+        file_menu.add_command(label="Načítať neorientovaný graf 2", command=lambda: self.load_sample_graph(show_grafy.get_sample_graph_2))
+        file_menu.add_command(label="Načítať orientovaný graf 1", command=lambda: self.load_sample_graph(show_grafy.get_directed_graph))
+        file_menu.add_command(label="Načítať orientovaný graf 2", command=lambda: self.load_sample_graph(show_grafy.get_complex_graph))
+        file_menu.add_separator()
+        generate_menu = tk.Menu(file_menu, tearoff=0)
+        generate_menu.add_command(label="Mriežka...", command=lambda: self.load_generated_graph(show_grafy.generate_grid_graph, "Mriežka"))
+        generate_menu.add_command(label="Cestná sieť...", command=lambda: self.load_generated_graph(show_grafy.generate_road_graph, "Cestná sieť"))
+        generate_menu.add_command(label="Náhodný geometrický graf...", command=lambda: self.load_generated_graph(show_grafy.generate_random_geometric_graph, "Náhodný geometrický graf"))
+        generate_menu.add_command(label="Orientovaný graf so SCC...", command=self.load_generated_scc_dag)
+        generate_menu.add_command(label="Graf so zápornými hranami...", command=lambda: self.load_generated_graph(show_grafy.generate_negative_weight_graph, "Graf so zápornými hranami"))
+        file_menu.add_cascade(label="Generovať graf", menu=generate_menu)
         menubar.add_cascade(label="Súbor", menu=file_menu)
 
+        edit_menu = tk.Menu(menubar, tearoff=0)
+        edit_menu.add_command(label="Vložiť zoznam hrán...", command=self.paste_edge_list)
+        edit_menu.add_command(label="Pridať mriežku vrcholov...", command=self.add_node_grid)
+        edit_menu.add_separator()
+        self.select_mode_var = tk.BooleanVar(value=False)
+        edit_menu.add_checkbutton(label="Vyberať vrcholy kliknutím", variable=self.select_mode_var,
+                                  command=self.toggle_select_mode)
+        edit_menu.add_command(label="Vybrať vrcholy podľa ID...", command=self.select_nodes_by_id)
+        edit_menu.add_command(label="Zrušiť výber", command=lambda: self.set_selection(set()))
+        edit_menu.add_command(label="Odstrániť vybrané vrcholy", command=self.remove_selection)
+        menubar.add_cascade(label="Úpravy", menu=edit_menu)
+
         algorithms_menu = tk.Menu(menubar, tearoff=0)
         algorithms_menu.add_command(label="Dijkstrov algoritmus", command=self.run_dijkstra)
+        algorithms_menu.add_command(label="Delta-stepping", command=self.run_delta_stepping)
         algorithms_menu.add_command(label="Bellman-Fordov algoritmus", command=self.run_bellman_ford)
         algorithms_menu.add_command(label="A* algoritmus", command=self.run_astar)
+        algorithms_menu.add_command(label="Obojsmerný Dijkstrov algoritmus", command=lambda: self.run_bidirectional(False))
+        algorithms_menu.add_command(label="Obojsmerný A* algoritmus", command=lambda: self.run_bidirectional(True))
+        algorithms_menu.add_command(label="Všetky najkratšie cesty (Floyd-Warshall / Johnson)", command=self.run_all_pairs)
+        algorithms_menu.add_command(label="Dávka dotazov najkratších ciest...", command=self.query_pairs_dialog)
         algorithms_menu.add_command(label="Kruskalov algoritmus", command=self.run_kruskal)
         algorithms_menu.add_command(label="Primov algoritmus", command=self.run_prim)
+        algorithms_menu.add_command(label="Borůvkov algoritmus", command=self.run_boruvka)
         algorithms_menu.add_command(label="Kosarajuho algoritmus", command=self.run_kosaraju)
         algorithms_menu.add_command(label="Tarjanov algoritmus", command=self.run_tarjan)
+        algorithms_menu.add_command(label="Podrobne prepočítať úsek trasy SCC...", command=self.zoom_scc_segment)
+        algorithms_menu.add_command(label="Späť na hrubú trasu SCC", command=self.return_to_coarse_trace)
         menubar.add_cascade(label="Algoritmy", menu=algorithms_menu)
 
         view_menu = tk.Menu(menubar, tearoff=0)
         self.directed_var = tk.BooleanVar(value=False)
         view_menu.add_checkbutton(label="Orientovaný graf", variable=self.directed_var, command=self.toggle_directed)
+        view_menu.add_command(label="Pamäťový limit trasy...", command=self.set_trace_memory_budget)
+        view_menu.add_command(label="Limit trasy na disku...", command=self.set_trace_disk_budget)
+        self.tracemalloc_var = tk.BooleanVar(value=False)
+        view_menu.add_checkbutton(label="Merať pamäť trasy cez tracemalloc (pomalšie)", variable=self.tracemalloc_var)
+        self.early_exit_var = tk.BooleanVar(value=False)
+        view_menu.add_checkbutton(label="Dijkstra: skončiť po ustálení cieľa", variable=self.early_exit_var)
+        granularity_menu = tk.Menu(view_menu, tearoff=0)
+        self.trace_granularity = tk.StringVar(value="auto")
+        for value, label in TRACE_GRANULARITIES:
+            granularity_menu.add_radiobutton(label=label.capitalize(), variable=self.trace_granularity, value=value)
+        granularity_menu.add_separator()
+        granularity_menu.add_command(label="Rozpočet krokov...", command=self.set_trace_step_budget)
+        view_menu.add_cascade(label="Podrobnosť trasy SCC", menu=granularity_menu)
+        view_menu.add_separator()
+        self.heuristic_mode = tk.StringVar(value="euclid")
+        view_menu.add_radiobutton(label="Heuristika A*: euklidovská", variable=self.heuristic_mode, value="euclid")
+        view_menu.add_radiobutton(label="Heuristika A*: ALT (orientačné body)", variable=self.heuristic_mode, value="alt")
+        view_menu.add_command(label="Počet orientačných bodov ALT...", command=self.set_landmark_count)
+        view_menu.add_separator()
+        self.renderer_kind = tk.StringVar(value="tk")
+        view_menu.add_radiobutton(label="Vykresľovanie: Tk plátno", variable=self.renderer_kind, value="tk",
+                                  command=self.switch_renderer)
+        view_menu.add_radiobutton(label="Vykresľovanie: matplotlib", variable=self.renderer_kind, value="matplotlib",
+                                  command=self.switch_renderer)
+        self.condensation_var = tk.BooleanVar(value=False)
+        view_menu.add_checkbutton(label="SCC ako super-vrcholy (kondenzácia)", variable=self.condensation_var,
+                                  command=self.toggle_condensation)
         menubar.add_cascade(label="Režim", menu=view_menu)
 
         help_menu = tk.Menu(menubar, tearoff=0)
@@ -205,6 +584,7 @@ class GraphVisualizerApp:
         self.graph.clear()
         self.positions.clear()
         self.node_list.clear()
+        self.graph_changed()
         self.draw_graph()
         self.update_status("Nový graf vytvorený.")
 
@@ -212,15 +592,9 @@ class GraphVisualizerApp:
         file_path = filedialog.asksaveasfilename(defaultextension=".txt",
                                                  filetypes=[("Textové súbory", "*.txt"), ("Všetky súbory", "*.*")])
         if file_path:
+            from graph_io import write_matrix_file
             try:
-                adjacency_matrix = nx.adjacency_matrix(self.graph).todense()
-                with open(file_path, 'w') as file:
-                    for node in self.graph.nodes():
-                        pos = self.positions[node]
-                        file.write(f"{node} {pos[0]} {pos[1]}\n")
-                    file.write("MATRIX\n")
-                    for row in adjacency_matrix.tolist():
-                        file.write(" ".join(map(str, row)) + "\n")
+                write_matrix_file(file_path, self.graph, self.positions)
                 self.update_status(f"Graf uložený do {file_path}.")
             except Exception as e:
                 messagebox.showerror("Chyba", f"Uloženie grafu zlyhalo: {e}")
@@ -229,27 +603,73 @@ class GraphVisualizerApp:
         file_path = filedialog.askopenfilename(defaultextension=".txt",
                                                filetypes=[("Textové súbory", "*.txt"), ("Všetky súbory", "*.*")])
         if file_path:
+            from graph_io import read_matrix_file, fill_graph
             try:
-                with open(file_path, 'r') as file:
-                    lines = file.readlines()
-                    separator_index = lines.index("MATRIX\n")
-                    self.graph.clear()
-                    self.positions.clear()
-                    for line in lines[:separator_index]:
-                        node, x, y = line.strip().split()
-                        self.graph.add_node(int(node))
-                        self.positions[int(node)] = (float(x), float(y))
-                    adjacency_matrix = [list(map(float, line.strip().split())) for line in lines[separator_index + 1:]]
-                    nodes = list(self.graph.nodes())
-                    for i, row in enumerate(adjacency_matrix):
-                        for j, weight in enumerate(row):
-                            if weight != 0:
-                                self.graph.add_edge(nodes[i], nodes[j], weight=weight)
+                nodes, positions, matrix = read_matrix_file(file_path)
+                self.graph.clear()
+                self.positions.clear()
+                fill_graph(self.graph, nodes, matrix)
+                self.positions.update(positions)
+                self.graph_changed()
                 self.draw_graph()
                 self.update_status(f"Graf načítaný z {file_path}.")
             except Exception as e:
                 messagebox.showerror("Chyba", f"Načítanie grafu zlyhalo: {e}")
 
+    def import_graph(self):
+        file_path = filedialog.askopenfilename(filetypes=[
+            ("Podporované formáty", "*.gr *.txt *.edges *.el *.csv *.graphml *.xml"),
+            ("DIMACS", "*.gr"), ("SNAP zoznam hrán", "*.txt *.edges *.el"), ("CSV", "*.csv"),
+            ("GraphML", "*.graphml *.xml"), ("Všetky súbory", "*.*")])
+        if not file_path:
+            return
+        directed = None
+        extension = os.path.splitext(file_path)[1].lower()
+        if extension not in (".gr", ".graphml", ".xml"):
+            directed = messagebox.askyesno("Import grafu", "Je graf orientovaný?")
+        from importers import read_graph
+        progress = {'done': 0, 'total': 0, 'result': None, 'error': None, 'finished': False}
+
+        def report(done, total):
+            progress['done'], progress['total'] = done, total
+
+        def worker():
+            try:
+                with self.instrumentation.timer("import grafu"):
+                    imported = read_graph(file_path, report, directed)
+                    progress['result'] = (imported, imported.to_networkx())
+            except Exception as e:
+                progress['error'] = e
+            progress['finished'] = True
+
+        def poll():
+            if not progress['finished']:
+                if progress['total']:
+                    self.update_status(f"Import grafu: {100 * progress['done'] // progress['total']} %...")
+                self.master.after(200, poll)
+            elif progress['error'] is not None:
+                messagebox.showerror("Chyba", f"Import grafu zlyhal: {progress['error']}")
+                self.update_status("Import grafu zlyhal.")
+            else:
+                self.show_imported_graph(file_path, *progress['result'])
+
+        self.update_status("Import grafu...")
+        threading.Thread(target=worker, daemon=True).start()
+        poll()
+
+    def show_imported_graph(self, file_path, imported, graph):
+        positions = {}
+        xy = None
+        # Malé grafy bez súradníc dostanú pružinové rozloženie ako doteraz.
+        if imported.coords is not None or imported.n > 2000:
+            xy = imported.layout()
+            positions = PositionStore.from_array(imported.nodes, xy)
+        self.load_sample_graph(lambda: (graph, positions))
+        if xy is not None and imported.m == graph.number_of_edges():
+            # Polia sa postavia priamo z importu, bez opätovného prechodu grafom.
+            self.graph_cache['arrays'] = imported.to_arrays(coords=xy)
+        self.update_status(f"Graf importovaný z {file_path}: {imported.n} vrcholov, {graph.number_of_edges()} hrán.")
+
     def show_about(self):
         about_message = (
             "Interaktívna vizualizácia grafových algoritmov\n"
@@ -275,8 +695,226 @@ class GraphVisualizerApp:
         self.edge_start_node = None
         self.add_node_mode = False
         self.add_edge_mode = False
+        self.graph_changed()
         self.draw_graph()
 
+    def set_trace_memory_budget(self):
+        budget = simpledialog.askinteger("Pamäťový limit trasy",
+                                         "Po prekročení limitu (MB) sa kroky algoritmu presúvajú na disk:",
+                                         minvalue=1, initialvalue=self.trace_memory_budget_mb)
+        if budget is not None:
+            self.trace_memory_budget_mb = budget
+            self.update_status(f"Pamäťový limit trasy nastavený na {budget} MB.")
+
+    def set_trace_disk_budget(self):
+        budget = simpledialog.askinteger("Limit trasy na disku",
+                                         "Po dosiahnutí limitu (MB) sa záznam trasy zastaví, algoritmus dobehne:",
+                                         minvalue=1, initialvalue=self.trace_disk_budget_mb)
+        if budget is not None:
+            self.trace_disk_budget_mb = budget
+            self.update_status(f"Limit trasy na disku nastavený na {budget} MB.")
+
+    def set_trace_step_budget(self):
+        budget = simpledialog.askinteger("Rozpočet krokov trasy",
+                                         "Pri automatickej podrobnosti sa zvolí hrubšia trasa, ak by mala viac krokov:",
+                                         minvalue=100, initialvalue=self.trace_step_budget)
+        if budget is not None:
+            self.trace_step_budget = budget
+            self.update_status(f"Rozpočet krokov trasy SCC nastavený na {budget}.")
+
+    def set_landmark_count(self):
+        count = simpledialog.askinteger("Orientačné body ALT", "Zadajte počet orientačných bodov:",
+                                        minvalue=1, maxvalue=64, initialvalue=self.landmark_count)
+        if count is not None:
+            self.landmark_count = count
+            self.update_status(f"ALT bude používať {count} orientačných bodov.")
+
+    def graph_changed(self):
+        self.graph_version += 1
+        self.graph_cache.clear()
+        self.distance_source = None
+        self.selected_nodes = {node for node in self.selected_nodes if node in self.graph}
+        self.scc_components = None
+        self.condensation = None
+        self.scc_trace = None
+        self.discard_coarse_trace()
+        if self.renderer is not None:
+            self.renderer.invalidate()
+
+    def get_graph_arrays(self):
+        arrays = self.graph_cache.get('arrays')
+        if arrays is None:
+            from graph_arrays import GraphArrays
+            arrays = GraphArrays.from_networkx(self.graph, self.positions)
+            self.graph_cache['arrays'] = arrays
+        return arrays
+
+    def get_heuristic(self):
+        from heuristics import EuclideanHeuristic, LandmarkHeuristic
+        arrays = self.get_graph_arrays()
+        if self.heuristic_mode.get() != "alt":
+            return EuclideanHeuristic(arrays)
+        key = ('alt', self.landmark_count)
+        if key not in self.graph_cache:
+            self.update_status("Predpočítavam vzdialenosti z orientačných bodov ALT...")
+            self.master.update_idletasks()
+            self.graph_cache[key] = LandmarkHeuristic(arrays, self.landmark_count)
+        return self.graph_cache[key]
+
+    def run_all_pairs(self):
+        if not self.graph.nodes:
+            messagebox.showwarning("Upozornenie", "Graf neobsahuje žiadne vrcholy.")
+            return
+        from all_pairs import all_pairs_shortest_paths
+        arrays = self.get_graph_arrays()
+        version = self.graph_version
+        result = {'value': None, 'error': None, 'finished': False}
+
+        def worker():
+            try:
+                with self.instrumentation.timer("všetky najkratšie cesty"):
+                    result['value'] = all_pairs_shortest_paths(arrays)
+            except Exception as e:
+                result['error'] = e
+            result['finished'] = True
+
+        def poll():
+            if not result['finished']:
+                self.master.after(100, poll)
+            elif result['error'] is not None:
+                messagebox.showerror("Chyba", f"Výpočet vzdialeností zlyhal: {result['error']}")
+                self.update_status("Výpočet vzdialeností zlyhal.")
+            elif version != self.graph_version:
+                self.update_status("Graf sa počas výpočtu zmenil, matica vzdialeností bola zahodená.")
+            else:
+                self.graph_cache['all_pairs'] = result['value']
+                self.refresh_instrumentation_panel()
+                self.update_status(f"Matica vzdialeností pripravená ({result['value'].method}). "
+                                   "Kliknite na vrchol a prejdite myšou nad iný vrchol.")
+
+        self.update_status("Počítam vzdialenosti medzi všetkými dvojicami vrcholov...")
+        threading.Thread(target=worker, daemon=True).start()
+        poll()
+
+    def query_pairs_dialog(self):
+        if not self.graph.nodes:
+            messagebox.showwarning("Upozornenie", "Graf neobsahuje žiadne vrcholy.")
+            return
+        dialog = tk.Toplevel(self.master)
+        dialog.title("Dávka dotazov najkratších ciest")
+        dialog.geometry("420x400")
+        ttk.Label(dialog, text="Jedna dvojica na riadok: zdroj cieľ (oddelené medzerou, čiarkou alebo bodkočiarkou)",
+                  wraplength=400).pack(anchor=tk.W, padx=10, pady=(10, 5))
+        text = tk.Text(dialog, wrap=tk.NONE, height=15)
+        text.pack(fill=tk.BOTH, expand=True, padx=10)
+
+        def load_file():
+            from batch import read_pairs
+            file_path = filedialog.askopenfilename(parent=dialog, filetypes=[("CSV súbory", "*.csv"), ("Všetky súbory", "*.*")])
+            if file_path:
+                text.delete("1.0", tk.END)
+                text.insert(tk.END, "".join(f"{source} {target}\n" for source, target in read_pairs(file_path)))
+
+        def confirm():
+            pairs = []
+            for line in text.get("1.0", tk.END).splitlines():
+                tokens = line.replace(",", " ").replace(";", " ").split()
+                if len(tokens) >= 2 and not tokens[0].startswith("#"):
+                    pairs.append((self.parse_node(tokens[0]), self.parse_node(tokens[1])))
+            if not pairs:
+                messagebox.showwarning("Upozornenie", "Nezadali ste žiadne dvojice vrcholov.", parent=dialog)
+                return
+            dialog.destroy()
+            self.run_multi_query(pairs)
+
+        buttons = ttk.Frame(dialog)
+        buttons.pack(pady=10)
+        ttk.Button(buttons, text="Načítať CSV...", command=load_file).pack(side=tk.LEFT, padx=5)
+        ttk.Button(buttons, text="Spustiť", command=confirm).pack(side=tk.LEFT, padx=5)
+
+    def run_multi_query(self, pairs):
+        from multi_query import multi_query
+        arrays = self.get_graph_arrays()
+        version = self.graph_version
+        result = {'value': None, 'error': None, 'finished': False, 'elapsed': 0.0}
+
+        def worker():
+            started = time.perf_counter()
+            try:
+                with self.instrumentation.timer("dávka dotazov"):
+                    result['value'] = multi_query(arrays, pairs)
+            except Exception as e:
+                result['error'] = e
+            result['elapsed'] = time.perf_counter() - started
+            result['finished'] = True
+
+        def poll():
+            if not result['finished']:
+                self.master.after(100, poll)
+            elif result['error'] is not None:
+                messagebox.showerror("Chyba", f"Dávka dotazov zlyhala: {result['error']}")
+                self.update_status("Dávka dotazov zlyhala.")
+            elif version != self.graph_version:
+                self.update_status("Graf sa počas výpočtu zmenil, výsledky dotazov boli zahodené.")
+            else:
+                self.refresh_instrumentation_panel()
+                sources = len({source for source, _ in pairs})
+                self.update_status(f"{len(pairs)} dotazov z {sources} zdrojov za {result['elapsed']:.2f} s.")
+                self.show_query_results(pairs, result['value'])
+
+        self.update_status(f"Počítam najkratšie cesty pre {len(pairs)} dvojíc vrcholov...")
+        threading.Thread(target=worker, daemon=True).start()
+        poll()
+
+    def show_query_results(self, pairs, results):
+        window = tk.Toplevel(self.master)
+        window.title("Výsledky dotazov")
+        window.geometry("600x420")
+        rows = list(zip(pairs, results))
+
+        def format_row(row):
+            (source, target), (distance, path) = row
+            if math.isinf(distance):
+                return f"{source} → {target}: nedosiahnuteľný"
+            return f"{source} → {target}: {distance:g} ({len(path) - 1} hrán)"
+
+        view = VirtualListView(window, height=15, width=70)
+        view.pack(fill=tk.BOTH, expand=True, padx=10, pady=(10, 0))
+        view.set_items(rows, format_row)
+
+        def save():
+            file_path = filedialog.asksaveasfilename(parent=window, defaultextension=".csv",
+                                                     filetypes=[("CSV súbory", "*.csv"), ("Všetky súbory", "*.*")])
+            if not file_path:
+                return
+            import csv
+            with open(file_path, "w", newline="", encoding="utf-8") as file:
+                writer = csv.writer(file)
+                writer.writerow(["zdroj", "cieľ", "vzdialenosť", "cesta"])
+                for (source, target), (distance, path) in rows:
+                    writer.writerow([source, target, "" if math.isinf(distance) else distance, " ".join(map(str, path))])
+            self.update_status(f"Výsledky dotazov uložené do {file_path}.")
+
+        ttk.Button(window, text="Uložiť výsledky...", command=save).pack(pady=10)
+
+    def find_node_at(self, x, y, threshold=0.3):
+        # Mriežku vrcholov si drží vykresľovač; kým ju pre aktuálny graf nepostaví, prehľadajú sa všetky pozície.
+        index = getattr(self.renderer, 'index', None)
+        if index is None or self.renderer.graph is not self.graph:
+            return self.positions.nearest(x, y, threshold)
+        return index.nearest(x, y, threshold)
+
+    def hover_text(self, node):
+        text = f"vrchol: {node}"
+        all_pairs = self.graph_cache.get('all_pairs')
+        if all_pairs is None or self.distance_source is None or node == self.distance_source:
+            return text
+        distance = all_pairs.distance(self.distance_source, node)
+        if math.isinf(distance):
+            return text + f"\nz {self.distance_source}: nedosiahnuteľný"
+        hops = len(all_pairs.path(self.distance_source, node)) - 1
+        return text + f"\nd({self.distance_source}, {node}) = {distance:g} ({hops} hrán)"
+
     def add_node_mode_on(self):
         self.add_node_mode = True
         self.master.config(cursor="crosshair")
@@ -291,110 +929,69 @@ class GraphVisualizerApp:
         self.master.config(cursor="tcross")
         self.update_status("Najprv vyberte zdrojový vrchol, potom cieľový vrchol.")
 
-    
-    def on_canvas_click(self, event):
-        if event.xdata is None or event.ydata is None:
-            return
+    def on_canvas_click(self, x, y):
         if self.add_node_mode:
-            if not self.graph.nodes:
-                self.node_id = 1 
-            else:
-                self.node_id = max(self.graph.nodes) + 1  
-
-            self.graph.add_node(self.node_id)
-            self.positions[self.node_id] = (event.xdata, event.ydata)
-
-            self.draw_graph()
+            node = self.add_node(x, y)
 
             self.add_node_mode = False
             self.master.config(cursor="")
 
-            self.update_status(f"vrchol {self.node_id} pridaný.")
-
-
-    def on_pick(self, event):
-        if self.add_edge_mode:
-            if event.mouseevent.xdata is None or event.mouseevent.ydata is None:
-                return
-
-            min_dist = float("inf")
-            selected_node = None
-            threshold = 0.3  
-
-            for node, pos in self.positions.items():
-                dx = pos[0] - event.mouseevent.xdata
-                dy = pos[1] - event.mouseevent.ydata
-                dist = math.hypot(dx, dy)
-
-                if dist < min_dist and dist < threshold:
-                    min_dist = dist
-                    selected_node = node
-
-            if selected_node is None:
-                return
+            self.update_status(f"vrchol {node} pridaný.")
+        elif self.add_edge_mode:
+            self.select_edge_node(x, y)
+        elif self.condensation is not None:
+            item = self.condensation.find(x, y)
+            if item is not None:
+                i, expanded = self.condensation.toggle(item)
+                self.draw_condensation()
+                state = "rozbalená" if expanded else "zbalená"
+                self.update_status(f"SCC {i + 1} ({self.condensation.sizes[i]} vrcholov) {state}.")
+        elif self.select_mode_var.get():
+            node = self.find_node_at(x, y)
+            if node is not None:
+                self.set_selection(self.selected_nodes ^ {node})
+        elif 'all_pairs' in self.graph_cache:
+            node = self.find_node_at(x, y)
+            if node is not None:
+                self.distance_source = node
+                self.update_status(f"Vrchol {node} vybraný, vzdialenosti sa zobrazia pri prechode myšou.")
+
+    def select_edge_node(self, x, y):
+        selected_node = self.find_node_at(x, y)
+        if selected_node is None:
+            return
 
-            if self.edge_start_node is None:
-                self.edge_start_node = selected_node
-                self.update_status(f"Zdrojový vrchol {selected_node} vybraný. Teraz vyberte cieľový vrchol.")
+        if self.edge_start_node is None:
+            self.edge_start_node = selected_node
+            self.update_status(f"Zdrojový vrchol {selected_node} vybraný. Teraz vyberte cieľový vrchol.")
+        else:
+            if selected_node != self.edge_start_node:
+                weight = simpledialog.askfloat("Hodnota hrany", "Zadajte hodnotu hrany:")
+                if weight is None:
+                    weight = 1.0
+            
+                self.add_edge(self.edge_start_node, selected_node, weight)
+
+                self.update_status(f"Hrana medzi vrcholami {self.edge_start_node} a {selected_node} pridaná.")
             else:
-                if selected_node != self.edge_start_node:
-                    weight = simpledialog.askfloat("Hodnota hrany", "Zadajte hodnotu hrany:")
-                    if weight is None:
-                        weight = 1.0
-                
-                    self.graph.add_edge(self.edge_start_node, selected_node, weight=weight)
-
-                    self.update_status(f"Hrana medzi vrcholami {self.edge_start_node} a {selected_node} pridaná.")
-                    self.draw_graph()
-                else:
-                    messagebox.showwarning("Upozornenie", "Nemôžete vytvoriť hranu zo samotného seba.")
+                messagebox.showwarning("Upozornenie", "Nemôžete vytvoriť hranu zo samotného seba.")
 
-                self.edge_start_node = None
-                self.add_edge_mode = False
-                self.master.config(cursor="")
+            self.edge_start_node = None
+            self.add_edge_mode = False
+            self.master.config(cursor="")
 
 
     def draw_graph(self, path=[]):
         if not self.positions or any(node not in self.positions for node in self.graph.nodes()):
-            self.positions = nx.spring_layout(self.graph)
-        self.ax.clear()
-        self.ax.set_axis_on()
-        self.ax.grid(True)
-        self.ax.set_aspect('equal')
-        self.ax.set_xlim(self.fixed_limits[0], self.fixed_limits[1])
-        self.ax.set_ylim(self.fixed_limits[2], self.fixed_limits[3])
-        if len(self.graph.nodes) > 0:
-            self.node_list = list(self.graph.nodes())
-            nodes = nx.draw_networkx_nodes(
-                self.graph,
-                self.positions,
-                nodelist=self.node_list,
-                ax=self.ax,
-                node_color='skyblue',
-                node_size=500
-            )
-            nodes.set_picker(5)
-            if self.is_directed:
-                nx.draw_networkx_edges(
-                    self.graph,
-                    self.positions,
-                    ax=self.ax,
-                    arrows=True,
-                    arrowstyle='-|>',
-                    arrowsize=12,
-                    connectionstyle='arc3,rad=0.1'
-                )
-            else:
-                nx.draw_networkx_edges(
-                    self.graph,
-                    self.positions,
-                    ax=self.ax,
-                )
-            nx.draw_networkx_labels(self.graph, self.positions, ax=self.ax)
-            if self.show_weights:
-                edge_labels = nx.get_edge_attributes(self.graph, 'weight')
-                nx.draw_networkx_edge_labels(self.graph, self.positions, edge_labels=edge_labels, ax=self.ax)
-        self.canvas.draw()
+            self.positions = PositionStore(nx.spring_layout(self.graph))
+            self.graph_changed()
+        self.node_list = list(self.graph.nodes())
+        self.condensation = None
+        with self.instrumentation.timer("draw_graph"):
+            self.renderer.draw_graph(self.graph, self.positions, self.show_weights, self.is_directed)
+            if self.selected_nodes:
+                self.renderer.set_selection(self.graph, self.positions, self.selected_nodes)
+        self.redraw_canvas()
 
     def check_weights(self):
         for u, v, data in self.graph.edges(data=True):
@@ -406,41 +1003,20 @@ class GraphVisualizerApp:
                 return False
         return True
 
-    def animate_transition(self, old_step, new_step, frames=10, delay=50):
+    def animate_transition(self, old_step, new_step, frames=10, delay=50, index=None):
+        if index is not None and self.renderer.has_frame((self.trace_version, index), self.show_weights):
+            # Krok už je vykreslený, prechod sa preskočí a obrázok sa iba zobrazí.
+            self.draw_graph_with_step(new_step, index)
+            return
+
         def update_frame(frame):
-            frac = frame / frames
-            self.ax.clear()
-            self.ax.set_axis_on()
-            self.ax.grid(True)
-            nx.draw_networkx_nodes(self.graph, self.positions, ax=self.ax, node_color='skyblue', node_size=500)
-            nx.draw_networkx_edges(self.graph, self.positions, ax=self.ax, edge_color='black', width=1)
-            nx.draw_networkx_labels(self.graph, self.positions, ax=self.ax)
-            updated_edges = new_step.get('updated_edges', [])
-            if updated_edges:
-                width = 1 + 3 * frac
-                nx.draw_networkx_edges(
-                    self.graph, self.positions,
-                    ax=self.ax,
-                    edgelist=updated_edges,
-                    edge_color='green',
-                    width=width
-                )
-            no_update_edges = new_step.get('no_update_edges', [])
-            if no_update_edges:
-                width = 1 + 3 * frac
-                nx.draw_networkx_edges(
-                    self.graph, self.positions,
-                    ax=self.ax,
-                    edgelist=no_update_edges,
-                    edge_color='red',
-                    width=width,
-                    style='dashed'
-                )
-            self.canvas.draw()
+            with self.instrumentation.timer("animate_transition"):
+                self.renderer.draw_transition(self.graph, self.positions, new_step, frame / frames)
+                self.redraw_canvas()
             if frame < frames:
                 self.master.after(delay, lambda: update_frame(frame + 1))
             else:
-                self.draw_graph_with_step(new_step)
+                self.draw_graph_with_step(new_step, index)
         update_frame(0)
 
     def next_step(self):
@@ -448,7 +1024,8 @@ class GraphVisualizerApp:
             old_step = self.algorithm_steps[self.current_step_index] if self.current_step_index >= 0 else {}
             self.current_step_index += 1
             new_step = self.algorithm_steps[self.current_step_index]
-            self.animate_transition(old_step, new_step)
+            self.prefetch_steps(1)
+            self.animate_transition(old_step, new_step, index=self.current_step_index)
             self.update_status(f"Krok {self.current_step_index + 1} z {len(self.algorithm_steps)}")
             self.prev_step_button.config(state=tk.NORMAL)
             if self.current_step_index + 1 == len(self.algorithm_steps):
@@ -461,7 +1038,8 @@ class GraphVisualizerApp:
             old_step = self.algorithm_steps[self.current_step_index]
             self.current_step_index -= 1
             new_step = self.algorithm_steps[self.current_step_index]
-            self.animate_transition(old_step, new_step)
+            self.prefetch_steps(-1)
+            self.animate_transition(old_step, new_step, index=self.current_step_index)
             self.update_status(f"Krok {self.current_step_index + 1} z {len(self.algorithm_steps)}")
             self.next_step_button.config(state=tk.NORMAL)
             if self.current_step_index == 0:
@@ -469,97 +1047,54 @@ class GraphVisualizerApp:
         else:
             self.update_status("Na začiatku krokov.")
 
-    def draw_graph_with_step(self, step):
-        self.ax.clear()
-        self.ax.set_axis_on()
-        self.ax.grid(True)
-        
-        nx.draw_networkx_nodes(self.graph, self.positions, ax=self.ax, node_color='skyblue', node_size=500)
-        
-        
-        if 'edges' in step and step['edges']:
-            nx.draw_networkx_edges(
-                self.graph, self.positions, ax=self.ax,
-                edgelist=step['edges'], edge_color='green', width=2
-            )
-        else:
-            nx.draw_networkx_edges(self.graph, self.positions, ax=self.ax, edge_color='black', width=1)
-            updated_edges = step.get('updated_edges', [])
-            no_update_edges = step.get('no_update_edges', [])
-            if updated_edges:
-                nx.draw_networkx_edges(
-                    self.graph, self.positions, ax=self.ax,
-                    edgelist=updated_edges, edge_color='green', width=2
-                )
-            if no_update_edges:
-                nx.draw_networkx_edges(
-                    self.graph, self.positions, ax=self.ax,
-                    edgelist=no_update_edges, edge_color='red', width=2, style='dashed'
-                )
-        
-        highlight = step.get('highlight', [])
-        if highlight:
-            nx.draw_networkx_nodes(
-                self.graph, self.positions, nodelist=highlight, ax=self.ax,
-                node_color='yellow', node_size=500
-            )
-        
-        nx.draw_networkx_labels(self.graph, self.positions, ax=self.ax)
-        
-        if self.show_weights:
-            edge_labels = nx.get_edge_attributes(self.graph, 'weight')
-            nx.draw_networkx_edge_labels(self.graph, self.positions, edge_labels=edge_labels, ax=self.ax)
-        
-        import matplotlib.lines as mlines
-        handles = []
-        if step.get('updated_edges', []):
-            green_line = mlines.Line2D([], [], color='green', linewidth=2, label='Aktualizácia (Update)')
-            handles.append(green_line)
-        if step.get('no_update_edges', []):
-            red_line = mlines.Line2D([], [], color='red', linewidth=2, linestyle='dashed', label='Bez aktualizácie')
-            handles.append(red_line)
-        if handles:
-            self.ax.legend(handles=handles, loc='upper right')
-        
-        structure_type = step.get('structure_type', "")
-        self.update_stack_display(step.get('stack', []), structure_type)
-        self.update_details_display(step.get('details', []))
-        
-        self.canvas.draw()
-
+    def prefetch_steps(self, direction):
+        if isinstance(self.algorithm_steps, LazyTrace):
+            self.algorithm_steps.prefetch(self.current_step_index, direction)
 
-    def update_stack_display(self, stack, structure_type=""):
-        self.stack_listbox.delete(0, tk.END)
-        if structure_type:
-            self.stack_listbox.insert(tk.END, f"{structure_type}:")
-            self.stack_listbox.insert(tk.END, "-" * 20)
-        for item in stack:
-            if isinstance(item, tuple):
-                if len(item) == 3:
-                    self.stack_listbox.insert(tk.END, f"Hrana: Vrchol: {item[1]}->{item[2]}-> Ohodnotenie: {item[0]}")
-                elif len(item) == 2:
-                    self.stack_listbox.insert(tk.END, f"vrchol: {item[1]}, Vzdialenosť: {item[0]}")
-                elif len(item) == 3:
-                    self.stack_listbox.insert(tk.END, f"{item[2]} ← {item[1]} (vzdialenosť: {item[0]})")
+    def draw_graph_with_step(self, step, index=None):
+        step = resolve_step(step, getattr(self.algorithm_steps, 'shared', {}))
+        self.condensation = None
+        frame_key = None if index is None else (self.trace_version, index)
+        with self.instrumentation.timer("draw_graph_with_step"):
+            self.renderer.draw_step(self.graph, self.positions, step, self.show_weights, frame_key)
 
-                else:
-                    self.stack_listbox.insert(tk.END, str(item))
-            else:
-                self.stack_listbox.insert(tk.END, str(item))
+            structure_type = step.get('structure_type', "")
+            self.update_stack_display(step.get('stack', []), structure_type)
+            self.update_details_display(step.get('details', []), self.current_step_index)
+        
+            self.redraw_canvas()
+        if index is not None:
+            self.prerender_steps(index)
+
+    def prerender_steps(self, index):
+        steps = self.algorithm_steps
+        shared = getattr(steps, 'shared', {})
+        nearby = [i for i in range(index - PRERENDER_STEPS, index + PRERENDER_STEPS + 1)
+                  if 0 <= i < len(steps) and i != index]
+        nearby.sort(key=lambda i: abs(i - index))
+        self.renderer.prerender(self.graph, self.positions, self.show_weights,
+                                [(self.trace_version, i) for i in nearby],
+                                lambda key: resolve_step(steps[key[1]], shared))
 
-    def update_details_display(self, details):
+    def update_stack_display(self, stack, structure_type=""):
+        header = [f"{structure_type}:", "-" * 20] if structure_type else []
+        self.stack_view.set_items(stack, format_stack_item, header)
+
+    def update_details_display(self, details, step_index=None):
+        text = self.details_cache.get(step_index)
+        if text is None:
+            text = "".join(line + "\n" for line in format_details(details))
+            if step_index is not None:
+                self.details_cache[step_index] = text
         self.details_text.config(state=tk.NORMAL)
         self.details_text.delete("1.0", tk.END)
-        for line in details:
-            self.details_text.insert(tk.END, line + "\n")
+        self.details_text.insert(tk.END, text)
         self.details_text.config(state=tk.DISABLED)
 
     def delete_node(self):
         node_id = simpledialog.askinteger("Zmazať vrchol", "Zadajte ID vrchola na zmazanie:")
         if node_id in self.graph.nodes:
-            self.graph.remove_node(node_id)
-            self.positions.pop(node_id, None)
-            self.draw_graph()
+            self.remove_nodes([node_id])
             self.update_status(f"vrchol {node_id} zmazaný.")
         else:
             messagebox.showerror("Chyba", "vrchol s týmto ID neexistuje.")
@@ -571,33 +1106,233 @@ class GraphVisualizerApp:
                 source, target = map(int, edge.split(','))
                 if self.graph.has_edge(source, target):
                     self.graph.remove_edge(source, target)
-                    self.draw_graph()
+                    self.edited()
                     self.update_status(f"Hrana {source}->{target} zmazaná.")
                 else:
                     messagebox.showerror("Chyba", "Hrana neexistuje.")
             except ValueError:
                 messagebox.showerror("Chyba", "Nesprávny formát.")
 
+    def batch_edit(self):
+        # Použitie aj z konzoly: with app.batch_edit(): app.add_node(...); app.add_edge(...)
+        return BatchEdit(self)
+
+    def edited(self):
+        if self.batch_depth:
+            self.batch_dirty = True
+        else:
+            self.commit_edits()
+
+    def commit_edits(self):
+        self.graph_changed()
+        self.draw_graph()
+
+    def next_node_id(self):
+        # Kým posledný pridaný vrchol existuje, ďalšie ID sa nájde bez prechodu celým grafom.
+        if self.node_id not in self.graph:
+            numeric = [node for node in self.graph.nodes if isinstance(node, int)]
+            self.node_id = max(numeric, default=0)
+        node = self.node_id + 1
+        while node in self.graph:
+            node += 1
+        return node
+
+    def add_node(self, x, y, node=None):
+        if node is None:
+            node = self.next_node_id()
+        if isinstance(node, int):
+            self.node_id = max(self.node_id, node)
+        self.graph.add_node(node)
+        self.positions[node] = (x, y)
+        self.edited()
+        return node
+
+    def add_edge(self, source, target, weight=1.0):
+        for node in (source, target):
+            if node not in self.positions:
+                self.add_node(0.0, 0.0, node)
+        self.graph.add_edge(source, target, weight=weight)
+        self.edited()
+
+    def remove_nodes(self, nodes):
+        nodes = [node for node in nodes if node in self.graph]
+        self.graph.remove_nodes_from(nodes)
+        for node in nodes:
+            self.positions.pop(node, None)
+        self.edited()
+        return len(nodes)
+
+    def parse_node(self, token):
+        try:
+            return int(token)
+        except ValueError:
+            return token
+
+    def paste_edge_list(self):
+        dialog = tk.Toplevel(self.master)
+        dialog.title("Vložiť zoznam hrán")
+        dialog.geometry("420x360")
+        ttk.Label(dialog, text="Jedna hrana na riadok: zdroj cieľ [váha] (oddelené medzerou, čiarkou alebo bodkočiarkou)",
+                  wraplength=400).pack(anchor=tk.W, padx=10, pady=(10, 5))
+        text = tk.Text(dialog, wrap=tk.NONE, height=15)
+        text.pack(fill=tk.BOTH, expand=True, padx=10)
+        try:
+            text.insert(tk.END, self.master.clipboard_get())
+        except tk.TclError:
+            pass
+
+        def confirm():
+            content = text.get("1.0", tk.END)
+            dialog.destroy()
+            self.add_edge_list(content)
+
+        ttk.Button(dialog, text="Pridať hrany", command=confirm).pack(pady=10)
+
+    def add_edge_list(self, content):
+        edges = []
+        invalid = 0
+        for line in content.splitlines():
+            tokens = line.replace(",", " ").replace(";", " ").split()
+            if not tokens or tokens[0].startswith("#"):
+                continue
+            try:
+                weight = float(tokens[2]) if len(tokens) > 2 else 1.0
+            except ValueError:
+                weight = None
+            if len(tokens) < 2 or weight is None:
+                invalid += 1
+                continue
+            edges.append((self.parse_node(tokens[0]), self.parse_node(tokens[1]), weight))
+        new_nodes = list(dict.fromkeys(node for u, v, w in edges for node in (u, v) if node not in self.positions))
+        with self.batch_edit():
+            # Nové vrcholy bez súradníc sa rozmiestnia po kružnici, existujúce ostanú na mieste.
+            for i, node in enumerate(new_nodes):
+                angle = 2 * math.pi * i / len(new_nodes)
+                self.add_node(9 * math.cos(angle), 9 * math.sin(angle), node)
+            for u, v, weight in edges:
+                if u != v:
+                    self.add_edge(u, v, weight)
+        message = f"Pridaných {len(edges)} hrán a {len(new_nodes)} vrcholov."
+        if invalid:
+            message += f" Neplatných riadkov: {invalid}."
+        self.update_status(message)
+
+    def add_node_grid(self):
+        size = simpledialog.askstring("Mriežka vrcholov", "Zadajte rozmer mriežky (riadky x stĺpce):", initialvalue="10x10")
+        if not size:
+            return
+        try:
+            rows, cols = (int(value) for value in size.lower().replace("*", "x").split("x"))
+            if rows < 1 or cols < 1:
+                raise ValueError
+        except ValueError:
+            messagebox.showerror("Chyba", "Rozmer zadajte v tvare 'riadky x stĺpce', napr. 10x20.")
+            return
+        connect = messagebox.askyesno("Mriežka vrcholov", "Spojiť susedné vrcholy hranami?")
+        step = 19 / max(rows, cols, 2)
+        grid = {}
+        with self.batch_edit():
+            for r in range(rows):
+                for c in range(cols):
+                    x = (c - (cols - 1) / 2) * step
+                    y = ((rows - 1) / 2 - r) * step
+                    grid[r, c] = self.add_node(x, y)
+            if connect:
+                for (r, c), node in grid.items():
+                    if c + 1 < cols:
+                        self.add_edge(node, grid[r, c + 1], round(step, 3))
+                    if r + 1 < rows:
+                        self.add_edge(node, grid[r + 1, c], round(step, 3))
+        self.update_status(f"Pridaná mriežka {rows}x{cols} ({rows * cols} vrcholov).")
+
+    def toggle_select_mode(self):
+        if self.select_mode_var.get():
+            self.add_node_mode = False
+            self.add_edge_mode = False
+            self.update_status("Kliknutím na vrchol ho pridáte do výberu alebo z neho odoberiete.")
+        else:
+            self.update_status(f"Vybraných vrcholov: {len(self.selected_nodes)}.")
+
+    def set_selection(self, nodes):
+        self.selected_nodes = set(nodes)
+        self.renderer.set_selection(self.graph, self.positions, self.selected_nodes)
+        self.redraw_canvas()
+        self.update_status(f"Vybraných vrcholov: {len(self.selected_nodes)}.")
+
+    def select_nodes_by_id(self):
+        text = simpledialog.askstring("Vybrať vrcholy", "Zadajte ID alebo rozsahy, napr. 1-10, 15, 20-25:")
+        if not text:
+            return
+        nodes = set()
+        try:
+            for part in text.replace(";", ",").split(","):
+                part = part.strip()
+                if "-" in part.strip("-"):
+                    start, end = (int(value) for value in part.split("-", 1))
+                    nodes.update(range(start, end + 1))
+                elif part:
+                    nodes.add(self.parse_node(part))
+        except ValueError:
+            messagebox.showerror("Chyba", "Nesprávny formát výberu.")
+            return
+        self.set_selection(self.selected_nodes | {node for node in nodes if node in self.graph})
+
+    def remove_selection(self):
+        if not self.selected_nodes:
+            messagebox.showwarning("Upozornenie", "Nie sú vybrané žiadne vrcholy.")
+            return
+        removed = self.remove_nodes(self.selected_nodes)
+        self.selected_nodes = set()
+        self.update_status(f"Odstránených {removed} vrcholov.")
+
     def display_pseudocode(self, pseudocode):
+        self.current_pseudocode = pseudocode
         self.pseudocode_area.config(state=tk.NORMAL)
         self.pseudocode_area.delete("1.0", tk.END)
         self.pseudocode_area.insert(tk.END, pseudocode)
         self.pseudocode_area.config(state=tk.DISABLED)
 
     def load_sample_graph(self, graph_func):
-        self.graph, self.positions = graph_func()
-        if not self.positions:
-            self.positions = nx.spring_layout(self.graph)
+        self.graph, positions = graph_func()
+        self.selected_nodes = set()
+        if not positions:
+            positions = nx.spring_layout(self.graph)
+        self.positions = positions if isinstance(positions, PositionStore) else PositionStore(positions)
+        self.is_directed = self.graph.is_directed()
+        self.directed_var.set(self.is_directed)
+        self.graph_changed()
         self.draw_graph()
 
+    def ask_graph_size(self, title):
+        return simpledialog.askinteger(title, "Zadajte počet vrcholov:", minvalue=2, initialvalue=100)
+
+    def load_generated_graph(self, generator, title, **kwargs):
+        n = self.ask_graph_size(title)
+        if n is None:
+            return
+        self.update_status(f"Generujem graf s {n} vrcholmi...")
+        self.master.update()
+        self.load_sample_graph(lambda: generator(n, **kwargs))
+        self.update_status(f"{title}: {self.graph.number_of_nodes()} vrcholov, {self.graph.number_of_edges()} hrán.")
+
+    def load_generated_scc_dag(self):
+        title = "Orientovaný graf so SCC"
+        n = self.ask_graph_size(title)
+        if n is None:
+            return
+        num_sccs = simpledialog.askinteger(title, "Zadajte počet silne súvislých komponentov:",
+                                           minvalue=1, maxvalue=n, initialvalue=max(1, int(math.sqrt(n))))
+        if num_sccs is None:
+            return
+        self.update_status(f"Generujem graf s {n} vrcholmi...")
+        self.master.update()
+        self.load_sample_graph(lambda: show_grafy.generate_scc_dag(n, num_sccs))
+        self.update_status(f"{title}: {self.graph.number_of_nodes()} vrcholov, {self.graph.number_of_edges()} hrán.")
+
     # ----------------------- Implementácie algoritmov -----------------------
 
     def contains_negative_edge(self):
-        for u, v, data in self.graph.edges(data=True):
-            weight = data.get('weight', 1)
-            if weight < 0:
-                return True
-        return False
+        return algorithms.contains_negative_edge(self.graph)
 
     def run_dijkstra(self):
         self.clear_step_visualization()
@@ -640,70 +1375,74 @@ class GraphVisualizerApp:
             return
 
         self.draw_graph()
-        self.algorithm_steps = []
+        self.begin_trace()
+        try:
+            algorithms.dijkstra(self.graph, self.algorithm_steps, self.instrumentation, source, target,
+                                self.early_exit_var.get())
+        except algorithms.NoPathError as e:
+            self.abort_trace()
+            messagebox.showerror("Chyba", str(e))
+            return
+        except Exception:
+            self.abort_trace()
+            raise
+        self.finish_trace("Dijkstrov algoritmus pripravený na vizualizáciu.")
 
-        distances = {node: float('inf') for node in self.graph.nodes}
-        distances[source] = 0
-        predecessors = {node: None for node in self.graph.nodes}
-        priority_queue = [(0, source, None)]  # (vzdialenosť, cieľ, predchodca)
-        visited = set()
+    def run_delta_stepping(self):
+        self.clear_step_visualization()
+        self.show_edges = True
 
-        while priority_queue:
-            priority_queue.sort(key=lambda x: x[0])
-            current_distance, current_node, from_node = priority_queue.pop(0)
+        if self.contains_negative_edge():
+            messagebox.showerror("Tento algoritmus nepracuje so zápornými hranami")
+            return
 
-            if current_node in visited:
-                continue
-            visited.add(current_node)
-
-            step_details = []
-            updated_edges = []
-            no_update_edges = []
-
-            step_details.append(f"Spracovávaný vrchol: {current_node} (vzdialenosť: {current_distance})")
-
-            for neighbor in self.graph.neighbors(current_node):
-                weight = self.graph[current_node][neighbor].get('weight', 1)
-                new_distance = current_distance + weight
-                step_details.append(f"Zvažovaná hrana ({current_node} → {neighbor}) s váhou {weight}")
-
-                if new_distance < distances[neighbor]:
-                    distances[neighbor] = new_distance
-                    predecessors[neighbor] = current_node
-                    priority_queue.append((new_distance, neighbor, current_node))
-                    step_details.append(f"Aktualizácia: vzdialenosť {neighbor} = {new_distance}")
-                    step_details.append(f"Predchodca {neighbor} = {current_node}")
-                    updated_edges.append((current_node, neighbor))
-                else:
-                    step_details.append(f"Bez zmeny pre {neighbor} (aktuálna vzdialenosť: {distances[neighbor]})")
-                    no_update_edges.append((current_node, neighbor))
-
-            self.algorithm_steps.append({
-                'updated_edges': updated_edges,
-                'no_update_edges': no_update_edges,
-                'stack': priority_queue.copy(),  # obsahuje aj predchodcov
-                'details': step_details,
-                'structure_type': "Prioritný front"
-            })
-
-        # Finálna cesta
-        try:
-            path = nx.dijkstra_path(self.graph, source=source, target=target, weight='weight')
-            path_edges = list(zip(path, path[1:]))
-            self.algorithm_steps.append({
-                'updated_edges': path_edges,
-                'no_update_edges': [],
-                'stack': [],
-                'details': ["Finálna najkratšia cesta zvýraznená."],
-                'structure_type': ""
-            })
-            self.current_step_index = -1
-            self.next_step_button.config(state=tk.NORMAL)
-            self.prev_step_button.config(state=tk.DISABLED)
-            self.update_status("Dijkstrov algoritmus pripravený na vizualizáciu.")
-        except nx.NetworkXNoPath:
-            messagebox.showerror("Chyba", "Medzi zadanými vrcholami neexistuje cesta.")
+        if not self.check_weights():
+            messagebox.showwarning("Upozornenie", "Nie všetky hrany majú nastavenú váhu. Váhy budú deaktivované pre tento algoritmus.")
+            self.show_weights = False
+        else:
+            self.show_weights = True
+
+        pseudocode = (
+            "DELTA-STEPPING(G, w, s, Δ)\n"
+            "1  pre každý vrchol v: v.vzdialenosť = ∞\n"
+            "2  s.vzdialenosť = 0, B[0] = {s}\n"
+            "3  kým existuje neprázdny kôš:\n"
+            "4      i = index najmenšieho neprázdneho koša\n"
+            "5      R = ∅\n"
+            "6      kým B[i] ≠ ∅:\n"
+            "7          R = R ∪ B[i], F = B[i], B[i] = ∅\n"
+            "8          relaxuj naraz ľahké hrany (w ≤ Δ) z F\n"
+            "9      relaxuj naraz ťažké hrany (w > Δ) z R\n"
+            "10 relaxácia v: ak d < v.vzdialenosť, presuň v do koša ⌊d / Δ⌋\n"
+        )
+        self.display_pseudocode(pseudocode)
+
+        source = simpledialog.askinteger("Delta-stepping", "Zadajte zdrojový vrchol:")
+        self.master.update()
+        target = simpledialog.askinteger("Delta-stepping", "Zadajte cieľový vrchol:")
+        if source not in self.graph.nodes or target not in self.graph.nodes:
+            messagebox.showerror("Chyba", "Nesprávne vrcholy.")
+            return
+        from delta_stepping import suggest_delta
+        arrays = self.get_graph_arrays()
+        delta = simpledialog.askfloat("Delta-stepping", "Zadajte šírku koša Δ:",
+                                      initialvalue=round(suggest_delta(arrays), 4), minvalue=1e-9)
+        if delta is None:
+            return
 
+        self.draw_graph()
+        self.begin_trace()
+        try:
+            algorithms.delta_stepping(arrays, self.algorithm_steps, self.instrumentation, source, target, delta,
+                                      self.early_exit_var.get())
+        except algorithms.NoPathError as e:
+            self.abort_trace()
+            messagebox.showerror("Chyba", str(e))
+            return
+        except Exception:
+            self.abort_trace()
+            raise
+        self.finish_trace("Delta-stepping pripravený na vizualizáciu.")
 
     def run_bellman_ford(self):
         self.clear_step_visualization()
@@ -743,98 +1482,23 @@ class GraphVisualizerApp:
             return
 
         self.draw_graph()
-        self.algorithm_steps = []
-
-        distances = {node: float('inf') for node in self.graph.nodes}
-        distances[source] = 0
-        edges = list(self.graph.edges(data=True))
-
-        for i in range(len(self.graph.nodes) - 1):
-            step_details = [f"Iterácia {i+1}: Relaxácia hrán"]
-            updated_edges = []
-            no_update_edges = []
-            updated = False  
-
-            for u, v, data in edges:
-                weight = data.get('weight', 1)
-                step_details.append(f" Kontrola hrany ({u} → {v}), váha {weight}")
-
-                if distances[u] != float('inf') and distances[u] + weight < distances[v]:
-                    distances[v] = distances[u] + weight
-                    step_details.append(f"Aktualizácia: d({v}) = {distances[v]}")
-                    updated_edges.append((u, v))
-                    updated = True
-                else:
-                    step_details.append(f"Bez zmeny pre {v} (d = {distances[v]})")
-                    no_update_edges.append((u, v))
-
-            self.algorithm_steps.append({
-                'updated_edges': updated_edges,
-                'no_update_edges': no_update_edges,
-                'stack': edges.copy(),
-                'details': step_details,
-                'structure_type': "Zoznam hrán"
-            })
-
-            if not updated:
-                break  
-
-        step_details = [" Kontrola záporných cyklov:"]
-        negative_cycle_edges = []
-
-        for u, v, data in edges:
-            weight = data.get('weight', 1)
-            if distances[u] != float('inf') and distances[u] + weight < distances[v]:
-                step_details.append(f" Detekovaný záporný cyklus na hrane ({u} → {v}) s váhou {weight}")
-                print(f"❗ Problémová hrana: {u} → {v}, váha = {weight}, d({u}) = {distances[u]}, d({v}) = {distances[v]}")
-                negative_cycle_edges.append((u, v))
-
-        if negative_cycle_edges:
-            self.algorithm_steps.append({
-                'updated_edges': negative_cycle_edges,
-                'no_update_edges': [],
-                'stack': [],
-                'details': step_details,
-                'structure_type': "Detekcia cyklu"
-            })
-            messagebox.showerror("Negatívny cyklus detekovaný!", "Algoritmus nemôže pokračovať.")
-            self.update_status("Negatívny cyklus detekovaný!")
-            return
-
-        step_details.append("Žiadne záporné cykly neboli nájdené.")
-        self.algorithm_steps.append({
-            'updated_edges': [],
-            'no_update_edges': [],
-            'stack': [],
-            'details': step_details,
-            'structure_type': ""
-        })
-
+        self.begin_trace()
         try:
-            path = nx.bellman_ford_path(self.graph, source=source, target=target, weight='weight')
-            path_edges = list(zip(path, path[1:]))
-            self.algorithm_steps.append({
-                'updated_edges': path_edges,
-                'no_update_edges': [],
-                'stack': [],
-                'details': ["🏁 Finálna najkratšia cesta zvýraznená."],
-                'structure_type': "Najkratšia cesta"
-            })
-        except nx.NetworkXUnbounded:
-            messagebox.showerror("Chyba", "Negatívny cyklus detekovaný! Algoritmus nemôže pokračovať.")
+            algorithms.bellman_ford(self.graph, self.algorithm_steps, self.instrumentation, source, target)
+        except algorithms.NegativeCycleError as e:
+            self.abort_trace()
+            messagebox.showerror("Negatívny cyklus detekovaný!", str(e))
             self.update_status("Negatívny cyklus detekovaný!")
             return
-        except nx.NetworkXNoPath:
-            messagebox.showerror("Medzi zadanými vrcholami neexistuje cesta.", "Nie je možné pokračovať.")
-            self.update_status("Medzi zadanými vrcholami neexistuje cesta.")
+        except algorithms.NoPathError as e:
+            self.abort_trace()
+            messagebox.showerror("Chyba", str(e))
+            self.update_status(str(e))
             return
-
-        self.current_step_index = -1
-        self.next_step_button.config(state=tk.NORMAL)
-        self.prev_step_button.config(state=tk.DISABLED)
-        self.update_status("Bellman-Ford pripravený na vizualizáciu.")
-
-
+        except Exception:
+            self.abort_trace()
+            raise
+        self.finish_trace("Bellman-Ford pripravený na vizualizáciu.")
 
     def run_astar(self):
         self.show_edges = True
@@ -882,54 +1546,77 @@ class GraphVisualizerApp:
             return
 
         self.draw_graph()
-        self.algorithm_steps = []
-        open_list = [(self.heuristic(source, target), source)]
-        g_scores = {node: float('inf') for node in self.graph.nodes}
-        g_scores[source] = 0
-        f_scores = {node: float('inf') for node in self.graph.nodes}
-        f_scores[source] = self.heuristic(source, target)
-
-        while open_list:
-            open_list.sort(key=lambda x: x[0])
-            current_f, current = open_list.pop(0)
-            step_details = [f"Spracovávame vrchol {current} (f = {f_scores[current]:.2f})"]
-            updated_edges = []
-            no_update_edges = []
-            if current == target:
-                step_details.append("Cieľový vrchol dosiahnutý.")
-                break
-            for neighbor in self.graph.neighbors(current):
-                weight = self.graph[current][neighbor].get('weight', 1)
-                tentative_g = g_scores[current] + weight
-                step_details.append(f"Hrana ({current}->{neighbor}), hodnota {weight}")
-                if tentative_g < g_scores[neighbor]:
-                    g_scores[neighbor] = tentative_g
-                    f_scores[neighbor] = tentative_g + self.heuristic(neighbor, target)
-                    open_list.append((f_scores[neighbor], neighbor))
-                    step_details.append(f"Aktualizácia: g({neighbor}) = {tentative_g:.2f}, f({neighbor}) = {f_scores[neighbor]:.2f}")
-                    updated_edges.append((current, neighbor))
-                else:
-                    step_details.append(f"Bez aktualizácie pre {neighbor} (g = {g_scores[neighbor]:.2f})")
-                    no_update_edges.append((current, neighbor))
-            step_details.append(f"Otvárací zoznam: {open_list}")
-            self.algorithm_steps.append({
-                'updated_edges': updated_edges,
-                'no_update_edges': no_update_edges,
-                'stack': open_list.copy(),
-                'details': step_details,
-                'structure_type': "Prioritný front"
-            })
+        self.begin_trace()
+        try:
+            algorithms.astar(self.graph, self.algorithm_steps, self.instrumentation, source, target,
+                             self.get_graph_arrays(), self.get_heuristic())
+        except algorithms.NoPathError as e:
+            self.abort_trace()
+            messagebox.showerror("Chyba", str(e))
+            return
+        except Exception:
+            self.abort_trace()
+            raise
+        self.finish_trace("A* algoritmus pripravený na vizualizáciu.")
 
+    def run_bidirectional(self, use_heuristic=False):
+        title = "Obojsmerný A* algoritmus" if use_heuristic else "Obojsmerný Dijkstrov algoritmus"
+        self.clear_step_visualization()
+        self.show_edges = True
+        if self.contains_negative_edge():
+            messagebox.showerror("Tento algoritmus nepracuje so zápornými hranami")
+            return
+        if not self.check_weights():
+            messagebox.showwarning("Upozornenie", "Nie všetky hrany majú nastavenú váhu. Váhy budú deaktivované pre tento algoritmus.")
+            self.show_weights = False
+        else:
+            self.show_weights = True
+
+        pseudocode = (
+            f"{'OBOJSMERNÝ-A*' if use_heuristic else 'OBOJSMERNÝ-DIJKSTRA'}(G, w, s, t)\n"
+            "1  d_f[s] = 0, d_b[t] = 0, μ = ∞\n"
+            "2  Q_f = {s}, Q_b = {t}\n"
+            "3  kým Q_f ≠ ∅ a Q_b ≠ ∅:\n"
+            "4      ak min(Q_f) + min(Q_b) ≥ μ:\n"
+            "5          koniec, najkratšia cesta má dĺžku μ\n"
+            "6      vyber stranu X s menším min(Q_X)\n"
+            "7      u = EXTRAHUJ-MIN(Q_X)\n"
+            "8      pre každú hranu (u, v) v smere X:\n"
+            "9          ak d_X[v] > d_X[u] + w(u, v):\n"
+            "10             d_X[v] = d_X[u] + w(u, v)\n"
+            "11             vlož v do Q_X\n"
+            "12         ak v má značku z opačnej strany Y:\n"
+            "13             μ = min(μ, d_X[u] + w(u, v) + d_Y[v])\n"
+        )
+        if use_heuristic:
+            pseudocode += (
+                "Kľúče frontov používajú potenciál p(v) = (h_t(v) - h_s(v)) / 2\n"
+                "dopredu d_f[v] + p(v), dozadu d_b[v] - p(v)\n"
+            )
+        self.display_pseudocode(pseudocode)
+
+        source = simpledialog.askinteger(title, "Zadajte zdrojový vrchol:")
+        self.master.update()
+        target = simpledialog.askinteger(title, "Zadajte cieľový vrchol:")
+        if source not in self.graph.nodes or target not in self.graph.nodes:
+            messagebox.showerror("Chyba", "Nesprávne vrcholy.")
+            return
+
+        self.draw_graph()
+        self.begin_trace()
+        arrays = self.get_graph_arrays() if use_heuristic else None
+        heuristic = self.get_heuristic() if use_heuristic else None
         try:
-            path = nx.astar_path(self.graph, source, target, heuristic=self.heuristic, weight='weight')
-            path_edges = list(zip(path, path[1:]))
-            self.algorithm_steps.append({'updated_edges': path_edges, 'no_update_edges': [], 'stack': [], 'details': ["Finálna najkratšia cesta zvýraznená."], 'structure_type': ""})
-            self.current_step_index = -1
-            self.next_step_button.config(state=tk.NORMAL)
-            self.prev_step_button.config(state=tk.DISABLED)
-            self.update_status("A* algoritmus pripravený na vizualizáciu.")
-        except nx.NetworkXNoPath:
-            messagebox.showerror("Chyba", "Medzi zadanými vrcholami neexistuje cesta.")
+            algorithms.bidirectional(self.graph, self.algorithm_steps, self.instrumentation, source, target,
+                                     arrays, heuristic)
+        except algorithms.NoPathError as e:
+            self.abort_trace()
+            messagebox.showerror("Chyba", str(e))
+            return
+        except Exception:
+            self.abort_trace()
+            raise
+        self.finish_trace(f"{title} pripravený na vizualizáciu.")
 
     def run_kruskal(self):
         self.show_edges = True
@@ -958,48 +1645,46 @@ class GraphVisualizerApp:
             return
 
         self.draw_graph()
-        self.algorithm_steps = []
-        edges = sorted(self.graph.edges(data=True), key=lambda x: x[2].get('weight', 1))
-        mst_edges = []
-        disjoint_set = {node: node for node in self.graph.nodes()}
-
-        def find(node):
-            if disjoint_set[node] != node:
-                disjoint_set[node] = find(disjoint_set[node])
-            return disjoint_set[node]
-
-        def union(u, v):
-            root_u = find(u)
-            root_v = find(v)
-            if root_u != root_v:
-                disjoint_set[root_v] = root_u
-
-        for u, v, data in edges:
-            weight = data.get('weight', 1)
-            step_details = [f"Hrana ({u}->{v}), hodnota {weight}"]
-            if find(u) != find(v):
-                mst_edges.append((u, v))
-                union(u, v)
-                step_details.append("Hrana pridaná do MST.")
-            else:
-                step_details.append("Hrana vytvára cyklus – preskočená.")
-            self.algorithm_steps.append({
-                'edges': mst_edges.copy(),
-                'stack': edges,
-                'details': step_details,
-                'structure_type': "Zoznam hrán"
-            })
-
-        self.algorithm_steps.append({
-            'edges': mst_edges.copy(),
-            'stack': [],
-            'details': ["Kruskalov algoritmus dokončený. Finálne MST zostavené."],
-            'structure_type': " union-find štruktúra"
-        })
-        self.current_step_index = -1
-        self.next_step_button.config(state=tk.NORMAL)
-        self.prev_step_button.config(state=tk.DISABLED)
-        self.update_status("Kruskalov algoritmus pripravený na vizualizáciu.")
+        self.begin_trace()
+        try:
+            algorithms.kruskal(self.graph, self.algorithm_steps, self.instrumentation)
+        except Exception:
+            self.abort_trace()
+            raise
+        self.finish_trace("Kruskalov algoritmus pripravený na vizualizáciu.")
+
+    def run_boruvka(self):
+        self.show_edges = True
+        self.clear_step_visualization()
+        if self.contains_negative_edge():
+            messagebox.showerror("Tento algoritmus nepracuje so zápornými hranami")
+            return
+
+        pseudocode = (
+            "BORŮVKA(G)\n"
+            "1  A ← ∅                # množina hrán v minimálnej kostre\n"
+            "2  každý vrchol tvorí samostatný komponent\n"
+            "3  kým existuje hrana medzi rôznymi komponentmi:\n"
+            "4      pre každý komponent C (naraz pre všetky):\n"
+            "5          e(C) ← najlacnejšia hrana z C do iného komponentu\n"
+            "6      A ← A ∪ {e(C) pre všetky C}\n"
+            "7      zlúč komponenty spojené hranami e(C)\n"
+            "8  vráť A ako množinu hrán minimálnej kostry\n"
+        )
+        self.display_pseudocode(pseudocode)
+
+        if len(self.graph.edges) < 1:
+            messagebox.showwarning("Upozornenie", "Graf neobsahuje žiadne hrany.")
+            return
+
+        self.draw_graph()
+        self.begin_trace()
+        try:
+            algorithms.boruvka(self.graph, self.algorithm_steps, self.instrumentation)
+        except Exception:
+            self.abort_trace()
+            raise
+        self.finish_trace("Borůvkov algoritmus pripravený na vizualizáciu.")
 
     def run_prim(self):
         self.clear_step_visualization()
@@ -1032,51 +1717,13 @@ class GraphVisualizerApp:
             return
 
         self.draw_graph()
-        self.algorithm_steps = []
-        mst_nodes = set()
-        mst_edges = []
-        start_node = list(self.graph.nodes)[0]
-        mst_nodes.add(start_node)
-        priority_queue = [(self.graph[start_node][neighbor]['weight'], start_node, neighbor) for neighbor in self.graph.neighbors(start_node)]
-        self.algorithm_steps.append({
-            'edges': mst_edges.copy(),
-            'stack': priority_queue.copy(),
-            'details': [f"Začiatok vo vrchole {start_node}", f"Počiatočné hrany: {priority_queue}"],
-            'structure_type': "Prioritný front"
-        })
-
-        while priority_queue:
-            priority_queue.sort(key=lambda x: x[0])
-            weight, u, v = priority_queue.pop(0)
-            step_details = [f"Hrana ({u}->{v}), hodnota {weight}"]
-            if v not in mst_nodes:
-                mst_nodes.add(v)
-                mst_edges.append((u, v))
-                step_details.append(f"vrchol {v} pridaný do MST.")
-                for neighbor in self.graph.neighbors(v):
-                    if neighbor not in mst_nodes:
-                        edge_weight = self.graph[v][neighbor]['weight']
-                        priority_queue.append((edge_weight, v, neighbor))
-                step_details.append(f"Zoznam: {priority_queue}")
-            else:
-                step_details.append("Hrana vytvára cyklus – preskočená.")
-            self.algorithm_steps.append({
-                'edges': mst_edges.copy(),
-                'stack': priority_queue.copy(),
-                'details': step_details,
-                'structure_type': "Prioritný front"
-            })
-
-        self.algorithm_steps.append({
-            'edges': mst_edges.copy(),
-            'stack': [],
-            'details': ["Primov algoritmus dokončený. Finálne MST zostavené."],
-            'structure_type': ""
-        })
-        self.current_step_index = -1
-        self.next_step_button.config(state=tk.NORMAL)
-        self.prev_step_button.config(state=tk.DISABLED)
-        self.update_status("Primov algoritmus pripravený na vizualizáciu.")
+        self.begin_trace()
+        try:
+            algorithms.prim(self.graph, self.algorithm_steps, self.instrumentation)
+        except Exception:
+            self.abort_trace()
+            raise
+        self.finish_trace("Primov algoritmus pripravený na vizualizáciu.")
 
     def run_kosaraju(self):
         self.clear_step_visualization()
@@ -1103,98 +1750,16 @@ class GraphVisualizerApp:
             return
 
         self.draw_graph()
-        self.algorithm_steps = []
-        finish_stack = []
-        visited = set()
-
-        def dfs_phase1(node):
-            visited.add(node)
-            self.algorithm_steps.append({
-                'highlight': [node],
-                'stack': finish_stack.copy(),
-                'details': [f"Fáza 1: Návšteva vrcholu {node}"],
-                'structure_type': "Zásobník"
-            })
-            for neighbor in self.graph.neighbors(node):
-                if neighbor not in visited:
-                    dfs_phase1(neighbor)
-            finish_stack.append(node)
-            self.algorithm_steps.append({
-                'highlight': [node],
-                'stack': finish_stack.copy(),
-                'details': [f"Fáza 1: vrchol {node} dokončený, pridaný do zásobníka"],
-                'structure_type': ""
-            })
-
-        for node in list(self.graph.nodes()):
-            if node not in visited:
-                dfs_phase1(node)
-
+        self.begin_trace()
         try:
-            reversed_graph = self.graph.reverse(copy=True)
-        except AttributeError:
-            messagebox.showerror("Chyba", "Pre Kosarajuho algoritmus je potrebný orientovaný graf.")
-            return
-
-        self.algorithm_steps.append({
-            'highlight': [],
-            'stack': finish_stack.copy(),
-            'details': ["Graf prevrátený pre Fázu 2."],
-            'structure_type': "Zásobník"
-        })
-
-        visited.clear()
-        sccs = []
-        while finish_stack:
-            node = finish_stack.pop()
-            if node not in visited:
-                scc = []
-                stack = [node]
-                self.algorithm_steps.append({
-                    'highlight': [node],
-                    'stack': stack.copy(),
-                    'details': [f"Fáza 3: DFS z vrcholu {node} v prevrátenom grafe"],
-                    'structure_type': "Zásobník"
-                })
-                while stack:
-                    current = stack.pop()
-                    if current not in visited:
-                        visited.add(current)
-                        scc.append(current)
-                        self.algorithm_steps.append({
-                            'highlight': [current],
-                            'stack': stack.copy(),
-                            'details': [f"Návšteva vrcholu {current}"],
-                            'structure_type': "Zásobník"
-                        })
-                        for neighbor in reversed_graph.neighbors(current):
-                            if neighbor not in visited:
-                                stack.append(neighbor)
-                                self.algorithm_steps.append({
-                                    'highlight': [neighbor],
-                                    'stack': stack.copy(),
-                                    'details': [f"Pridaný sused {neighbor} do zásobníka"],
-                                    'structure_type': "Zásobník"
-                                })
-                sccs.append(scc)
-                self.algorithm_steps.append({
-                    'highlight': scc,
-                    'stack': stack.copy(),
-                    'details': [f"Zistený silne súvislý komponent: {scc}"],
-                    'structure_type': "Zásobník"
-                })
-
-        self.draw_scc(sccs)
-        self.algorithm_steps.append({
-            'highlight': [],
-            'stack': [],
-            'details': [f"Kosarajuho algoritmus dokončený. Silne súvislé komponenty: {sccs}"],
-            'structure_type': ""
-        })
-        self.current_step_index = -1
-        self.next_step_button.config(state=tk.NORMAL)
-        self.prev_step_button.config(state=tk.DISABLED)
-        self.update_status("Kosarajuho algoritmus pripravený na vizualizáciu.")
+            result = algorithms.kosaraju(self.graph, self.algorithm_steps, self.instrumentation,
+                                         self.trace_granularity.get(), step_budget=self.trace_step_budget)
+        except Exception:
+            self.abort_trace()
+            raise
+        self.scc_trace = ("kosaraju", result['granularity'])
+        self.finish_trace("Kosarajuho algoritmus pripravený na vizualizáciu" + self.granularity_note())
+        self.draw_scc(result['components'])
 
     def run_tarjan(self):
         self.clear_step_visualization()
@@ -1235,129 +1800,128 @@ class GraphVisualizerApp:
             return
 
         self.draw_graph()
-        self.algorithm_steps = []
-        index = 0
-        stack = []
-        indices = {}
-        low_link = {}
-        on_stack = set()
-        sccs = []
-
-        def strong_connect(node):
-            nonlocal index
-            indices[node] = index
-            low_link[node] = index
-            index += 1
-            stack.append(node)
-            on_stack.add(node)
-            self.algorithm_steps.append({
-                'highlight': [node],
-                'stack': stack.copy(),
-                'details': [f"vrchol {node} pridaný: index {indices[node]}, low-link {low_link[node]}"],
-                'structure_type': "Zásobník"
-            })
-            for neighbor in self.graph.neighbors(node):
-                if neighbor not in indices:
-                    self.algorithm_steps.append({
-                        'highlight': [neighbor],
-                        'stack': stack.copy(),
-                        'details': [f"Prechod na suseda {neighbor} z vrcholu {node}"],
-                        'structure_type': "Zásobník"
-                    })
-                    strong_connect(neighbor)
-                    low_link[node] = min(low_link[node], low_link[neighbor])
-                    self.algorithm_steps.append({
-                        'highlight': [node],
-                        'stack': stack.copy(),
-                        'details': [f"Aktualizácia low-link {node} na {low_link[node]} po návšteve {neighbor}"],
-                        'structure_type': "Zásobník"
-                    })
-                elif neighbor in on_stack:
-                    low_link[node] = min(low_link[node], indices[neighbor])
-                    self.algorithm_steps.append({
-                        'highlight': [node, neighbor],
-                        'stack': stack.copy(),
-                        'details': [f"Sused {neighbor} v zásobníku: aktualizácia low-link {node} na {low_link[node]}"],
-                        'structure_type': "Zásobník"
-                    })
-            if low_link[node] == indices[node]:
-                scc = []
-                self.algorithm_steps.append({
-                    'highlight': [node],
-                    'stack': stack.copy(),
-                    'details': [f"vrchol {node} je koreňom SCC, začíname vytvárať SCC."],
-                    'structure_type': "Zásobník"
-                })
-                while True:
-                    w = stack.pop()
-                    on_stack.remove(w)
-                    scc.append(w)
-                    self.algorithm_steps.append({
-                        'highlight': [w],
-                        'stack': stack.copy(),
-                        'details': [f"Vyradený vrchol {w} zo zásobníka, aktuálne SCC: {scc}"],
-                        'structure_type': "Zásobník"
-                    })
-                    if w == node:
-                        break
-                sccs.append(scc)
-                self.algorithm_steps.append({
-                    'highlight': scc,
-                    'stack': stack.copy(),
-                    'details': [f"SCC dokončené: {scc}"],
-                    'structure_type': "Zásobník"
-                })
-
-        for node in list(self.graph.nodes()):
-            if node not in indices:
-                strong_connect(node)
-
-        self.draw_scc(sccs)
-        self.algorithm_steps.append({
-            'highlight': [],
-            'stack': [],
-            'details': [f"Tarjanov algoritmus dokončený. Silne súvislé komponenty: {sccs}"],
-            'structure_type': ""
-        })
-        self.current_step_index = -1
-        self.next_step_button.config(state=tk.NORMAL)
-        self.prev_step_button.config(state=tk.DISABLED)
-        self.update_status("Tarjanov algoritmus pripravený na vizualizáciu.")
+        self.begin_trace()
+        try:
+            result = algorithms.tarjan(self.graph, self.algorithm_steps, self.instrumentation,
+                                       self.trace_granularity.get(), step_budget=self.trace_step_budget)
+        except Exception:
+            self.abort_trace()
+            raise
+        self.scc_trace = ("tarjan", result['granularity'])
+        self.finish_trace("Tarjanov algoritmus pripravený na vizualizáciu" + self.granularity_note())
+        self.draw_scc(result['components'])
+
+    def granularity_note(self):
+        granularity = self.scc_trace[1]
+        if granularity == "fine":
+            return "."
+        return f" (trasa {dict(TRACE_GRANULARITIES)[granularity]}, podrobnosti úseku cez menu Algoritmy)."
+
+    def zoom_scc_segment(self):
+        # Kroky hrubšej trasy si pamätajú poradie v podrobnej trase; úsek sa prepočíta
+        # znova a zaznamenajú sa iba jeho podrobné kroky. Hrubá trasa sa odloží, aby sa
+        # na ňu dalo vrátiť a prepočítať z nej aj ďalšie úseky.
+        coarse = self.coarse_trace
+        if coarse is None:
+            if self.scc_trace is None or self.scc_trace[1] == "fine":
+                messagebox.showinfo("Podrobný úsek trasy",
+                                    "Najprv spustite Kosarajuho alebo Tarjanov algoritmus s hrubšou podrobnosťou trasy.")
+                return
+            coarse = {'steps': self.algorithm_steps, 'scc_trace': self.scc_trace, 'title': self.trace_title,
+                      'index': self.current_step_index}
+        steps = coarse['steps']
+        # Súhrnný krok po zastavení záznamu (limit disku) nemá poradie v podrobnej trase.
+        count = len(steps)
+        while count and 'fine_index' not in steps[count - 1]:
+            count -= 1
+        if not count:
+            messagebox.showinfo("Podrobný úsek trasy", "Trasa neobsahuje žiadne kroky, ktoré by sa dali prepočítať.")
+            return
+        current = min(max(coarse['index'], 0) + 1, count)
+        text = simpledialog.askstring("Podrobný úsek trasy", f"Zadajte kroky hrubej trasy od-do (1 až {count}):",
+                                      initialvalue=f"{current}-{current}")
+        if not text:
+            return
+        try:
+            first, _, last = text.partition("-")
+            first = int(first)
+            last = int(last) if last.strip() else first
+            if not 1 <= first <= last <= count:
+                raise ValueError
+        except ValueError:
+            messagebox.showerror("Chyba", f"Zadajte rozsah krokov v tvare od-do v rozmedzí 1 až {count}.")
+            return
+        # Krok hrubej trasy zhŕňa všetky podrobné kroky od predchádzajúceho zaznamenaného kroku.
+        start = steps[first - 2]['fine_index'] + 1 if first > 1 else 0
+        stop = steps[last - 1]['fine_index'] + 1
+        name = coarse['scc_trace'][0]
+        # Hrubú trasu pri začatí novej nesmie zavrieť, zavrie sa iba predchádzajúci úsek.
+        self.coarse_trace = None
+        if self.algorithm_steps is steps:
+            self.algorithm_steps = []
+        self.begin_trace()
+        try:
+            getattr(algorithms, name)(self.graph, self.algorithm_steps, self.instrumentation, segment=(start, stop))
+        except Exception:
+            self.abort_trace()
+            self.coarse_trace = coarse
+            self.return_to_coarse_trace()
+            raise
+        self.coarse_trace = coarse
+        self.scc_trace = (name, "fine")
+        self.finish_trace(f"Podrobné kroky úseku {first}–{last}: {len(self.algorithm_steps)} krokov "
+                          "(späť cez Algoritmy → Späť na hrubú trasu SCC).")
+
+    def return_to_coarse_trace(self):
+        coarse = self.coarse_trace
+        if coarse is None:
+            messagebox.showinfo("Hrubá trasa", "Práve sa nezobrazuje podrobný úsek trasy SCC.")
+            return
+        self.coarse_trace = None
+        self.close_trace()
+        self.algorithm_steps = coarse['steps']
+        self.scc_trace = coarse['scc_trace']
+        self.trace_title = coarse['title']
+        self.current_step_index = coarse['index']
+        count = len(self.algorithm_steps)
+        self.prev_step_button.config(state=tk.NORMAL if self.current_step_index > 0 else tk.DISABLED)
+        self.next_step_button.config(state=tk.NORMAL if self.current_step_index + 1 < count else tk.DISABLED)
+        if self.current_step_index >= 0:
+            self.draw_graph_with_step(self.algorithm_steps[self.current_step_index], self.current_step_index)
+            self.update_status(f"Hrubá trasa: krok {self.current_step_index + 1} z {count}.")
+        else:
+            self.clear_step_visualization()
+            self.draw_graph()
+            self.update_status(f"Hrubá trasa: {count} krokov.")
 
-    def heuristic(self, u, v):
-        pos_u = self.positions.get(u, (0, 0))
-        pos_v = self.positions.get(v, (0, 0))
-        return math.hypot(pos_u[0] - pos_v[0], pos_u[1] - pos_v[1])
+    def discard_coarse_trace(self):
+        if self.coarse_trace is not None and isinstance(self.coarse_trace['steps'], LazyTrace):
+            self.coarse_trace['steps'].close()
+        self.coarse_trace = None
 
     def draw_scc(self, sccs):
-        self.ax.clear()
-        self.ax.set_axis_on()
-        self.ax.grid(True)
-        colors = plt.cm.tab10.colors
-        for i, component in enumerate(sccs):
-            color = colors[i % len(colors)]
-            nx.draw_networkx_nodes(
-                self.graph,
-                self.positions,
-                nodelist=list(component),
-                node_color=[color],
-                node_size=500,
-                ax=self.ax
-            )
-        nx.draw_networkx_edges(
-            self.graph,
-            self.positions,
-            ax=self.ax,
-            arrows=True,
-            arrowstyle='-|>',
-            arrowsize=12,
-            connectionstyle='arc3,rad=0.1'
-        )
-        nx.draw_networkx_labels(self.graph, self.positions, ax=self.ax)
-        if self.show_weights:
-            edge_labels = nx.get_edge_attributes(self.graph, 'weight')
-            nx.draw_networkx_edge_labels(self.graph, self.positions, edge_labels=edge_labels, ax=self.ax)
-        self.canvas.draw()
+        self.scc_components = sccs
+        if self.condensation_var.get():
+            from condensation import Condensation
+            self.condensation = Condensation(self.graph, self.positions, sccs)
+            self.draw_condensation()
+            self.update_status(f"Kondenzácia: {len(self.condensation)} SCC, {len(self.condensation.dag_edges)} hrán DAG. "
+                               "Kliknutím na super-vrchol ho rozbalíte.")
+            return
+        self.condensation = None
+        self.renderer.draw_scc(self.graph, self.positions, sccs, self.show_weights)
+        self.redraw_canvas()
+
+    def draw_condensation(self):
+        with self.instrumentation.timer("draw_condensation"):
+            self.renderer.draw_condensation(self.condensation.display(), self.show_weights)
+        self.redraw_canvas()
+
+    def toggle_condensation(self):
+        if self.scc_components is None:
+            self.update_status("Najprv spustite Kosarajuho alebo Tarjanov algoritmus.")
+            return
+        self.draw_scc(self.scc_components)
 
     def show_tutorial(self):
         tutorial_win = tk.Toplevel(self.master)
@@ -0,0 +1,918 @@
+import heapq
+
+import networkx as nx
+import numpy as np
+
+from boruvka import boruvka_rounds
+from delta_stepping import DeltaStepping
+from graph_arrays import edge_arrays
+from heuristics import EuclideanHeuristic, LandmarkHeuristic, ZeroHeuristic, count_expansions
+
+# Generovanie krokov jednotlivých algoritmov bez závislosti na Tk. Každá funkcia
+# zapisuje kroky do `steps` (zoznam, TraceStore alebo StepCounter) a vracia výsledok.
+
+
+class NoPathError(ValueError):
+    pass
+
+
+class NegativeCycleError(ValueError):
+    pass
+
+
+class StepCounter:
+    # Kroky sa iba spočítajú a zahodia, pamäť nerastie s dĺžkou trasy.
+    def __init__(self):
+        self.count = 0
+        self.shared = {}
+
+    def append(self, step):
+        self.count += 1
+
+    def __len__(self):
+        return self.count
+
+
+def contains_negative_edge(graph):
+    for u, v, data in graph.edges(data=True):
+        if data.get('weight', 1) < 0:
+            return True
+    return False
+
+
+def path_weight(graph, path):
+    return sum(graph[u][v].get('weight', 1) for u, v in zip(path, path[1:]))
+
+
+def expansion_report(arrays, source, target, heuristic, bounds):
+    expanded = count_expansions(arrays, source, target, bounds)
+    baseline = count_expansions(arrays, source, target, ZeroHeuristic(arrays).bounds_to(target))
+    report = [('astar_expansions', heuristic.name, expanded, baseline, baseline - expanded)]
+    if isinstance(heuristic, LandmarkHeuristic):
+        euclidean = count_expansions(arrays, source, target, EuclideanHeuristic(arrays).bounds_to(target))
+        report.append(('astar_expansions_euclid', euclidean, euclidean - expanded))
+    return report
+
+
+def dijkstra(graph, steps, counters, source, target, early_exit=False):
+    distances = {node: float('inf') for node in graph.nodes}
+    distances[source] = 0
+    predecessors = {node: None for node in graph.nodes}
+    priority_queue = [(0, source, None)]  # (vzdialenosť, cieľ, predchodca)
+    visited = set()
+    pushes, pops, relaxations, scanned = 1, 0, 0, 0
+
+    while priority_queue:
+        # Front je zoznam triedený pred každým výberom; scanned počíta položky, ktoré pri tom prejde.
+        scanned += len(priority_queue)
+        priority_queue.sort(key=lambda x: x[0])
+        current_distance, current_node, from_node = priority_queue.pop(0)
+        pops += 1
+
+        if current_node in visited:
+            continue
+        visited.add(current_node)
+
+        if early_exit and current_node == target:
+            steps.append({
+                'highlight': [target],
+                'stack': priority_queue.copy(),
+                'details': [('dijkstra_target_settled', target, current_distance)],
+                'structure_type': "Prioritný front"
+            })
+            break
+
+        step_details = []
+        updated_edges = []
+        no_update_edges = []
+
+        step_details.append(('dijkstra_node', current_node, current_distance))
+
+        for neighbor in graph.neighbors(current_node):
+            weight = graph[current_node][neighbor].get('weight', 1)
+            new_distance = current_distance + weight
+            relaxations += 1
+            step_details.append(('dijkstra_edge', current_node, neighbor, weight))
+
+            if new_distance < distances[neighbor]:
+                distances[neighbor] = new_distance
+                predecessors[neighbor] = current_node
+                priority_queue.append((new_distance, neighbor, current_node))
+                pushes += 1
+                step_details.append(('dijkstra_update', neighbor, new_distance))
+                step_details.append(('predecessor', neighbor, current_node))
+                updated_edges.append((current_node, neighbor))
+            else:
+                step_details.append(('dijkstra_no_update', neighbor, distances[neighbor]))
+                no_update_edges.append((current_node, neighbor))
+
+        steps.append({
+            'updated_edges': updated_edges,
+            'no_update_edges': no_update_edges,
+            'stack': priority_queue.copy(),  # obsahuje aj predchodcov
+            'details': step_details,
+            'structure_type': "Prioritný front"
+        })
+    counters.add_counts(queue_push=pushes, queue_pop=pops, queue_scanned=scanned, edge_relaxations=relaxations)
+
+    # Finálna cesta sa skladá z predchodcov, bez opätovného prehľadávania grafu
+    if distances[target] == float('inf'):
+        raise NoPathError("Medzi zadanými vrcholami neexistuje cesta.")
+    path = [target]
+    while path[-1] != source:
+        path.append(predecessors[path[-1]])
+    path.reverse()
+    path_edges = list(zip(path, path[1:]))
+    steps.append({
+        'updated_edges': path_edges,
+        'no_update_edges': [],
+        'stack': [],
+        'details': ["Finálna najkratšia cesta zvýraznená.", ('explored_nodes', len(visited), graph.number_of_nodes())],
+        'structure_type': ""
+    })
+    return {'path': path, 'distance': distances[target], 'explored': len(visited)}
+
+
+def delta_stepping(arrays, steps, counters, source, target, delta=None, early_exit=False):
+    nodes = arrays.nodes
+    algorithm = DeltaStepping(arrays, delta)
+    source_index = arrays.index[source]
+    target_index = arrays.index[target]
+    relaxations = 0
+    phases = 0
+    explored = 0
+    for phase in algorithm.phases(source_index):
+        phases += 1
+        members = phase['settled']
+        explored += len(members)
+        relaxations += phase['light_relaxations'] + phase['heavy_relaxations']
+        improved = phase['improved']
+        order = np.argsort(algorithm.dist[members], kind='stable')
+        lower = phase['bucket'] * algorithm.delta
+        steps.append({
+            'updated_edges': [(nodes[u], nodes[v]) for u, v in zip(algorithm.pred[improved].tolist(), improved.tolist())],
+            'no_update_edges': [],
+            'highlight': [nodes[i] for i in members.tolist()],
+            'stack': [(distance, nodes[i]) for distance, i in zip(algorithm.dist[members[order]].tolist(), members[order].tolist())],
+            'details': [('delta_phase', phase['bucket'], lower, lower + algorithm.delta, len(members)),
+                        ('delta_relaxations', phase['rounds'], phase['light_relaxations'], phase['heavy_relaxations']),
+                        ('delta_updates', len(improved))],
+            'structure_type': f"Kôš {phase['bucket']}"
+        })
+        if early_exit and np.isfinite(algorithm.dist[target_index]) and algorithm.dist[target_index] < lower + algorithm.delta:
+            steps.append({
+                'highlight': [target],
+                'stack': [],
+                'details': [('dijkstra_target_settled', target, float(algorithm.dist[target_index]))],
+                'structure_type': ""
+            })
+            break
+    counters.add_counts(edge_relaxations=relaxations, buckets=phases)
+
+    path = algorithm.path(source_index, target_index)
+    if not path:
+        raise NoPathError("Medzi zadanými vrcholami neexistuje cesta.")
+    path = [nodes[i] for i in path]
+    steps.append({
+        'updated_edges': list(zip(path, path[1:])),
+        'no_update_edges': [],
+        'stack': [],
+        'details': ["Finálna najkratšia cesta zvýraznená.", ('delta_result', float(algorithm.dist[target_index]), phases),
+                    ('explored_nodes', explored, arrays.n)],
+        'structure_type': ""
+    })
+    return {'path': path, 'distance': float(algorithm.dist[target_index]), 'explored': explored, 'phases': phases}
+
+
+def bellman_ford(graph, steps, counters, source, target):
+    distances = {node: float('inf') for node in graph.nodes}
+    distances[source] = 0
+    edges = list(graph.edges(data=True))
+    relaxations = 0
+
+    for i in range(len(graph.nodes) - 1):
+        step_details = [('bf_iteration', i + 1)]
+        updated_edges = []
+        no_update_edges = []
+        updated = False  
+
+        for u, v, data in edges:
+            weight = data.get('weight', 1)
+            relaxations += 1
+            step_details.append(('bf_edge', u, v, weight))
+
+            if distances[u] != float('inf') and distances[u] + weight < distances[v]:
+                distances[v] = distances[u] + weight
+                step_details.append(('bf_update', v, distances[v]))
+                updated_edges.append((u, v))
+                updated = True
+            else:
+                step_details.append(('bf_no_update', v, distances[v]))
+                no_update_edges.append((u, v))
+
+        steps.append({
+            'updated_edges': updated_edges,
+            'no_update_edges': no_update_edges,
+            'stack': edges.copy(),
+            'details': step_details,
+            'structure_type': "Zoznam hrán"
+        })
+
+        if not updated:
+            break  
+    counters.add_counts(edge_relaxations=relaxations)
+
+    step_details = [" Kontrola záporných cyklov:"]
+    negative_cycle_edges = []
+
+    for u, v, data in edges:
+        weight = data.get('weight', 1)
+        if distances[u] != float('inf') and distances[u] + weight < distances[v]:
+            step_details.append(('bf_negative_cycle', u, v, weight))
+            print(f"❗ Problémová hrana: {u} → {v}, váha = {weight}, d({u}) = {distances[u]}, d({v}) = {distances[v]}")
+            negative_cycle_edges.append((u, v))
+
+    if negative_cycle_edges:
+        steps.append({
+            'updated_edges': negative_cycle_edges,
+            'no_update_edges': [],
+            'stack': [],
+            'details': step_details,
+            'structure_type': "Detekcia cyklu"
+        })
+        raise NegativeCycleError("Algoritmus nemôže pokračovať.")
+
+    step_details.append("Žiadne záporné cykly neboli nájdené.")
+    steps.append({
+        'updated_edges': [],
+        'no_update_edges': [],
+        'stack': [],
+        'details': step_details,
+        'structure_type': ""
+    })
+
+    try:
+        path = nx.bellman_ford_path(graph, source=source, target=target, weight='weight')
+    except nx.NetworkXUnbounded:
+        raise NegativeCycleError("Negatívny cyklus detekovaný! Algoritmus nemôže pokračovať.")
+    except nx.NetworkXNoPath:
+        raise NoPathError("Medzi zadanými vrcholami neexistuje cesta.")
+    path_edges = list(zip(path, path[1:]))
+    steps.append({
+        'updated_edges': path_edges,
+        'no_update_edges': [],
+        'stack': [],
+        'details': ["🏁 Finálna najkratšia cesta zvýraznená."],
+        'structure_type': "Najkratšia cesta"
+    })
+    return {'path': path, 'distance': path_weight(graph, path)}
+
+
+def astar(graph, steps, counters, source, target, arrays, heuristic):
+    node_index = arrays.index
+    bounds = heuristic.bounds_to(node_index[target])
+    estimates = bounds.tolist()
+
+    def estimate(node, goal=target):
+        return estimates[node_index[node]]
+
+    open_list = [(estimate(source), source)]
+    g_scores = {node: float('inf') for node in graph.nodes}
+    g_scores[source] = 0
+    f_scores = {node: float('inf') for node in graph.nodes}
+    f_scores[source] = estimate(source)
+    pushes, pops, relaxations, scanned = 1, 0, 0, 0
+
+    while open_list:
+        scanned += len(open_list)
+        open_list.sort(key=lambda x: x[0])
+        current_f, current = open_list.pop(0)
+        pops += 1
+        step_details = [('astar_node', current, f_scores[current])]
+        updated_edges = []
+        no_update_edges = []
+        if current == target:
+            step_details.append("Cieľový vrchol dosiahnutý.")
+            break
+        for neighbor in graph.neighbors(current):
+            weight = graph[current][neighbor].get('weight', 1)
+            tentative_g = g_scores[current] + weight
+            relaxations += 1
+            step_details.append(('edge_value', current, neighbor, weight))
+            if tentative_g < g_scores[neighbor]:
+                g_scores[neighbor] = tentative_g
+                f_scores[neighbor] = tentative_g + estimate(neighbor)
+                open_list.append((f_scores[neighbor], neighbor))
+                pushes += 1
+                step_details.append(('astar_update', neighbor, tentative_g, f_scores[neighbor]))
+                updated_edges.append((current, neighbor))
+            else:
+                step_details.append(('astar_no_update', neighbor, g_scores[neighbor]))
+                no_update_edges.append((current, neighbor))
+        open_snapshot = open_list.copy()
+        step_details.append(('astar_open_list', open_snapshot))
+        steps.append({
+            'updated_edges': updated_edges,
+            'no_update_edges': no_update_edges,
+            'stack': open_snapshot,
+            'details': step_details,
+            'structure_type': "Prioritný front"
+        })
+    counters.add_counts(queue_push=pushes, queue_pop=pops, queue_scanned=scanned, edge_relaxations=relaxations)
+
+    try:
+        path = nx.astar_path(graph, source, target, heuristic=estimate, weight='weight')
+    except nx.NetworkXNoPath:
+        raise NoPathError("Medzi zadanými vrcholami neexistuje cesta.")
+    path_edges = list(zip(path, path[1:]))
+    details = ["Finálna najkratšia cesta zvýraznená."]
+    details.extend(expansion_report(arrays, node_index[source], node_index[target], heuristic, bounds))
+    steps.append({'updated_edges': path_edges, 'no_update_edges': [], 'stack': [], 'details': details, 'structure_type': ""})
+    return {'path': path, 'distance': path_weight(graph, path)}
+
+
+def bidirectional(graph, steps, counters, source, target, arrays=None, heuristic=None):
+    def forward_edges(node):
+        for neighbor in graph.neighbors(node):
+            yield neighbor, graph[node][neighbor].get('weight', 1), (node, neighbor)
+
+    def backward_edges(node):
+        neighbors = graph.predecessors(node) if graph.is_directed() else graph.neighbors(node)
+        for neighbor in neighbors:
+            yield neighbor, graph[neighbor][node].get('weight', 1), (neighbor, node)
+
+    potentials = None
+    if heuristic is not None:
+        node_index = arrays.index
+        # Priemerný potenciál je konzistentný pre obe strany naraz.
+        potentials = ((heuristic.bounds_to(node_index[target]) - heuristic.bounds_from(node_index[source])) / 2).tolist()
+
+    def potential(node):
+        return potentials[node_index[node]] if potentials is not None else 0.0
+
+    # stav strany: vzdialenosti, predchodcovia, halda, ustálené vrcholy, hranica
+    forward = {'name': "dopredu", 'dist': {source: 0}, 'pred': {source: None}, 'heap': [(potential(source), source)],
+               'settled': set(), 'frontier': {source}, 'edges': forward_edges, 'sign': 1}
+    backward = {'name': "dozadu", 'dist': {target: 0}, 'pred': {target: None}, 'heap': [(-potential(target), target)],
+                'settled': set(), 'frontier': {target}, 'edges': backward_edges, 'sign': -1}
+    best = 0 if source == target else float('inf')
+    meeting = (source, target) if source == target else None
+    pushes, pops, relaxations = 2, 0, 0
+
+    while forward['heap'] and backward['heap']:
+        if forward['heap'][0][0] + backward['heap'][0][0] >= best:
+            steps.append({
+                'forward_frontier': list(forward['frontier']),
+                'backward_frontier': list(backward['frontier']),
+                'stack': [],
+                'details': [('bidir_stop', forward['heap'][0][0], backward['heap'][0][0], best)],
+                'structure_type': ""
+            })
+            break
+        side, other = (forward, backward) if forward['heap'][0][0] <= backward['heap'][0][0] else (backward, forward)
+        _, node = heapq.heappop(side['heap'])
+        pops += 1
+        if node in side['settled']:
+            continue
+        side['settled'].add(node)
+        side['frontier'].discard(node)
+
+        step_details = [('bidir_node', side['name'], node, side['dist'][node])]
+        updated_edges = []
+        no_update_edges = []
+        for neighbor, weight, edge in side['edges'](node):
+            relaxations += 1
+            candidate = side['dist'][node] + weight
+            if candidate < side['dist'].get(neighbor, float('inf')):
+                side['dist'][neighbor] = candidate
+                side['pred'][neighbor] = node
+                heapq.heappush(side['heap'], (candidate + side['sign'] * potential(neighbor), neighbor))
+                pushes += 1
+                if neighbor not in side['settled']:
+                    side['frontier'].add(neighbor)
+                step_details.append(('dijkstra_update', neighbor, candidate))
+                updated_edges.append(edge)
+            else:
+                no_update_edges.append(edge)
+            if neighbor in other['dist'] and candidate + other['dist'][neighbor] < best:
+                best = candidate + other['dist'][neighbor]
+                meeting = (node, neighbor) if side is forward else (neighbor, node)
+                step_details.append(('bidir_meet', neighbor, best))
+
+        steps.append({
+            'updated_edges': updated_edges,
+            'no_update_edges': no_update_edges,
+            'highlight': [node],
+            'forward_frontier': list(forward['frontier']),
+            'backward_frontier': list(backward['frontier']),
+            'stack': side['heap'].copy(),
+            'details': step_details,
+            'structure_type': f"Prioritný front ({side['name']})"
+        })
+    counters.add_counts(heap_push=pushes, heap_pop=pops, edge_relaxations=relaxations)
+
+    if meeting is None:
+        raise NoPathError("Medzi zadanými vrcholami neexistuje cesta.")
+    path = [meeting[0]]
+    while forward['pred'][path[-1]] is not None:
+        path.append(forward['pred'][path[-1]])
+    path.reverse()
+    node = meeting[1]
+    if node != path[-1]:
+        path.append(node)
+    while backward['pred'][node] is not None:
+        node = backward['pred'][node]
+        path.append(node)
+    explored = len(forward['settled'] | backward['settled'])
+    steps.append({
+        'updated_edges': list(zip(path, path[1:])),
+        'no_update_edges': [],
+        'stack': [],
+        'details': ["Finálna najkratšia cesta zvýraznená.", ('bidir_result', best),
+                    ('explored_nodes', explored, graph.number_of_nodes())],
+        'structure_type': ""
+    })
+    return {'path': path, 'distance': best, 'explored': explored}
+
+
+def kruskal(graph, steps, counters):
+    nodes, src, dst, weights = edge_arrays(graph)
+    order = np.argsort(weights, kind='stable')
+    src, dst, weights = src[order].tolist(), dst[order].tolist(), weights[order].tolist()
+    # Zoradené hrany aj budovaná kostra sú v trase iba raz, kroky na ne odkazujú indexom.
+    sorted_edges = [(weight, nodes[u], nodes[v]) for weight, u, v in zip(weights, src, dst)]
+    mst_edges = []
+    steps.shared.update(sorted_edges=sorted_edges, mst_edges=mst_edges)
+    # Union-find nad poľami: spájanie podľa ranku a iteratívne polovičné skracovanie ciest.
+    parent = list(range(len(nodes)))
+    rank = [0] * len(nodes)
+    union_find_ops = 0
+    total_weight = 0.0
+    target_size = len(nodes) - 1
+    stack_ref = ['sorted_edges', 0, None]
+    position = -1
+
+    for position, (u, v) in enumerate(zip(src, dst)):
+        root_u = u
+        while parent[root_u] != root_u:
+            parent[root_u] = parent[parent[root_u]]
+            root_u = parent[root_u]
+        root_v = v
+        while parent[root_v] != root_v:
+            parent[root_v] = parent[parent[root_v]]
+            root_v = parent[root_v]
+        union_find_ops += 2
+        weight, node_u, node_v = sorted_edges[position]
+        step_details = [('edge_value', node_u, node_v, weight)]
+        if root_u != root_v:
+            if rank[root_u] < rank[root_v]:
+                root_u, root_v = root_v, root_u
+            parent[root_v] = root_u
+            if rank[root_u] == rank[root_v]:
+                rank[root_u] += 1
+            union_find_ops += 1
+            mst_edges.append((node_u, node_v))
+            total_weight += weight
+            step_details.append("Hrana pridaná do MST.")
+        else:
+            step_details.append("Hrana vytvára cyklus – preskočená.")
+        steps.append({
+            'refs': {'edges': ['mst_edges', 0, len(mst_edges)], 'stack': stack_ref},
+            'details': step_details,
+            'structure_type': "Zoznam hrán"
+        })
+        if len(mst_edges) == target_size:
+            break
+
+    counters.add_counts(union_find=union_find_ops)
+    details = ["Kruskalov algoritmus dokončený. Finálne MST zostavené."]
+    if position + 1 < len(sorted_edges):
+        details.append(('kruskal_early_stop', target_size, len(sorted_edges) - position - 1))
+    steps.append({
+        'refs': {'edges': ['mst_edges', 0, len(mst_edges)]},
+        'stack': [],
+        'details': details,
+        'structure_type': " union-find štruktúra"
+    })
+    return {'edges': mst_edges, 'weight': total_weight}
+
+
+def boruvka(graph, steps, counters):
+    nodes, src, dst, weights = edge_arrays(graph)
+    selected_edges = []
+    mst_edges = []
+    steps.shared.update(boruvka_edges=selected_edges, mst_edges=mst_edges)
+    components = len(nodes)
+    total_weight = 0.0
+    round_number = 0
+    for selected, remaining in boruvka_rounds(len(nodes), src, dst, weights):
+        round_number += 1
+        start = len(selected_edges)
+        round_weights = weights[selected]
+        total_weight += float(round_weights.sum())
+        for weight, u, v in zip(round_weights.tolist(), src[selected].tolist(), dst[selected].tolist()):
+            selected_edges.append((weight, nodes[u], nodes[v]))
+            mst_edges.append((nodes[u], nodes[v]))
+        steps.append({
+            'refs': {'edges': ['mst_edges', 0, len(mst_edges)],
+                     'stack': ['boruvka_edges', start, len(selected_edges)]},
+            'details': [('boruvka_round', round_number, components, remaining),
+                        ('boruvka_selected', len(selected), total_weight)],
+            'structure_type': "Najlacnejšie hrany komponentov"
+        })
+        components = remaining
+    counters.add_counts(boruvka_rounds=round_number)
+
+    details = [('boruvka_done', round_number, len(mst_edges), total_weight)]
+    if components > 1:
+        details.append(('boruvka_forest', components))
+    steps.append({
+        'refs': {'edges': ['mst_edges', 0, len(mst_edges)]},
+        'stack': [],
+        'details': details,
+        'structure_type': ""
+    })
+    return {'edges': mst_edges, 'weight': total_weight}
+
+
+def prim(graph, steps, counters):
+    mst_nodes = set()
+    mst_edges = []
+    total_weight = 0
+    start_node = list(graph.nodes)[0]
+    mst_nodes.add(start_node)
+    priority_queue = [(graph[start_node][neighbor]['weight'], start_node, neighbor) for neighbor in graph.neighbors(start_node)]
+    pushes, pops, relaxations, scanned = len(priority_queue), 0, 0, 0
+    initial_queue = priority_queue.copy()
+    steps.append({
+        'edges': mst_edges.copy(),
+        'stack': initial_queue,
+        'details': [('prim_start', start_node), ('prim_initial_edges', initial_queue)],
+        'structure_type': "Prioritný front"
+    })
+
+    while priority_queue:
+        scanned += len(priority_queue)
+        priority_queue.sort(key=lambda x: x[0])
+        weight, u, v = priority_queue.pop(0)
+        pops += 1
+        step_details = [('edge_value', u, v, weight)]
+        added = v not in mst_nodes
+        if added:
+            mst_nodes.add(v)
+            mst_edges.append((u, v))
+            total_weight += weight
+            step_details.append(('prim_node_added', v))
+            for neighbor in graph.neighbors(v):
+                relaxations += 1
+                if neighbor not in mst_nodes:
+                    edge_weight = graph[v][neighbor]['weight']
+                    priority_queue.append((edge_weight, v, neighbor))
+                    pushes += 1
+        queue_snapshot = priority_queue.copy()
+        if added:
+            step_details.append(('prim_queue', queue_snapshot))
+        else:
+            step_details.append("Hrana vytvára cyklus – preskočená.")
+        steps.append({
+            'edges': mst_edges.copy(),
+            'stack': queue_snapshot,
+            'details': step_details,
+            'structure_type': "Prioritný front"
+        })
+
+    counters.add_counts(queue_push=pushes, queue_pop=pops, queue_scanned=scanned, edge_relaxations=relaxations)
+    steps.append({
+        'edges': mst_edges.copy(),
+        'stack': [],
+        'details': ["Primov algoritmus dokončený. Finálne MST zostavené."],
+        'structure_type': ""
+    })
+    return {'edges': mst_edges, 'weight': total_weight}
+
+
+FINE, NODE, PHASE = 0, 1, 2
+GRANULARITIES = {'fine': FINE, 'node': NODE, 'phase': PHASE}
+# Odhad počtu krokov SCC algoritmov (na vrchol, na hranu) pri jednotlivých podrobnostiach trasy.
+SCC_STEP_ESTIMATES = {'fine': (4, 1), 'node': (3, 0), 'phase': (1, 0)}
+DEFAULT_STEP_BUDGET = 200_000
+
+
+def estimate_scc_steps(graph, granularity):
+    per_node, per_edge = SCC_STEP_ESTIMATES[granularity]
+    return per_node * graph.number_of_nodes() + per_edge * graph.number_of_edges() + 2
+
+
+def choose_granularity(graph, step_budget=DEFAULT_STEP_BUDGET):
+    # Najpodrobnejšia úroveň, ktorej odhadovaný počet krokov sa zmestí do rozpočtu.
+    for granularity in ('fine', 'node'):
+        if estimate_scc_steps(graph, granularity) <= step_budget:
+            return granularity
+    return 'phase'
+
+
+class _SegmentDone(Exception):
+    pass
+
+
+class TraceFilter:
+    # Každý krok má poradové číslo v najpodrobnejšej trase. Do `steps` prejdú iba kroky
+    # zvolenej úrovne a tie si poradie pamätajú, aby sa úsek medzi nimi dal neskôr prepočítať
+    # podrobne. Pri prepočte úseku (segment) sa slovníky krokov mimo neho vôbec nevytvárajú.
+    def __init__(self, steps, granularity='fine', segment=None):
+        if granularity not in GRANULARITIES:
+            raise ValueError(f"Neznáma podrobnosť trasy: {granularity}")
+        self.steps = steps
+        self.granularity = granularity
+        self.level = GRANULARITIES[granularity]
+        self.segment = segment
+        self.position = -1
+        # Hrubšia trasa neukladá celé kópie zásobníkov; podrobná trasa a úseky áno.
+        self.coarse = self.level > FINE and segment is None
+
+    def wants(self, level):
+        self.position += 1
+        if self.segment is None:
+            return level >= self.level
+        start, stop = self.segment
+        if self.position >= stop:
+            raise _SegmentDone()
+        return self.position >= start
+
+    def append(self, step):
+        if self.level > FINE and self.segment is None:
+            step['fine_index'] = self.position
+        self.steps.append(step)
+
+
+def _scc_trace(graph, steps, granularity, segment, step_budget):
+    if segment is not None:
+        return TraceFilter(steps, 'fine', segment)
+    if granularity == 'auto':
+        granularity = choose_granularity(graph, step_budget)
+    return TraceFilter(steps, granularity)
+
+
+def kosaraju(graph, steps, counters, granularity='fine', segment=None, step_budget=DEFAULT_STEP_BUDGET):
+    trace = _scc_trace(graph, steps, granularity, segment, step_budget)
+    finish_stack = []
+    visited = set()
+    sccs = []
+    first_visits = edges = pushes = pops = 0
+    # Do zásobníka dokončených vrcholov sa vo Fáze 1 iba pridáva a vo Fáze 2 sa z neho
+    # číta od konca, preto na jeho stav kroky hrubšej trasy iba odkazujú ako Kruskal.
+    if trace.coarse:
+        steps.shared.update(kosaraju_finish=finish_stack)
+
+    def finish_snapshot(size):
+        if trace.coarse:
+            return {'refs': {'stack': ['kosaraju_finish', 0, size]}}
+        return {'stack': finish_stack[:size]}
+
+    def dfs_phase1(root):
+        nonlocal edges
+        # Iteratívne DFS s explicitným zásobníkom (vrchol, iterátor susedov), aby hlboké grafy
+        # nenarazili na limit rekurzie; poradie krokov je rovnaké ako pri rekurzívnom prechode.
+        def enter(node):
+            visited.add(node)
+            if trace.wants(NODE):
+                trace.append({
+                    'highlight': [node],
+                    **finish_snapshot(len(finish_stack)),
+                    'details': [('kosaraju_visit', node)],
+                    'structure_type': "Zásobník"
+                })
+            frames.append((node, iter(graph.neighbors(node))))
+
+        frames = []
+        enter(root)
+        while frames:
+            node, neighbors = frames[-1]
+            for neighbor in neighbors:
+                edges += 1
+                if neighbor not in visited:
+                    enter(neighbor)
+                    break
+            else:
+                frames.pop()
+                finish_stack.append(node)
+                if trace.wants(FINE):
+                    trace.append({
+                        'highlight': [node],
+                        'stack': finish_stack.copy(),
+                        'details': [('kosaraju_finished', node)],
+                        'structure_type': ""
+                    })
+
+    try:
+        for node in list(graph.nodes()):
+            if node not in visited:
+                dfs_phase1(node)
+
+        try:
+            reversed_graph = graph.reverse(copy=True)
+        except AttributeError:
+            raise ValueError("Pre Kosarajuho algoritmus je potrebný orientovaný graf.")
+
+        if trace.wants(PHASE):
+            trace.append({
+                'highlight': [],
+                **finish_snapshot(len(finish_stack)),
+                'details': ["Graf prevrátený pre Fázu 2."],
+                'structure_type': "Zásobník"
+            })
+
+        first_visits = len(visited)
+        visited.clear()
+        for top in range(len(finish_stack) - 1, -1, -1):
+            node = finish_stack[top]
+            pops += 1
+            if node not in visited:
+                scc = []
+                stack = [node]
+                pushes += 1
+                if trace.wants(FINE):
+                    trace.append({
+                        'highlight': [node],
+                        'stack': stack.copy(),
+                        'details': [('kosaraju_dfs', node)],
+                        'structure_type': "Zásobník"
+                    })
+                while stack:
+                    current = stack.pop()
+                    pops += 1
+                    if current not in visited:
+                        visited.add(current)
+                        scc.append(current)
+                        if trace.wants(NODE):
+                            if trace.coarse:
+                                # Namiesto zásobníka DFS sa odkáže na zvyšok zásobníka dokončených vrcholov.
+                                trace.append({
+                                    'highlight': [current],
+                                    **finish_snapshot(top),
+                                    'details': [('kosaraju_visit_reversed', current)],
+                                    'structure_type': "Zásobník dokončených vrcholov"
+                                })
+                            else:
+                                trace.append({
+                                    'highlight': [current],
+                                    'stack': stack.copy(),
+                                    'details': [('kosaraju_visit_reversed', current)],
+                                    'structure_type': "Zásobník"
+                                })
+                        for neighbor in reversed_graph.neighbors(current):
+                            edges += 1
+                            if neighbor not in visited:
+                                stack.append(neighbor)
+                                pushes += 1
+                                if trace.wants(FINE):
+                                    trace.append({
+                                        'highlight': [neighbor],
+                                        'stack': stack.copy(),
+                                        'details': [('kosaraju_push', neighbor)],
+                                        'structure_type': "Zásobník"
+                                    })
+                sccs.append(scc)
+                if trace.wants(PHASE):
+                    trace.append({
+                        'highlight': scc,
+                        'stack': stack.copy(),
+                        'details': [('kosaraju_scc', scc)],
+                        'structure_type': "Zásobník"
+                    })
+
+        if trace.wants(PHASE):
+            trace.append({
+                'highlight': [],
+                'stack': [],
+                'details': [('kosaraju_done', sccs)],
+                'structure_type': ""
+            })
+    except _SegmentDone:
+        pass
+    # Operácie oboch zásobníkov: dokončených vrcholov (Fáza 1 pridáva, Fáza 2 vyberá) a DFS vo Fáze 2.
+    counters.add_counts(dfs_visits=first_visits + len(visited), edges_scanned=edges,
+                        stack_push=len(finish_stack) + pushes, stack_pop=pops)
+    return {'components': sccs, 'granularity': trace.granularity}
+
+
+def tarjan(graph, steps, counters, granularity='fine', segment=None, step_budget=DEFAULT_STEP_BUDGET):
+    trace = _scc_trace(graph, steps, granularity, segment, step_budget)
+    index = 0
+    stack = []
+    indices = {}
+    low_link = {}
+    on_stack = set()
+    sccs = []
+    frames = []
+    edges = 0
+    # Zásobník Tarjana sa mení na konci, kroky hrubšej trasy preto nesú iba zmenu:
+    # pridaný vrchol alebo vyradený komponent.
+
+    def enter(node):
+        nonlocal index
+        indices[node] = index
+        low_link[node] = index
+        index += 1
+        stack.append(node)
+        on_stack.add(node)
+        if trace.wants(NODE):
+            trace.append({
+                'highlight': [node],
+                'stack': [node] if trace.coarse else stack.copy(),
+                'details': [('tarjan_push', node, indices[node], low_link[node])],
+                'structure_type': "Pridané na zásobník" if trace.coarse else "Zásobník"
+            })
+        frames.append((node, iter(graph.neighbors(node))))
+
+    def close(node):
+        if low_link[node] == indices[node]:
+            scc = []
+            if trace.wants(FINE):
+                trace.append({
+                    'highlight': [node],
+                    'stack': stack.copy(),
+                    'details': [('tarjan_root', node)],
+                    'structure_type': "Zásobník"
+                })
+            while True:
+                w = stack.pop()
+                on_stack.remove(w)
+                scc.append(w)
+                if trace.wants(FINE):
+                    trace.append({
+                        'highlight': [w],
+                        'stack': stack.copy(),
+                        'details': [('tarjan_pop', w, scc.copy())],
+                        'structure_type': "Zásobník"
+                    })
+                if w == node:
+                    break
+            sccs.append(scc)
+            if trace.wants(PHASE):
+                trace.append({
+                    'highlight': scc,
+                    'stack': scc if trace.coarse else stack.copy(),
+                    'details': [('tarjan_scc', scc)],
+                    'structure_type': "Vyradené zo zásobníka" if trace.coarse else "Zásobník"
+                })
+
+    def strong_connect(root):
+        # Iteratívne DFS s explicitným zásobníkom (vrchol, iterátor susedov); po návrate
+        # z potomka sa low-link rodiča aktualizuje rovnako ako za rekurzívnym volaním.
+        nonlocal edges
+        enter(root)
+        while frames:
+            node, neighbors = frames[-1]
+            for neighbor in neighbors:
+                edges += 1
+                if neighbor not in indices:
+                    if trace.wants(FINE):
+                        trace.append({
+                            'highlight': [neighbor],
+                            'stack': stack.copy(),
+                            'details': [('tarjan_descend', neighbor, node)],
+                            'structure_type': "Zásobník"
+                        })
+                    enter(neighbor)
+                    break
+                elif neighbor in on_stack:
+                    low_link[node] = min(low_link[node], indices[neighbor])
+                    if trace.wants(FINE):
+                        trace.append({
+                            'highlight': [node, neighbor],
+                            'stack': stack.copy(),
+                            'details': [('tarjan_lowlink_stack', neighbor, node, low_link[node])],
+                            'structure_type': "Zásobník"
+                        })
+            else:
+                frames.pop()
+                close(node)
+                if frames:
+                    parent = frames[-1][0]
+                    low_link[parent] = min(low_link[parent], low_link[node])
+                    if trace.wants(FINE):
+                        trace.append({
+                            'highlight': [parent],
+                            'stack': stack.copy(),
+                            'details': [('tarjan_lowlink_child', parent, low_link[parent], node)],
+                            'structure_type': "Zásobník"
+                        })
+
+    try:
+        for node in list(graph.nodes()):
+            if node not in indices:
+                strong_connect(node)
+
+        if trace.wants(PHASE):
+            trace.append({
+                'highlight': [],
+                'stack': [],
+                'details': [('tarjan_done', sccs)],
+                'structure_type': ""
+            })
+    except _SegmentDone:
+        pass
+    # Každý navštívený vrchol sa raz pridá na zásobník; vyradené sú všetky okrem zvyšku pri prerušení úseku.
+    counters.add_counts(dfs_visits=index, edges_scanned=edges, stack_push=index, stack_pop=index - len(stack))
+    return {'components': sccs, 'granularity': trace.granularity}
@@ -0,0 +1,163 @@
+import heapq
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+MAX_NODES = 6000
+FLOYD_WARSHALL_MAX_NODES = 400
+FLOYD_WARSHALL_MIN_DENSITY = 0.1
+PARALLEL_MIN_NODES = 300
+
+_worker = {}
+
+
+class AllPairsResult:
+    # Matica vzdialeností a matica prvých krokov: next_hop[i, j] je index
+    # vrcholu, ktorým začína najkratšia cesta z i do j (-1 ak cesta neexistuje).
+    def __init__(self, nodes, dist, next_hop, method):
+        self.nodes = list(nodes)
+        self.index = {node: i for i, node in enumerate(self.nodes)}
+        self.dist = dist
+        self.next_hop = next_hop
+        self.method = method
+
+    def distance(self, source, target):
+        return float(self.dist[self.index[source], self.index[target]])
+
+    def path(self, source, target):
+        i, j = self.index[source], self.index[target]
+        if self.next_hop[i, j] < 0:
+            return []
+        path = [source]
+        while i != j:
+            i = int(self.next_hop[i, j])
+            path.append(self.nodes[i])
+        return path
+
+
+def _edge_arrays(arrays):
+    src = np.repeat(np.arange(arrays.n), np.diff(arrays.indptr))
+    return src, arrays.indices, arrays.weights
+
+
+def floyd_warshall(arrays):
+    n = arrays.n
+    src, dst, weights = _edge_arrays(arrays)
+    dist = np.full((n, n), np.inf)
+    np.fill_diagonal(dist, 0.0)
+    # Pri paralelných hranách zostáva najlacnejšia.
+    np.minimum.at(dist, (src, dst), weights)
+    next_hop = np.full((n, n), -1, dtype=np.int64)
+    next_hop[src, dst] = dst
+    np.fill_diagonal(next_hop, np.arange(n))
+    for k in range(n):
+        # Celý riadok matice sa relaxuje naraz cez vrchol k.
+        via = dist[:, k, None] + dist[None, k, :]
+        better = via < dist
+        if better.any():
+            dist[better] = via[better]
+            next_hop[better] = np.broadcast_to(next_hop[:, k, None], (n, n))[better]
+    if (np.diag(dist) < 0).any():
+        raise ValueError("Graf obsahuje záporný cyklus.")
+    return dist, next_hop
+
+
+def johnson_potentials(arrays):
+    # Bellman-Ford z pomocného vrcholu spojeného so všetkými vrcholmi hranou 0.
+    src, dst, weights = _edge_arrays(arrays)
+    potentials = np.zeros(arrays.n)
+    if not len(weights) or weights.min() >= 0:
+        return potentials
+    for _ in range(arrays.n):
+        candidate = potentials.copy()
+        np.minimum.at(candidate, dst, potentials[src] + weights)
+        if np.array_equal(candidate, potentials):
+            return potentials
+        potentials = candidate
+    raise ValueError("Graf obsahuje záporný cyklus.")
+
+
+def _dijkstra_row(indptr, indices, weights, n, source):
+    distances = [float('inf')] * n
+    first = [-1] * n
+    distances[source] = 0.0
+    first[source] = source
+    heap = [(0.0, source)]
+    while heap:
+        distance, node = heapq.heappop(heap)
+        if distance > distances[node]:
+            continue
+        for position in range(indptr[node], indptr[node + 1]):
+            neighbor = indices[position]
+            candidate = distance + weights[position]
+            if candidate < distances[neighbor]:
+                distances[neighbor] = candidate
+                first[neighbor] = neighbor if node == source else first[node]
+                heapq.heappush(heap, (candidate, neighbor))
+    return distances, first
+
+
+def _init_worker(indptr, indices, weights, n):
+    _worker.update(indptr=indptr, indices=indices, weights=weights, n=n)
+
+
+def _dijkstra_rows(sources):
+    rows = [_dijkstra_row(_worker['indptr'], _worker['indices'], _worker['weights'], _worker['n'], source)
+            for source in sources]
+    return sources, rows
+
+
+def johnson(arrays, workers=None):
+    n = arrays.n
+    potentials = johnson_potentials(arrays)
+    src, dst, weights = _edge_arrays(arrays)
+    # Preváhovanie w'(u, v) = w(u, v) + h(u) - h(v) je nezáporné; zaokrúhlenie orezávame na 0.
+    reweighted = np.maximum(weights + potentials[src] - potentials[dst], 0.0)
+    lists = (arrays.indptr.tolist(), arrays.indices.tolist(), reweighted.tolist(), n)
+    dist = np.empty((n, n))
+    next_hop = np.empty((n, n), dtype=np.int64)
+
+    def store(sources, rows):
+        for source, (distances, first) in zip(sources, rows):
+            dist[source] = distances
+            next_hop[source] = first
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or n < PARALLEL_MIN_NODES:
+        _init_worker(*lists)
+        store(*_dijkstra_rows(range(n)))
+        _worker.clear()
+    else:
+        chunk = max(1, n // (workers * 4))
+        chunks = [range(start, min(n, start + chunk)) for start in range(0, n, chunk)]
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                 initializer=_init_worker, initargs=lists) as executor:
+            for sources, rows in executor.map(_dijkstra_rows, chunks):
+                store(sources, rows)
+    # Späť na pôvodné váhy: d(u, v) = d'(u, v) - h(u) + h(v).
+    dist += potentials[None, :] - potentials[:, None]
+    return dist, next_hop
+
+
+def choose_method(arrays):
+    density = len(arrays.indices) / max(1, arrays.n * arrays.n)
+    if arrays.n <= FLOYD_WARSHALL_MAX_NODES or density >= FLOYD_WARSHALL_MIN_DENSITY:
+        return "floyd-warshall"
+    return "johnson"
+
+
+def all_pairs_shortest_paths(arrays, method="auto", workers=None):
+    if arrays.n > MAX_NODES:
+        raise ValueError(f"Matica vzdialeností pre {arrays.n} vrcholov by bola príliš veľká (limit {MAX_NODES}).")
+    if method == "auto":
+        method = choose_method(arrays)
+    if method == "floyd-warshall":
+        dist, next_hop = floyd_warshall(arrays)
+    elif method == "johnson":
+        dist, next_hop = johnson(arrays, workers)
+    else:
+        raise ValueError(f"Neznáma metóda: {method}")
+    return AllPairsResult(arrays.nodes, dist, next_hop, method)
@@ -0,0 +1,320 @@
+import argparse
+import csv
+import hashlib
+import json
+import multiprocessing
+import os
+import sys
+import time
+
+import algorithms
+from graph_arrays import GraphArrays
+from graph_io import load_graph
+from heuristics import EuclideanHeuristic
+from instrumentation import Instrumentation
+from trace_io import save_trace, graph_fingerprint
+from trace_store import TraceStore, DEFAULT_MEMORY_BUDGET_MB, DEFAULT_DISK_BUDGET_MB
+
+PATH_ALGORITHMS = ("dijkstra", "delta-stepping", "bellman-ford", "astar", "bidirectional", "bidirectional-astar")
+WHOLE_GRAPH_ALGORITHMS = ("kruskal", "boruvka", "prim", "kosaraju", "tarjan")
+NON_NEGATIVE = ("dijkstra", "delta-stepping", "astar", "bidirectional", "bidirectional-astar",
+                "kruskal", "boruvka", "prim")
+DIRECTED_ONLY = ("kosaraju", "tarjan")
+
+
+def read_pairs(file_path):
+    # CSV s dvojicami (zdroj, cieľ); hlavička sa rozpozná automaticky, kratšie riadky sa preskočia.
+    pairs = []
+    with open(file_path, newline='', encoding='utf-8-sig') as file:
+        sample = file.read(64 * 1024)
+        file.seek(0)
+        sniffer = csv.Sniffer()
+        try:
+            dialect = sniffer.sniff(sample, delimiters=",;\t ")
+            skip_header = sniffer.has_header(sample)
+        except csv.Error:
+            dialect = csv.excel
+            skip_header = False
+        for row in csv.reader(file, dialect):
+            row = [value.strip() for value in row if value.strip()]
+            if len(row) < 2:
+                continue
+            if skip_header:
+                skip_header = False
+                continue
+            pairs.append((row[0], row[1]))
+    return pairs
+
+
+def resolve_node(graph, value):
+    if value in graph:
+        return value
+    try:
+        number = int(value)
+    except ValueError:
+        number = None
+    if number in graph:
+        return number
+    raise ValueError(f"Vrchol {value} v grafe neexistuje.")
+
+
+def _arrays(graph, positions, cache):
+    if 'arrays' not in cache:
+        # Bez uložených súradníc dáva euklidovská heuristika nulové odhady, ostáva prípustná.
+        cache['arrays'] = GraphArrays.from_networkx(graph, positions or {node: (0.0, 0.0) for node in graph})
+    return cache['arrays']
+
+
+def run_algorithm(algo, graph, positions, steps, counters, source=None, target=None, cache=None, delta=None,
+                  granularity="fine"):
+    cache = {} if cache is None else cache
+    if algo == "dijkstra":
+        return algorithms.dijkstra(graph, steps, counters, source, target, early_exit=True)
+    if algo == "delta-stepping":
+        return algorithms.delta_stepping(_arrays(graph, positions, cache), steps, counters, source, target, delta, True)
+    if algo == "bellman-ford":
+        return algorithms.bellman_ford(graph, steps, counters, source, target)
+    if algo in ("astar", "bidirectional-astar"):
+        arrays = _arrays(graph, positions, cache)
+        heuristic = cache.setdefault('heuristic', EuclideanHeuristic(arrays))
+        if algo == "astar":
+            return algorithms.astar(graph, steps, counters, source, target, arrays, heuristic)
+        return algorithms.bidirectional(graph, steps, counters, source, target, arrays, heuristic)
+    if algo == "bidirectional":
+        return algorithms.bidirectional(graph, steps, counters, source, target)
+    if algo == "kruskal":
+        return algorithms.kruskal(graph, steps, counters)
+    if algo == "boruvka":
+        return algorithms.boruvka(graph, steps, counters)
+    if algo == "prim":
+        return algorithms.prim(graph, steps, counters)
+    if algo == "kosaraju":
+        return algorithms.kosaraju(graph, steps, counters, granularity)
+    if algo == "tarjan":
+        return algorithms.tarjan(graph, steps, counters, granularity)
+    raise ValueError(f"Neznámy algoritmus: {algo}")
+
+
+def _trace_path(trace_dir, file_path, algo, source, target):
+    name = f"{os.path.basename(file_path)}.{algo}"
+    if source is not None:
+        name += f".{source}-{target}"
+    return os.path.join(trace_dir, name + ".gvtrace")
+
+
+def _error_message(error):
+    # Naše chyby (ValueError) majú slovenský text, pri ostatných sa uvedie aj typ výnimky.
+    if isinstance(error, ValueError):
+        return str(error)
+    return f"{type(error).__name__}: {error}" if str(error) else type(error).__name__
+
+
+def _run(options, file_path, graph, positions, cache, source=None, target=None):
+    algo = options['algo']
+    record = {'file': file_path, 'algo': algo}
+    if source is not None:
+        record.update(source=source, target=target)
+    counters = Instrumentation()
+    counters.enabled = True
+    trace_dir = options.get('trace_dir')
+    # Bez ukladania trás sa kroky iba počítajú, pamäť procesu nerastie s dĺžkou trasy.
+    if trace_dir:
+        steps = TraceStore(options['memory_budget'], disk_budget_mb=options.get('disk_budget', DEFAULT_DISK_BUDGET_MB),
+                           measure=options.get('measure', "estimate"))
+    else:
+        steps = algorithms.StepCounter()
+    started = time.perf_counter()
+    try:
+        try:
+            if source is not None:
+                source, target = resolve_node(graph, source), resolve_node(graph, target)
+            result = run_algorithm(algo, graph, positions, steps, counters, source, target, cache,
+                                   options.get('delta'), options.get('granularity', "fine"))
+            record['status'] = "ok"
+            record.update(result)
+        except Exception as e:
+            # Pád jedného behu (hĺbka rekurzie, pamäť, disk) sa zapíše ako chyba, dávka pokračuje.
+            result = None
+            record.update(status="error", error=_error_message(e))
+        record['time_s'] = time.perf_counter() - started
+        record['steps'] = len(steps)
+        record['counters'] = counters.counters
+        if isinstance(steps, TraceStore):
+            record['trace_memory'] = steps.finish()
+        if trace_dir and result is not None:
+            trace_path = _trace_path(trace_dir, file_path, algo, record.get('source'), record.get('target'))
+            try:
+                header = {
+                    'title': f"{algo}: {os.path.basename(file_path)}",
+                    'pseudocode': "",
+                    'fingerprint': cache.setdefault('fingerprint', graph_fingerprint(graph, positions)),
+                    'directed': graph.is_directed(),
+                    'show_weights': True,
+                    'steps': len(steps),
+                }
+                save_trace(trace_path, steps, header)
+                record['trace'] = trace_path
+            except Exception as e:
+                record.update(status="error", error=f"Uloženie trasy zlyhalo: {_error_message(e)}")
+    finally:
+        # Kroky presunuté na disk sa zmažú aj pri chybe.
+        if isinstance(steps, TraceStore):
+            steps.close()
+    return record
+
+
+def process_file(task):
+    # Beží v pracovnom procese: načíta jeden graf a vykoná všetky behy nad ním.
+    file_path, options, pairs = task
+    started = time.perf_counter()
+    try:
+        graph, positions = load_graph(file_path, options.get('directed'))
+    except Exception as e:
+        return file_path, [{'file': file_path, 'status': "error", 'error': f"Načítanie grafu zlyhalo: {e}"}]
+    algo = options['algo']
+    load_time = time.perf_counter() - started
+    records = []
+    try:
+        if algo in NON_NEGATIVE and algorithms.contains_negative_edge(graph):
+            records.append({'file': file_path, 'algo': algo, 'status': "error",
+                            'error': "Tento algoritmus nepracuje so zápornými hranami."})
+        elif algo in DIRECTED_ONLY and not graph.is_directed():
+            records.append({'file': file_path, 'algo': algo, 'status': "error",
+                            'error': "Algoritmus vyžaduje orientovaný graf."})
+        elif algo in WHOLE_GRAPH_ALGORITHMS:
+            records.append(_run(options, file_path, graph, positions, {}))
+        else:
+            cache = {}
+            for source, target in pairs:
+                records.append(_run(options, file_path, graph, positions, cache, source, target))
+    except Exception as e:
+        # Súbor sa aj tak označí ako hotový, inak by ho každé obnovenie spúšťalo a padalo znova.
+        records.append({'file': file_path, 'algo': algo, 'status': "error", 'error': _error_message(e)})
+    for record in records:
+        record['load_time_s'] = load_time
+        record['nodes'] = graph.number_of_nodes()
+        record['edges'] = graph.number_of_edges()
+    return file_path, records
+
+
+def options_key(options, pairs):
+    # Nastavenia, ktoré menia výsledky behov; obnovenie preskočí iba súbory hotové s rovnakými.
+    relevant = {name: options.get(name) for name in ('algo', 'directed', 'delta', 'granularity')}
+    relevant['pairs'] = [list(pair) for pair in pairs]
+    return hashlib.sha1(json.dumps(relevant, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def completed_files(output_path, key=None):
+    # Súbor je hotový až po zázname "done"; čiastočné výsledky po páde sa zopakujú.
+    # Vracia hotové súbory s kľúčom nastavení `key` a počet hotových s inými nastaveniami.
+    done = set()
+    other = 0
+    if not os.path.exists(output_path):
+        return done, other
+    with open(output_path, encoding='utf-8') as file:
+        for line in file:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if record.get('status') == "done":
+                if record.get('options') == key:
+                    done.add((record['file'], record.get('algo')))
+                else:
+                    other += 1
+    return done, other
+
+
+def _json_default(value):
+    if hasattr(value, 'item'):
+        return value.item()
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    return str(value)
+
+
+def write_records(output, file_path, algo, records, key=None):
+    for record in records:
+        record['options'] = key
+    lines = [json.dumps(record, ensure_ascii=False, default=_json_default) for record in records]
+    lines.append(json.dumps({'file': file_path, 'algo': algo, 'status': "done", 'runs': len(records),
+                             'options': key}, ensure_ascii=False))
+    output.write("\n".join(lines) + "\n")
+    output.flush()
+    os.fsync(output.fileno())
+
+
+def run_batch(files, options, pairs, output_path, workers=None, max_tasks_per_child=1, resume=True, log=print):
+    key = options_key(options, pairs)
+    done, other = completed_files(output_path, key) if resume else (set(), 0)
+    pending = [file_path for file_path in files if (file_path, options['algo']) not in done]
+    if len(pending) < len(files):
+        log(f"Preskakujem {len(files) - len(pending)} už spracovaných súborov.")
+    if other:
+        log(f"Výstup obsahuje {other} súborov spracovaných s inými nastaveniami; tie sa nepreskakujú.")
+    tasks = [(file_path, options, pairs) for file_path in pending]
+    workers = max(1, min(workers or os.cpu_count() or 1, len(tasks) or 1))
+    mode = 'a' if resume else 'w'
+    with open(output_path, mode, encoding='utf-8') as output:
+        pool = None
+        if workers == 1:
+            results = map(process_file, tasks)
+        else:
+            # Proces sa po niekoľkých súboroch vymení, aby pamäť pracovníka nerástla.
+            pool = multiprocessing.Pool(workers, maxtasksperchild=max_tasks_per_child)
+            results = pool.imap_unordered(process_file, tasks)
+        try:
+            for count, (file_path, records) in enumerate(results, 1):
+                write_records(output, file_path, options['algo'], records, key)
+                failed = sum(1 for record in records if record.get('status') != "ok")
+                log(f"[{count}/{len(tasks)}] {file_path}: {len(records)} behov, {failed} chýb")
+        finally:
+            if pool is not None:
+                pool.terminate()
+                pool.join()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="GraphViz.py batch",
+                                     description="Dávkové spustenie algoritmu nad viacerými grafmi bez grafického rozhrania.")
+    parser.add_argument("files", nargs="+", help="súbory s grafmi (natívny .txt, DIMACS, SNAP, CSV, GraphML)")
+    parser.add_argument("--algo", required=True, choices=PATH_ALGORITHMS + WHOLE_GRAPH_ALGORITHMS)
+    parser.add_argument("--pairs", help="CSV s dvojicami zdroj, cieľ (pre algoritmy najkratšej cesty)")
+    parser.add_argument("--output", default="batch_results.jsonl", help="výstupný súbor JSONL")
+    parser.add_argument("--workers", type=int, default=None, help="počet pracovných procesov")
+    parser.add_argument("--max-tasks-per-child", type=int, default=1,
+                        help="počet súborov, po ktorých sa pracovný proces vymení")
+    parser.add_argument("--directed", action=argparse.BooleanOptionalAction, default=None,
+                        help="považovať grafy za orientované alebo neorientované (inak podľa formátu súboru)")
+    parser.add_argument("--delta", type=float, default=None, help="šírka koša pre delta-stepping")
+    parser.add_argument("--granularity", choices=("auto", "fine", "node", "phase"), default="fine",
+                        help="podrobnosť trasy Kosarajuho a Tarjanovho algoritmu")
+    parser.add_argument("--trace-dir", help="adresár, do ktorého sa uložia trasy .gvtrace")
+    parser.add_argument("--memory-budget", type=int, default=DEFAULT_MEMORY_BUDGET_MB,
+                        help="pamäť pre kroky jednej trasy v MB, zvyšok sa presúva na disk")
+    parser.add_argument("--disk-budget", type=int, default=DEFAULT_DISK_BUDGET_MB,
+                        help="najväčšia veľkosť jednej trasy na disku v MB, potom sa záznam zastaví")
+    parser.add_argument("--tracemalloc", action="store_true",
+                        help="merať pamäť trás cez tracemalloc namiesto odhadu podľa veľkosti krokov")
+    parser.add_argument("--no-resume", action="store_true", help="začať odznova a prepísať výstup")
+    args = parser.parse_args(argv)
+
+    pairs = []
+    if args.algo in PATH_ALGORITHMS:
+        if not args.pairs:
+            parser.error(f"Algoritmus {args.algo} vyžaduje --pairs.")
+        pairs = read_pairs(args.pairs)
+        if not pairs:
+            parser.error(f"Súbor {args.pairs} neobsahuje žiadne dvojice vrcholov.")
+    if args.trace_dir:
+        os.makedirs(args.trace_dir, exist_ok=True)
+    options = {'algo': args.algo, 'directed': args.directed, 'delta': args.delta, 'granularity': args.granularity,
+               'trace_dir': args.trace_dir, 'memory_budget': args.memory_budget, 'disk_budget': args.disk_budget,
+               'measure': "tracemalloc" if args.tracemalloc else "estimate"}
+    run_batch(args.files, options, pairs, args.output, args.workers, args.max_tasks_per_child,
+              resume=not args.no_resume)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
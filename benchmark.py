@@ -0,0 +1,118 @@
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+from delta_stepping import DeltaStepping, suggest_delta
+from graph_arrays import GraphArrays, dijkstra_distances
+from show_grafy import generate_road_graph
+
+
+def best_time(function, repeat):
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def benchmark_sssp(sizes, factors, repeat=3, seed=0):
+    rows = []
+    for n in sizes:
+        graph, positions = generate_road_graph(n, seed=seed)
+        arrays = GraphArrays.from_networkx(graph, positions)
+        source = 0
+        baseline, reference = best_time(lambda: dijkstra_distances(arrays, source), repeat)
+        rows.append((n, len(arrays.indices), "dijkstra", "-", "-", baseline, 1.0))
+        for factor in factors:
+            delta = suggest_delta(arrays) * factor
+            algorithm = DeltaStepping(arrays, delta)
+            elapsed, distances = best_time(lambda: algorithm.distances(source), repeat)
+            if not np.allclose(distances, reference, equal_nan=True):
+                raise AssertionError(f"Delta-stepping (delta={delta:g}) dáva iné vzdialenosti ako Dijkstra.")
+            phases = sum(1 for _ in algorithm.phases(source))
+            rows.append((n, len(arrays.indices), "delta-stepping", f"{delta:.4g}", phases, elapsed, baseline / elapsed))
+    return rows
+
+
+# Čo sa importuje pri štarte: GUI nesmie pred zobrazením okna načítať ťažké knižnice
+# a dávkové nástroje nesmú načítať Tk ani matplotlib vôbec.
+STARTUP_TARGETS = [
+    ("GraphViz (pred zobrazením okna)", "import GraphViz", ("networkx", "matplotlib", "numpy")),
+    ("dávkový režim", "import batch", ("tkinter", "matplotlib")),
+    ("benchmark", "import benchmark", ("tkinter", "matplotlib")),
+]
+
+
+def import_profile(statement):
+    # Spracuje výstup `python -X importtime`: kumulatívny čas každého modulu v mikrosekundách.
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", statement], capture_output=True,
+                               text=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+    if completed.returncode:
+        raise RuntimeError(completed.stderr.strip().splitlines()[-1])
+    modules = {}
+    top_level = {}
+    direct = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # Odsadenie o dve medzery zodpovedá jednej úrovni vnorenia importu.
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        name = name.strip()
+        modules[name] = int(cumulative)
+        if depth == 0:
+            top_level[name] = int(cumulative)
+        elif depth == 1:
+            direct[name] = int(cumulative)
+    return modules, top_level, direct
+
+
+def check_startup(budget_ms=None):
+    rows = []
+    for title, statement, forbidden in STARTUP_TARGETS:
+        modules, top_level, direct = import_profile(statement)
+        total_ms = sum(top_level.values()) / 1000
+        problems = [f"načítaný {name}" for name in forbidden if name in modules]
+        if budget_ms is not None and total_ms > budget_ms:
+            problems.append(f"{total_ms:.0f} ms > {budget_ms:.0f} ms")
+        heaviest = sorted(direct.items(), key=lambda item: -item[1])[:3]
+        rows.append((title, total_ms, heaviest, problems))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Porovnanie Dijkstrovho algoritmu a delta-steppingu na cestných sieťach.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 500000])
+    parser.add_argument("--delta", type=float, nargs="+", default=[0.25, 1.0, 4.0, 16.0],
+                        help="násobky priemernej váhy hrany použité ako šírka koša")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--startup", action="store_true",
+                        help="namiesto porovnania algoritmov zmerať čas importov pri štarte (-X importtime)")
+    parser.add_argument("--startup-budget", type=float, default=None,
+                        help="maximálny čas importov jedného cieľa v ms")
+    args = parser.parse_args()
+
+    if args.startup:
+        failed = False
+        for title, total_ms, heaviest, problems in check_startup(args.startup_budget):
+            modules = ", ".join(f"{name} {cumulative / 1000:.0f} ms" for name, cumulative in heaviest)
+            print(f"{title:<32} {total_ms:>8.1f} ms   {modules}")
+            for problem in problems:
+                print(f"    CHYBA: {problem}")
+            failed = failed or bool(problems)
+        sys.exit(1 if failed else 0)
+
+    print(f"{'vrcholy':>9} {'hrany':>9} {'algoritmus':<15} {'delta':>8} {'fázy':>6} {'čas [s]':>9} {'zrýchlenie':>10}")
+    for n, m, name, delta, phases, elapsed, speedup in benchmark_sssp(args.sizes, args.delta, args.repeat, args.seed):
+        print(f"{n:>9} {m:>9} {name:<15} {delta:>8} {phases:>6} {elapsed:>9.3f} {speedup:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
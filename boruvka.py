@@ -0,0 +1,46 @@
+import numpy as np
+
+
+def boruvka_rounds(n, src, dst, weights):
+    # Každé kolo nájde pre všetky komponenty naraz najlacnejšiu vychádzajúcu hranu
+    # a komponenty pozdĺž nich zlúči. Vracia indexy vybraných hrán a počet komponentov.
+    m = len(src)
+    order = np.argsort(weights, kind='stable')
+    # Poradie podľa (váha, index) je úplné, takže vybrané hrany nikdy nevytvoria cyklus.
+    rank = np.empty(m, dtype=np.int64)
+    rank[order] = np.arange(m)
+    comp = np.arange(n)
+    edges = np.arange(m)
+    components = n
+    while True:
+        cu = comp[src[edges]]
+        cv = comp[dst[edges]]
+        outgoing = cu != cv
+        # Hrany vo vnútri komponentu už nikdy nebudú potrebné.
+        edges, cu, cv = edges[outgoing], cu[outgoing], cv[outgoing]
+        if not len(edges):
+            return
+        best = np.full(n, m, dtype=np.int64)
+        np.minimum.at(best, cu, rank[edges])
+        np.minimum.at(best, cv, rank[edges])
+        active = np.flatnonzero(best < m)
+        chosen = order[best[active]]
+        endpoint = comp[src[chosen]]
+        other = np.where(endpoint == active, comp[dst[chosen]], endpoint)
+
+        # Každý komponent ukáže na suseda cez svoju hranu; vzájomné dvojice
+        # rozbijeme menším identifikátorom a zvyšok dorovnáme preskakovaním ukazovateľov.
+        parent = np.arange(n)
+        parent[active] = other
+        mutual = (parent[other] == active) & (active < other)
+        parent[active[mutual]] = active[mutual]
+        while True:
+            jumped = parent[parent]
+            if np.array_equal(jumped, parent):
+                break
+            parent = jumped
+        comp = parent[comp]
+
+        selected = np.unique(chosen)
+        components -= len(selected)
+        yield selected, components
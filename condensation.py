@@ -0,0 +1,131 @@
+import math
+from itertools import chain
+
+import networkx as nx
+import numpy as np
+
+from positions import PositionStore
+
+
+class Condensation:
+    # Graf zložený podľa SCC: každá komponenta je jeden super-vrchol v ťažisku svojich vrcholov
+    # a všetky hrany medzi dvoma komponentmi sa zlúčia do jednej hrany DAG s ich počtom.
+    # Rozbalená komponenta sa zobrazí po vrcholoch na ich pôvodných miestach.
+    def __init__(self, graph, positions, components):
+        self.graph = graph
+        self.positions = positions
+        self.components = [list(component) for component in components]
+        k = len(self.components)
+        self.component_of = {node: i for i, component in enumerate(self.components) for node in component}
+        nodes = list(graph.nodes())
+        labels = np.fromiter((self.component_of[node] for node in nodes), dtype=np.int64, count=len(nodes))
+        if isinstance(positions, PositionStore):
+            xy = positions.coords(nodes)
+        else:
+            xy = np.array([(pos[0], pos[1]) for pos in map(positions.__getitem__, nodes)],
+                          dtype=np.float64).reshape(-1, 2)
+        self.sizes = np.bincount(labels, minlength=k)
+        counts = np.maximum(self.sizes, 1)
+        self.centers = np.column_stack((np.bincount(labels, xy[:, 0], k) / counts,
+                                        np.bincount(labels, xy[:, 1], k) / counts))
+
+        index = {node: i for i, node in enumerate(nodes)}
+        edges = list(graph.edges())
+        ends = np.fromiter(map(index.__getitem__, chain.from_iterable(edges)), dtype=np.int64, count=2 * len(edges))
+        cu, cv = labels[ends[0::2]], labels[ends[1::2]]
+        between = cu != cv
+        pairs, multiplicity = np.unique(cu[between] * k + cv[between], return_counts=True)
+        self.dag_edges = list(zip((pairs // k).tolist(), (pairs % k).tolist(), multiplicity.tolist()))
+
+        # Veľkosť super-vrcholu rastie s odmocninou počtu vrcholov, aby plocha zodpovedala veľkosti SCC.
+        self.base_radius = min(0.5, 0.4 * math.sqrt(400 / max(1, k)))
+        self.radii = self.base_radius * np.minimum(np.sqrt(counts), 4.0)
+        self.expanded = set()
+
+    def __len__(self):
+        return len(self.components)
+
+    def is_component(self, item):
+        return isinstance(item, tuple) and len(item) == 2 and item[0] == 'SCC' and item not in self.component_of
+
+    def _display(self, node):
+        i = self.component_of[node]
+        return node if i in self.expanded else ('SCC', i)
+
+    def display(self):
+        # Zobrazovaný graf: zbalené komponenty ako super-vrcholy, rozbalené po vrcholoch.
+        view = nx.DiGraph()
+        positions, radius, colors, labels = {}, {}, {}, {}
+        for i, component in enumerate(self.components):
+            if i in self.expanded:
+                for node in component:
+                    view.add_node(node)
+                    pos = self.positions[node]
+                    positions[node] = (float(pos[0]), float(pos[1]))
+                    radius[node] = self.base_radius
+                    colors[node] = i
+                    labels[node] = str(node)
+            else:
+                key = ('SCC', i)
+                view.add_node(key)
+                positions[key] = tuple(self.centers[i].tolist())
+                radius[key] = float(self.radii[i])
+                colors[key] = i
+                labels[key] = str(component[0]) if len(component) == 1 else f"{len(component)}"
+        for a, b, count in self.dag_edges:
+            if a not in self.expanded and b not in self.expanded:
+                view.add_edge(('SCC', a), ('SCC', b), weight=count)
+        # Hrany rozbalených komponent sa prejdú iba od ich vrcholov, nie cez celý graf.
+        for i in self.expanded:
+            for node in self.components[i]:
+                incident = chain(self.graph.out_edges(node), self.graph.in_edges(node))
+                for u, v in incident:
+                    a, b = self._display(u), self._display(v)
+                    if a == b or (u != node and self.component_of[u] in self.expanded):
+                        continue
+                    if view.has_edge(a, b):
+                        view.edges[a, b]['weight'] += 1
+                    else:
+                        view.add_edge(a, b, weight=1)
+        return {'graph': view, 'positions': positions, 'radius': radius, 'colors': colors, 'labels': labels}
+
+    def find(self, x, y):
+        # Vrcholy rozbalených komponent sa kreslia navrchu, preto majú pri kliknutí prednosť.
+        best, best_dist = None, self.base_radius
+        for i in self.expanded:
+            for node in self.components[i]:
+                pos = self.positions[node]
+                d = math.hypot(pos[0] - x, pos[1] - y)
+                if d <= best_dist:
+                    best, best_dist = node, d
+        if best is not None:
+            return best
+        collapsed = np.ones(len(self.components), dtype=bool)
+        collapsed[list(self.expanded)] = False
+        dist = np.hypot(self.centers[:, 0] - x, self.centers[:, 1] - y)
+        hit = np.flatnonzero(collapsed & (dist <= self.radii))
+        if len(hit):
+            return ('SCC', int(hit[np.argmin(dist[hit])]))
+        return None
+
+    def toggle(self, item):
+        # Klik na super-vrchol ho rozbalí, klik na vrchol rozbalenej komponenty ju zbalí.
+        if self.is_component(item):
+            self.expanded.add(item[1])
+            return item[1], True
+        i = self.component_of[item]
+        self.expanded.discard(i)
+        return i, False
+
+    def position(self, item):
+        if self.is_component(item):
+            return tuple(self.centers[item[1]].tolist())
+        return self.positions[item]
+
+    def describe(self, item):
+        if self.is_component(item):
+            i = item[1]
+            members = self.components[i]
+            preview = ", ".join(map(str, members[:8])) + (", ..." if len(members) > 8 else "")
+            return f"SCC {i + 1}: {len(members)} vrcholov\n{preview}"
+        return f"vrchol: {item}\nSCC {self.component_of[item] + 1}"
@@ -0,0 +1,133 @@
+import heapq
+
+import numpy as np
+
+from graph_arrays import GraphArrays
+
+
+def suggest_delta(arrays):
+    if not len(arrays.weights):
+        return 1.0
+    return float(arrays.weights.mean())
+
+
+def _split(arrays, mask):
+    src = np.repeat(np.arange(arrays.n), np.diff(arrays.indptr))
+    # Hrany sú už v oboch smeroch, preto ich znova nezdvojujeme.
+    return GraphArrays.from_edges(arrays.nodes, src[mask], arrays.indices[mask], arrays.weights[mask], True)
+
+
+def _out_edges(arrays, nodes):
+    # Pozície všetkých hrán vychádzajúcich z množiny vrcholov bez cyklu v Pythone.
+    starts = arrays.indptr[nodes]
+    counts = arrays.indptr[nodes + 1] - starts
+    total = int(counts.sum())
+    positions = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(total)
+    return np.repeat(nodes, counts), positions
+
+
+class DeltaStepping:
+    # Vrcholy sa delia do košov šírky delta. Kôš sa spracuje naraz: ľahké hrany
+    # (w <= delta) sa relaxujú opakovane, kým sa kôš nevyprázdni, ťažké iba raz na konci.
+    def __init__(self, arrays, delta=None):
+        if len(arrays.weights) and arrays.weights.min() < 0:
+            raise ValueError("Delta-stepping nepracuje so zápornými hranami.")
+        self.arrays = arrays
+        self.delta = float(delta) if delta else suggest_delta(arrays)
+        if self.delta <= 0:
+            raise ValueError("Šírka koša musí byť kladná.")
+        light = arrays.weights <= self.delta
+        self.light = _split(arrays, light)
+        self.heavy = _split(arrays, ~light)
+        self.dist = None
+        self.pred = None
+
+    def _relax(self, arrays, nodes):
+        sources, positions = _out_edges(arrays, nodes)
+        if not len(positions):
+            return np.empty(0, dtype=np.int64), 0
+        targets = arrays.indices[positions]
+        candidates = self.dist[sources] + arrays.weights[positions]
+        # Pre každý cieľ stačí najlepší kandidát: zoradenie podľa (cieľ, kandidát).
+        order = np.lexsort((candidates, targets))
+        targets, candidates, sources = targets[order], candidates[order], sources[order]
+        first = np.ones(len(targets), dtype=bool)
+        first[1:] = targets[1:] != targets[:-1]
+        targets, candidates, sources = targets[first], candidates[first], sources[first]
+        improved = candidates < self.dist[targets]
+        targets = targets[improved]
+        self.dist[targets] = candidates[improved]
+        self.pred[targets] = sources[improved]
+        return targets, len(positions)
+
+    def _enqueue(self, buckets, heap, nodes):
+        if not len(nodes):
+            return
+        indices = np.floor(self.dist[nodes] / self.delta).astype(np.int64)
+        for bucket in np.unique(indices).tolist():
+            if bucket not in buckets:
+                buckets[bucket] = []
+                heapq.heappush(heap, bucket)
+            buckets[bucket].append(nodes[indices == bucket])
+
+    def _take(self, buckets, bucket, settled):
+        nodes = np.unique(np.concatenate(buckets.pop(bucket)))
+        # Vrchol mohol medzičasom klesnúť do nižšieho koša; také záznamy sú neplatné.
+        current = np.floor(self.dist[nodes] / self.delta).astype(np.int64) == bucket
+        return nodes[current & ~settled[nodes]]
+
+    def phases(self, source):
+        n = self.arrays.n
+        self.dist = np.full(n, np.inf)
+        self.pred = np.full(n, -1, dtype=np.int64)
+        self.dist[source] = 0.0
+        settled = np.zeros(n, dtype=bool)
+        buckets = {}
+        heap = []
+        self._enqueue(buckets, heap, np.array([source]))
+        while heap:
+            bucket = heapq.heappop(heap)
+            if bucket not in buckets:
+                continue
+            frontier = self._take(buckets, bucket, settled)
+            if not len(frontier):
+                continue
+            removed = []
+            improved = []
+            light_relaxations = 0
+            rounds = 0
+            while len(frontier):
+                rounds += 1
+                removed.append(frontier)
+                updated, count = self._relax(self.light, frontier)
+                light_relaxations += count
+                improved.append(updated)
+                self._enqueue(buckets, heap, updated)
+                frontier = self._take(buckets, bucket, settled) if bucket in buckets else frontier[:0]
+            members = np.unique(np.concatenate(removed))
+            settled[members] = True
+            updated, heavy_relaxations = self._relax(self.heavy, members)
+            improved.append(updated)
+            self._enqueue(buckets, heap, updated)
+            yield {
+                'bucket': bucket,
+                'settled': members,
+                'improved': np.unique(np.concatenate(improved)),
+                'rounds': rounds,
+                'light_relaxations': light_relaxations,
+                'heavy_relaxations': heavy_relaxations,
+            }
+
+    def distances(self, source):
+        for _ in self.phases(source):
+            pass
+        return self.dist
+
+    def path(self, source, target):
+        if not np.isfinite(self.dist[target]):
+            return []
+        path = [target]
+        while path[-1] != source:
+            path.append(int(self.pred[path[-1]]))
+        path.reverse()
+        return path
@@ -0,0 +1,110 @@
+import threading
+from collections import OrderedDict
+
+DEFAULT_FRAME_CACHE_MB = 64
+
+
+class FrameCache:
+    # Vykreslené kroky ako pole RGBA v LRU poradí, spolu najviac `budget_mb` MB.
+    # Obrázky platia iba pre jeden stav zobrazenia (záber, veľkosť obrázka, váhy, výber);
+    # pri jeho zmene alebo zmene grafu sa vyrovnávacia pamäť vyprázdni.
+    def __init__(self, budget_mb=DEFAULT_FRAME_CACHE_MB):
+        self.budget = int(budget_mb * 1024 * 1024)
+        self.frames = OrderedDict()
+        self.size = 0
+        self.state = None
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.frames)
+
+    def __contains__(self, key):
+        with self.lock:
+            return key in self.frames
+
+    def _clear(self):
+        self.frames.clear()
+        self.size = 0
+        self.generation += 1
+
+    def clear(self):
+        with self.lock:
+            self._clear()
+
+    def validate(self, state):
+        with self.lock:
+            if state != self.state:
+                self._clear()
+                self.state = state
+
+    def get(self, key):
+        with self.lock:
+            frame = self.frames.get(key)
+            if frame is None:
+                self.misses += 1
+                return None
+            self.frames.move_to_end(key)
+            self.hits += 1
+            return frame
+
+    def put(self, key, frame, generation=None):
+        # Obrázok z vlákna na pozadí sa zahodí, ak sa medzitým zmenil graf alebo zobrazenie.
+        with self.lock:
+            if generation is not None and generation != self.generation:
+                return False
+            if frame.nbytes > self.budget:
+                return False
+            old = self.frames.pop(key, None)
+            if old is not None:
+                self.size -= old.nbytes
+            self.frames[key] = frame
+            self.size += frame.nbytes
+            while self.size > self.budget:
+                _, old = self.frames.popitem(last=False)
+                self.size -= old.nbytes
+            return True
+
+
+class FramePrerenderer:
+    # Jedno vlákno na pozadí vykresľuje kroky okolo aktuálneho do vlastného obrázka Agg.
+    # Nová požiadavka nahradí zvyšok starej, kroky už vo vyrovnávacej pamäti sa preskočia.
+    def __init__(self, cache):
+        self.cache = cache
+        self.tasks = []
+        self.render = None
+        self.generation = None
+        self.condition = threading.Condition()
+        self.thread = None
+
+    def schedule(self, keys, render):
+        with self.condition:
+            self.tasks = [key for key in keys if key not in self.cache]
+            self.render = render
+            self.generation = self.cache.generation
+            self.condition.notify()
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._run, daemon=True)
+            self.thread.start()
+
+    def cancel(self):
+        with self.condition:
+            self.tasks = []
+
+    def _run(self):
+        while True:
+            with self.condition:
+                while not self.tasks:
+                    self.condition.wait()
+                key = self.tasks.pop(0)
+                render, generation = self.render, self.generation
+            if key in self.cache:
+                continue
+            try:
+                frame = render(key)
+            except Exception:
+                # Graf alebo trasa sa počas kreslenia zmenili; krok sa vykreslí pri zobrazení.
+                continue
+            self.cache.put(key, frame, generation)
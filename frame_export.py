@@ -0,0 +1,148 @@
+import multiprocessing
+import os
+import shutil
+import subprocess
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+import networkx as nx
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from rendering import draw_step, draw_transition_frame
+from step_events import resolve_step
+
+STEP_DURATION_MS = 600
+TRANSITION_DURATION_MS = 50
+
+_worker = {}
+
+
+def graph_snapshot(graph, positions, show_weights, figsize=(8, 6), dpi=100):
+    return {
+        'directed': graph.is_directed(),
+        'nodes': list(graph.nodes()),
+        'edges': [(u, v, data.get('weight', 1)) for u, v, data in graph.edges(data=True)],
+        'positions': {node: (float(pos[0]), float(pos[1])) for node, pos in positions.items()},
+        'show_weights': show_weights,
+        'figsize': figsize,
+        'dpi': dpi,
+    }
+
+
+def _init_worker(snapshot, frame_dir):
+    # Každý proces si graf a obrázok zostaví iba raz a potom ho opakovane používa.
+    graph = nx.DiGraph() if snapshot['directed'] else nx.Graph()
+    graph.add_nodes_from(snapshot['nodes'])
+    graph.add_weighted_edges_from(snapshot['edges'])
+    figure = Figure(figsize=snapshot['figsize'], dpi=snapshot['dpi'])
+    FigureCanvasAgg(figure)
+    _worker.update(graph=graph, positions=snapshot['positions'], show_weights=snapshot['show_weights'],
+                   figure=figure, ax=figure.add_subplot(111), frame_dir=frame_dir)
+
+
+def _render_frame(task):
+    frame_index, step, frac = task
+    ax = _worker['ax']
+    if frac is None:
+        draw_step(ax, _worker['graph'], _worker['positions'], step, _worker['show_weights'])
+    else:
+        draw_transition_frame(ax, _worker['graph'], _worker['positions'], step, frac)
+    path = os.path.join(_worker['frame_dir'], f"frame_{frame_index:06d}.png")
+    _worker['figure'].savefig(path)
+    return path
+
+
+def _frame_tasks(steps, transition_frames):
+    frame_index = 0
+    shared = getattr(steps, 'shared', {})
+    for step in steps:
+        # Zásobník sa nevykresľuje, do procesov sa posielajú iba hrany.
+        step = resolve_step(step, shared, keys=('edges',))
+        for frame in range(transition_frames):
+            yield frame_index, step, frame / transition_frames
+            frame_index += 1
+        yield frame_index, step, None
+        frame_index += 1
+
+
+def _batches(iterable, size):
+    batch = []
+    for item in iterable:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _encode_gif(paths, durations, output_path):
+    from PIL import Image
+
+    def frames():
+        for path in paths[1:]:
+            with Image.open(path) as image:
+                yield image.convert("RGB")
+
+    with Image.open(paths[0]) as first:
+        first.convert("RGB").save(output_path, save_all=True, append_images=frames(),
+                                  duration=durations, loop=0, optimize=False)
+
+
+def _encode_mp4(paths, durations, output_path, frame_dir):
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        raise RuntimeError("Program ffmpeg nie je nainštalovaný, video MP4 nie je možné vytvoriť.")
+    playlist = os.path.join(frame_dir, "frames.txt")
+    with open(playlist, "w") as file:
+        for path, duration in zip(paths, durations):
+            file.write(f"file '{os.path.basename(path)}'\nduration {duration / 1000:.3f}\n")
+        # Posledný snímok sa v concat zozname musí zopakovať, inak ffmpeg ignoruje jeho trvanie.
+        file.write(f"file '{os.path.basename(paths[-1])}'\n")
+    subprocess.run(
+        [ffmpeg, "-y", "-loglevel", "error", "-f", "concat", "-safe", "0", "-i", playlist,
+         "-vf", "scale=trunc(iw/2)*2:trunc(ih/2)*2", "-pix_fmt", "yuv420p", "-vsync", "vfr", output_path],
+        check=True
+    )
+
+
+def _copy_sequence(paths, output_dir):
+    os.makedirs(output_dir, exist_ok=True)
+    for path in paths:
+        shutil.move(path, os.path.join(output_dir, os.path.basename(path)))
+
+
+def export_animation(steps, snapshot, output_path, transition_frames=0, workers=None, progress=None):
+    extension = os.path.splitext(output_path)[1].lower()
+    if not len(steps):
+        raise ValueError("Trasa neobsahuje žiadne kroky.")
+    durations = ([TRANSITION_DURATION_MS] * transition_frames + [STEP_DURATION_MS]) * len(steps)
+    total = len(durations)
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, min(32, total // (workers * 4)))
+    # Procesy sa spúšťajú cez 'spawn', aby nededili stav Tk z hlavného procesu.
+    context = multiprocessing.get_context("spawn")
+
+    with tempfile.TemporaryDirectory(prefix="gv_frames_") as frame_dir:
+        paths = []
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                 initializer=_init_worker, initargs=(snapshot, frame_dir)) as executor:
+            # Úlohy sa odovzdávajú po dávkach, takže v pamäti nie je naraz celá trasa.
+            for batch in _batches(_frame_tasks(steps, transition_frames), workers * chunksize * 4):
+                for path in executor.map(_render_frame, batch, chunksize=chunksize):
+                    paths.append(path)
+                    if progress is not None:
+                        progress(len(paths), total)
+
+        if extension == ".gif":
+            _encode_gif(paths, durations, output_path)
+        elif extension == ".mp4":
+            _encode_mp4(paths, durations, output_path, frame_dir)
+        else:
+            _copy_sequence(paths, os.path.splitext(output_path)[0])
+    return total
+
+
+def ffmpeg_available():
+    return shutil.which("ffmpeg") is not None
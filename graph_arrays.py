@@ -0,0 +1,97 @@
+import heapq
+
+import numpy as np
+
+from positions import PositionStore
+
+
+class GraphArrays:
+    # Graf v tvare CSR: vrcholy majú husté indexy 0..n-1, susedia vrcholu i
+    # sú indices[indptr[i]:indptr[i + 1]] s váhami v rovnakom rozsahu weights.
+    def __init__(self, nodes, indptr, indices, weights, directed, coords=None):
+        self.nodes = list(nodes)
+        self.index = {node: i for i, node in enumerate(self.nodes)}
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+        self.directed = directed
+        self.coords = coords
+        self._reverse = None
+        self._lists = None
+
+    @property
+    def n(self):
+        return len(self.nodes)
+
+    @classmethod
+    def from_edges(cls, nodes, src, dst, weights, directed, coords=None):
+        n = len(nodes)
+        src = np.asarray(src, dtype=np.int64)
+        dst = np.asarray(dst, dtype=np.int64)
+        weights = np.asarray(weights, dtype=np.float64)
+        if not directed:
+            src, dst = np.concatenate((src, dst)), np.concatenate((dst, src))
+            weights = np.concatenate((weights, weights))
+        order = np.argsort(src, kind='stable')
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=n), out=indptr[1:])
+        return cls(nodes, indptr, dst[order], weights[order], directed, coords)
+
+    @classmethod
+    def from_networkx(cls, graph, positions=None):
+        nodes, src, dst, weights = edge_arrays(graph)
+        coords = None
+        if isinstance(positions, PositionStore):
+            coords = positions.coords(nodes)
+        elif positions is not None:
+            coords = np.zeros((len(nodes), 2), dtype=np.float64)
+            for i, node in enumerate(nodes):
+                pos = positions.get(node)
+                if pos is not None:
+                    coords[i] = pos[0], pos[1]
+        return cls.from_edges(nodes, src, dst, weights, graph.is_directed(), coords)
+
+    def reverse(self):
+        if not self.directed:
+            return self
+        if self._reverse is None:
+            src = np.repeat(np.arange(self.n), np.diff(self.indptr))
+            reverse = GraphArrays.from_edges(self.nodes, self.indices, src, self.weights, True, self.coords)
+            reverse._reverse = self
+            self._reverse = reverse
+        return self._reverse
+
+    def adjacency_lists(self):
+        # Python zoznamy sú v slučkách s heapq rýchlejšie ako prístup do NumPy polí.
+        if self._lists is None:
+            self._lists = (self.indptr.tolist(), self.indices.tolist(), self.weights.tolist())
+        return self._lists
+
+
+def edge_arrays(graph):
+    # Hrany grafu ako tri polia (zdroj, cieľ, váha) nad hustými indexmi vrcholov.
+    nodes = list(graph.nodes())
+    index = {node: i for i, node in enumerate(nodes)}
+    m = graph.number_of_edges()
+    src = np.fromiter((index[u] for u, v in graph.edges()), dtype=np.int64, count=m)
+    dst = np.fromiter((index[v] for u, v in graph.edges()), dtype=np.int64, count=m)
+    weights = np.fromiter((data.get('weight', 1) for u, v, data in graph.edges(data=True)), dtype=np.float64, count=m)
+    return nodes, src, dst, weights
+
+
+def dijkstra_distances(arrays, source):
+    indptr, indices, weights = arrays.adjacency_lists()
+    distances = [float('inf')] * arrays.n
+    distances[source] = 0.0
+    heap = [(0.0, source)]
+    while heap:
+        distance, node = heapq.heappop(heap)
+        if distance > distances[node]:
+            continue
+        for position in range(indptr[node], indptr[node + 1]):
+            neighbor = indices[position]
+            candidate = distance + weights[position]
+            if candidate < distances[neighbor]:
+                distances[neighbor] = candidate
+                heapq.heappush(heap, (candidate, neighbor))
+    return np.array(distances)
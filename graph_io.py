@@ -0,0 +1,71 @@
+import os
+
+import networkx as nx
+import numpy as np
+
+from importers import read_graph
+from positions import PositionStore
+
+MATRIX_SEPARATOR = "MATRIX"
+
+
+def write_matrix_file(file_path, graph, positions):
+    # Natívny formát aplikácie: riadky "vrchol x y", oddeľovač a matica susednosti.
+    adjacency_matrix = nx.to_numpy_array(graph, weight="weight")
+    with open(file_path, 'w') as file:
+        for node in graph.nodes():
+            pos = positions[node]
+            file.write(f"{node} {pos[0]} {pos[1]}\n")
+        file.write(MATRIX_SEPARATOR + "\n")
+        for row in adjacency_matrix.tolist():
+            file.write(" ".join(map(str, row)) + "\n")
+
+
+def read_matrix_file(file_path):
+    with open(file_path, 'r') as file:
+        lines = file.readlines()
+    separator_index = lines.index(MATRIX_SEPARATOR + "\n")
+    nodes = []
+    positions = {}
+    for line in lines[:separator_index]:
+        node, x, y = line.strip().split()
+        nodes.append(int(node))
+        positions[int(node)] = (float(x), float(y))
+    rows = [list(map(float, line.split())) for line in lines[separator_index + 1:] if line.strip()]
+    matrix = np.array(rows, dtype=np.float64).reshape(len(nodes), len(nodes))
+    return nodes, positions, matrix
+
+
+def fill_graph(graph, nodes, matrix):
+    graph.add_nodes_from(nodes)
+    rows, cols = np.nonzero(matrix)
+    graph.add_weighted_edges_from((nodes[i], nodes[j], weight)
+                                  for i, j, weight in zip(rows.tolist(), cols.tolist(), matrix[rows, cols].tolist()))
+
+
+def is_matrix_file(file_path):
+    # Natívny súbor má pred oddeľovačom iba riadky s tromi stĺpcami.
+    with open(file_path, 'r', errors='replace') as file:
+        for line in file:
+            if line.strip() == MATRIX_SEPARATOR:
+                return True
+            if len(line.split()) != 3:
+                return False
+    return False
+
+
+def load_graph(file_path, directed=None):
+    # Vráti (graf, pozície); pozície sú prázdne, ak ich formát neobsahuje.
+    if os.path.splitext(file_path)[1].lower() == ".txt" and is_matrix_file(file_path):
+        nodes, positions, matrix = read_matrix_file(file_path)
+        if directed is None:
+            # Smer sa do súboru neukladá, nesymetrická matica znamená orientovaný graf.
+            directed = not np.array_equal(matrix, matrix.T)
+        graph = nx.DiGraph() if directed else nx.Graph()
+        fill_graph(graph, nodes, matrix)
+        return graph, positions
+    imported = read_graph(file_path, directed=directed)
+    positions = PositionStore()
+    if imported.coords is not None:
+        positions = PositionStore.from_array(imported.nodes, imported.coords)
+    return imported.to_networkx(), positions
@@ -0,0 +1,102 @@
+import heapq
+
+import numpy as np
+
+from graph_arrays import dijkstra_distances
+
+
+class EuclideanHeuristic:
+    name = "euklidovská"
+
+    def __init__(self, arrays):
+        self.coords = arrays.coords
+
+    def bounds_to(self, target):
+        delta = self.coords - self.coords[target]
+        return np.hypot(delta[:, 0], delta[:, 1])
+
+    def bounds_from(self, source):
+        return self.bounds_to(source)
+
+
+class LandmarkHeuristic:
+    # ALT: pre orientačný bod L platí trojuholníková nerovnosť
+    # d(v, t) >= d(L, t) - d(L, v) a d(v, t) >= d(v, L) - d(t, L).
+    name = "ALT"
+
+    def __init__(self, arrays, count=8, seed=0):
+        self.landmarks = []
+        from_rows = []
+        to_rows = []
+        reverse = arrays.reverse()
+        rng = np.random.default_rng(seed)
+        # Najvzdialenejší výber: ďalší bod je ten, ktorý je najďalej od doterajších.
+        candidate = int(rng.integers(arrays.n))
+        closest = np.full(arrays.n, np.inf)
+        for _ in range(min(count, arrays.n)):
+            from_landmark = dijkstra_distances(arrays, candidate)
+            self.landmarks.append(candidate)
+            from_rows.append(from_landmark)
+            to_rows.append(dijkstra_distances(reverse, candidate) if arrays.directed else from_landmark)
+            closest = np.minimum(closest, from_landmark)
+            # Nedosiahnuté vrcholy majú prednosť, aby boli pokryté aj iné komponenty.
+            score = np.where(np.isfinite(closest), closest, np.finfo(float).max)
+            score[self.landmarks] = -1.0
+            candidate = int(np.argmax(score))
+        self.from_landmark = np.vstack(from_rows)
+        self.to_landmark = np.vstack(to_rows)
+
+    def bounds_to(self, target):
+        with np.errstate(invalid='ignore'):
+            forward = self.from_landmark[:, target][:, None] - self.from_landmark
+            backward = self.to_landmark - self.to_landmark[:, target][:, None]
+        return self._combine(forward, backward)
+
+    def bounds_from(self, source):
+        # Dolný odhad d(s, v) pre spätné hľadanie.
+        with np.errstate(invalid='ignore'):
+            forward = self.from_landmark - self.from_landmark[:, source][:, None]
+            backward = self.to_landmark[:, source][:, None] - self.to_landmark
+        return self._combine(forward, backward)
+
+    @staticmethod
+    def _combine(forward, backward):
+        bounds = np.fmax(forward, backward)
+        bounds[~np.isfinite(bounds)] = 0.0
+        return np.maximum(bounds.max(axis=0), 0.0)
+
+
+class ZeroHeuristic:
+    name = "bez heuristiky"
+
+    def __init__(self, arrays):
+        self.n = arrays.n
+
+    def bounds_to(self, target):
+        return np.zeros(self.n)
+
+    def bounds_from(self, source):
+        return np.zeros(self.n)
+
+
+def count_expansions(arrays, source, target, bounds):
+    indptr, indices, weights = arrays.adjacency_lists()
+    bounds = bounds.tolist()
+    g_scores = {source: 0.0}
+    closed = set()
+    heap = [(bounds[source], source)]
+    while heap:
+        _, node = heapq.heappop(heap)
+        if node in closed:
+            continue
+        closed.add(node)
+        if node == target:
+            break
+        base = g_scores[node]
+        for position in range(indptr[node], indptr[node + 1]):
+            neighbor = indices[position]
+            candidate = base + weights[position]
+            if candidate < g_scores.get(neighbor, float('inf')):
+                g_scores[neighbor] = candidate
+                heapq.heappush(heap, (candidate + bounds[neighbor], neighbor))
+    return len(closed)
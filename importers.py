@@ -0,0 +1,266 @@
+import csv
+import io
+import os
+import xml.etree.ElementTree as ET
+
+import numpy as np
+
+from graph_arrays import GraphArrays
+
+CHUNK_BYTES = 8 * 1024 * 1024
+
+
+class ImportedGraph:
+    # Výsledok importu: hrany ako polia nad hustými indexmi vrcholov 0..n-1.
+    def __init__(self, nodes, src, dst, weights, directed, coords=None):
+        self.nodes = list(nodes)
+        self.src = src
+        self.dst = dst
+        self.weights = weights
+        self.directed = directed
+        self.coords = coords
+
+    @property
+    def n(self):
+        return len(self.nodes)
+
+    @property
+    def m(self):
+        return len(self.src)
+
+    def to_arrays(self, coords=None):
+        return GraphArrays.from_edges(self.nodes, self.src, self.dst, self.weights, self.directed,
+                                      self.coords if coords is None else coords)
+
+    def layout(self, extent=9.5, seed=0):
+        # Súradnice sa preškálujú do rozsahu plátna; bez nich sa vrcholy rozmiestnia náhodne.
+        if self.coords is not None:
+            xy = np.asarray(self.coords, dtype=np.float64)
+        else:
+            xy = np.random.default_rng(seed).random((self.n, 2))
+        xy = xy - xy.min(axis=0)
+        span = xy.max() if len(xy) else 0
+        if span > 0:
+            xy = xy * (2 * extent / span)
+        return xy - extent
+
+    def to_networkx(self):
+        import networkx as nx
+        graph = nx.DiGraph() if self.directed else nx.Graph()
+        graph.add_nodes_from(self.nodes)
+        nodes = self.nodes
+        graph.add_weighted_edges_from(
+            (nodes[u], nodes[v], w) for u, v, w in zip(self.src.tolist(), self.dst.tolist(), self.weights.tolist())
+        )
+        return graph
+
+
+class _EdgeBuffer:
+    # Hrany sa zbierajú po blokoch; do jedného poľa sa spoja až na konci.
+    def __init__(self):
+        self.src = []
+        self.dst = []
+        self.weights = []
+
+    def add(self, src, dst, weights):
+        if len(src):
+            self.src.append(np.asarray(src, dtype=np.int64))
+            self.dst.append(np.asarray(dst, dtype=np.int64))
+            self.weights.append(np.asarray(weights, dtype=np.float64))
+
+    def arrays(self):
+        if not self.src:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), np.empty(0)
+        return np.concatenate(self.src), np.concatenate(self.dst), np.concatenate(self.weights)
+
+
+def _chunks(file_path, progress=None):
+    total = os.path.getsize(file_path)
+    done = 0
+    with open(file_path, "rb") as file:
+        while True:
+            lines = file.readlines(CHUNK_BYTES)
+            if not lines:
+                break
+            done += sum(len(line) for line in lines)
+            yield lines
+            if progress is not None:
+                progress(done, total)
+
+
+def _columns(lines, prefix, count):
+    # Riadky s daným prefixom rozdelené na stĺpce; prefix sa z výsledku vynechá.
+    tokens = b" ".join(line for line in lines if line.startswith(prefix)).split()
+    return [np.array(tokens[i::count + 1]) for i in range(1, count + 1)]
+
+
+def read_dimacs(file_path, coords_path=None, progress=None):
+    # DIMACS (9. DIMACS Challenge): "p sp n m", hrany "a u v w", súradnice v .co "v id x y".
+    n = None
+    edges = _EdgeBuffer()
+    for lines in _chunks(file_path, progress):
+        if n is None:
+            for line in lines:
+                if line.startswith(b"p "):
+                    n = int(line.split()[2])
+                    break
+        src, dst, weights = _columns(lines, b"a ", 3)
+        edges.add(src.astype(np.int64) - 1, dst.astype(np.int64) - 1, weights.astype(np.float64))
+    src, dst, weights = edges.arrays()
+    if n is None:
+        n = int(max(src.max(initial=-1), dst.max(initial=-1))) + 1
+    coords = read_dimacs_coords(coords_path, n) if coords_path else None
+    return ImportedGraph(range(1, n + 1), src, dst, weights, True, coords)
+
+
+def read_dimacs_coords(file_path, n, progress=None):
+    coords = np.zeros((n, 2))
+    for lines in _chunks(file_path, progress):
+        ids, xs, ys = _columns(lines, b"v ", 3)
+        ids = ids.astype(np.int64) - 1
+        coords[ids, 0] = xs.astype(np.float64)
+        coords[ids, 1] = ys.astype(np.float64)
+    return coords
+
+
+def _relabel(src, dst):
+    # Riedke identifikátory vrcholov sa premapujú na 0..n-1.
+    unique, inverse = np.unique(np.concatenate((src, dst)), return_inverse=True)
+    return unique.tolist(), inverse[:len(src)], inverse[len(src):]
+
+
+def read_snap(file_path, directed=True, progress=None):
+    # SNAP: riadky "u v" oddelené medzerou alebo tabulátorom, komentáre začínajú '#'.
+    edges = _EdgeBuffer()
+    columns = None
+    for lines in _chunks(file_path, progress):
+        lines = [line for line in lines if line.strip() and not line.startswith(b"#")]
+        if not lines:
+            continue
+        if columns is None:
+            # Niektoré súbory majú ďalšie stĺpce (napr. čas), použijú sa iba prvé dva.
+            columns = len(lines[0].split())
+        tokens = b" ".join(lines).split()
+        src = np.array(tokens[0::columns]).astype(np.int64)
+        dst = np.array(tokens[1::columns]).astype(np.int64)
+        edges.add(src, dst, np.ones(len(src)))
+    src, dst, weights = edges.arrays()
+    nodes, src, dst = _relabel(src, dst)
+    return ImportedGraph(nodes, src, dst, weights, directed)
+
+
+class _Labels:
+    def __init__(self):
+        self.index = {}
+        self.labels = []
+
+    def __call__(self, label):
+        position = self.index.get(label)
+        if position is None:
+            position = self.index[label] = len(self.labels)
+            self.labels.append(label)
+        return position
+
+    def nodes(self):
+        # Čisto číselné identifikátory sa prevedú na int, aby zodpovedali ostatným formátom.
+        try:
+            return [int(label) for label in self.labels]
+        except ValueError:
+            return list(self.labels)
+
+
+def read_csv(file_path, directed=False, progress=None):
+    # CSV: stĺpce zdroj, cieľ a voliteľne váha; hlavička sa rozpozná automaticky.
+    labels = _Labels()
+    edges = _EdgeBuffer()
+    dialect = None
+    skip_header = False
+    for lines in _chunks(file_path, progress):
+        text = b"".join(lines).decode("utf-8-sig")
+        if dialect is None:
+            sample = text[:64 * 1024]
+            sniffer = csv.Sniffer()
+            try:
+                dialect = sniffer.sniff(sample, delimiters=",;\t ")
+                skip_header = sniffer.has_header(sample)
+            except csv.Error:
+                dialect = csv.excel
+        src, dst, weights = [], [], []
+        for row in csv.reader(io.StringIO(text), dialect):
+            if len(row) < 2:
+                continue
+            if skip_header:
+                skip_header = False
+                continue
+            src.append(labels(row[0].strip()))
+            dst.append(labels(row[1].strip()))
+            weights.append(float(row[2]) if len(row) > 2 and row[2].strip() else 1.0)
+        edges.add(src, dst, weights)
+    src, dst, weights = edges.arrays()
+    return ImportedGraph(labels.nodes(), src, dst, weights, directed)
+
+
+def read_graphml(file_path, progress=None):
+    # GraphML sa číta prúdovo cez iterparse, spracované elementy sa hneď uvoľňujú.
+    labels = _Labels()
+    edges = _EdgeBuffer()
+    keys = {}
+    directed = False
+    coords = {}
+    graph = None
+    src, dst, weights = [], [], []
+    total = os.path.getsize(file_path)
+    with open(file_path, "rb") as file:
+        for event, elem in ET.iterparse(file, events=("start", "end")):
+            tag = elem.tag.rsplit("}", 1)[-1]
+            if event == "start":
+                if tag == "graph":
+                    graph = elem
+                    directed = elem.get("edgedefault", "undirected") == "directed"
+                continue
+            if tag == "key":
+                keys[elem.get("id")] = elem.get("attr.name", elem.get("id"))
+            elif tag == "node":
+                node = labels(elem.get("id"))
+                values = {keys.get(data.get("key")): data.text for data in elem if data.tag.endswith("data")}
+                if values.get("x") is not None and values.get("y") is not None:
+                    coords[node] = (float(values["x"]), float(values["y"]))
+                elem.clear()
+            elif tag == "edge":
+                weight = 1.0
+                for data in elem:
+                    if data.tag.endswith("data") and keys.get(data.get("key")) == "weight":
+                        weight = float(data.text)
+                src.append(labels(elem.get("source")))
+                dst.append(labels(elem.get("target")))
+                weights.append(weight)
+                elem.clear()
+                if len(src) >= 100000:
+                    edges.add(src, dst, weights)
+                    src, dst, weights = [], [], []
+                    # Vyprázdnené elementy by inak zostali zavesené v strome.
+                    del graph[:]
+                    if progress is not None:
+                        progress(file.tell(), total)
+    edges.add(src, dst, weights)
+    if progress is not None:
+        progress(total, total)
+    src, dst, weights = edges.arrays()
+    xy = None
+    if coords:
+        xy = np.zeros((len(labels.labels), 2))
+        for node, pos in coords.items():
+            xy[node] = pos
+    return ImportedGraph(labels.nodes(), src, dst, weights, directed, xy)
+
+
+def read_graph(file_path, progress=None, directed=None):
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension == ".gr":
+        coords_path = os.path.splitext(file_path)[0] + ".co"
+        return read_dimacs(file_path, coords_path if os.path.exists(coords_path) else None, progress)
+    if extension in (".graphml", ".xml"):
+        return read_graphml(file_path, progress)
+    if extension == ".csv":
+        return read_csv(file_path, bool(directed), progress)
+    return read_snap(file_path, True if directed is None else directed, progress)
@@ -0,0 +1,125 @@
+import cProfile
+import io
+import json
+import pstats
+import time
+
+
+class _NullTimer:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class _Timer:
+    def __init__(self, instrumentation, name):
+        self.instrumentation = instrumentation
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.instrumentation.record_time(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class Instrumentation:
+    # Keď je meranie vypnuté, timer() vracia zdieľaný prázdny kontext
+    # a algoritmy počítajú operácie iba v lokálnych premenných.
+    def __init__(self):
+        self.enabled = False
+        self.profile_next_run = False
+        self.counters = {}
+        self.timers = {}
+        self.trace_memory = {}
+        self.profile_report = ""
+        self._profiler = None
+
+    def reset_counters(self):
+        self.counters = {}
+
+    def reset(self):
+        self.counters = {}
+        self.timers = {}
+        self.trace_memory = {}
+        self.profile_report = ""
+
+    def add_counts(self, **counts):
+        if not self.enabled:
+            return
+        for name, amount in counts.items():
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def timer(self, name):
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self, name)
+
+    def start(self, name):
+        return time.perf_counter() if self.enabled else None
+
+    def stop(self, name, started):
+        if started is not None:
+            self.record_time(name, time.perf_counter() - started)
+
+    def record_time(self, name, elapsed):
+        entry = self.timers.setdefault(name, [0, 0.0, 0.0])
+        entry[0] += 1
+        entry[1] += elapsed
+        entry[2] = max(entry[2], elapsed)
+
+    def record_trace_memory(self, report):
+        # Súhrn pamäte poslednej trasy sa uchováva aj pri vypnutom meraní.
+        self.trace_memory = dict(report)
+
+    def start_profile(self):
+        if not self.profile_next_run:
+            return
+        self.profile_next_run = False
+        self._profiler = cProfile.Profile()
+        self._profiler.enable()
+
+    def stop_profile(self, limit=30):
+        if self._profiler is None:
+            return
+        self._profiler.disable()
+        output = io.StringIO()
+        pstats.Stats(self._profiler, stream=output).sort_stats("cumulative").print_stats(limit)
+        self.profile_report = output.getvalue()
+        self._profiler = None
+
+    def snapshot(self):
+        return {
+            "counters": dict(self.counters),
+            "timers": {
+                name: {"calls": calls, "total_s": total, "max_s": longest,
+                       "mean_s": total / calls if calls else 0.0}
+                for name, (calls, total, longest) in self.timers.items()
+            },
+            "trace_memory": dict(self.trace_memory),
+            "profile": self.profile_report,
+        }
+
+    def format_lines(self):
+        lines = []
+        for name, value in sorted(self.counters.items()):
+            lines.append(f"{name}: {value}")
+        for name, (calls, total, longest) in sorted(self.timers.items()):
+            lines.append(f"{name}: {calls}× spolu {total * 1000:.1f} ms, max {longest * 1000:.1f} ms")
+        for name, value in self.trace_memory.items():
+            if name.endswith("_bytes"):
+                lines.append(f"trasa.{name[:-6]}: {value / (1024 * 1024):.1f} MB")
+            else:
+                lines.append(f"trasa.{name}: {value}")
+        return lines
+
+    def export_json(self, file_path):
+        with open(file_path, "w", encoding="utf-8") as file:
+            json.dump(self.snapshot(), file, ensure_ascii=False, indent=2)
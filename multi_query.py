@@ -0,0 +1,192 @@
+import argparse
+import heapq
+import json
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+PARALLEL_MIN_SOURCES = 16
+
+_worker = {}
+
+
+def _views(buffer, n, m):
+    # Polia CSR ako memoryview; prístup k prvku je v slučke rýchly ako pri zozname.
+    indptr_end = 8 * (n + 1)
+    indices_end = indptr_end + 8 * m
+    return (buffer[:indptr_end].cast('q'), buffer[indptr_end:indices_end].cast('q'),
+            buffer[indices_end:indices_end + 8 * m].cast('d'))
+
+
+class SharedGraph:
+    # Polia CSR grafu (indptr, indices, weights) za sebou v jednom bloku zdieľanej pamäte.
+    # Pracovné procesy sa pripoja podľa mena bloku, graf sa do nich nekopíruje ani nepickluje.
+    def __init__(self, arrays):
+        self.n = arrays.n
+        self.m = len(arrays.indices)
+        self.memory = shared_memory.SharedMemory(create=True, size=8 * (self.n + 1 + 2 * self.m))
+        offset = 0
+        for values, dtype in ((arrays.indptr, np.int64), (arrays.indices, np.int64), (arrays.weights, np.float64)):
+            target = np.ndarray(len(values), dtype=dtype, buffer=self.memory.buf, offset=offset)
+            target[:] = values
+            offset += target.nbytes
+            del target
+
+    @property
+    def spec(self):
+        return self.memory.name, self.n, self.m
+
+    def close(self):
+        self.memory.close()
+        self.memory.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+def _attach(name, n, m, with_paths):
+    memory = shared_memory.SharedMemory(name=name)
+    _worker.update(memory=memory, graph=_views(memory.buf, n, m), with_paths=with_paths)
+
+
+def _shortest_paths(graph, source, targets, with_paths):
+    # Dijkstra z jedného zdroja; skončí, keď sú ustálené všetky ciele jeho skupiny.
+    indptr, indices, weights = graph
+    distances = {source: 0.0}
+    previous = {source: -1}
+    settled = set()
+    remaining = set(targets)
+    heap = [(0.0, source)]
+    while heap and remaining:
+        distance, node = heapq.heappop(heap)
+        if node in settled:
+            continue
+        settled.add(node)
+        remaining.discard(node)
+        for position in range(indptr[node], indptr[node + 1]):
+            neighbor = indices[position]
+            candidate = distance + weights[position]
+            if candidate < distances.get(neighbor, float('inf')):
+                distances[neighbor] = candidate
+                previous[neighbor] = node
+                heapq.heappush(heap, (candidate, neighbor))
+    answers = []
+    for target in targets:
+        if target not in settled:
+            answers.append((float('inf'), []))
+            continue
+        path = []
+        if with_paths:
+            node = target
+            while node != -1:
+                path.append(node)
+                node = previous[node]
+            path.reverse()
+        answers.append((distances[target], path))
+    return answers
+
+
+def _query_groups(groups):
+    graph, with_paths = _worker['graph'], _worker['with_paths']
+    return [(positions, _shortest_paths(graph, source, targets, with_paths))
+            for source, targets, positions in groups]
+
+
+def group_by_source(arrays, pairs):
+    # Dvojice s rovnakým zdrojom zdieľajú jeden strom najkratších ciest.
+    groups = {}
+    for position, (source, target) in enumerate(pairs):
+        for node in (source, target):
+            if node not in arrays.index:
+                raise ValueError(f"Vrchol {node} v grafe neexistuje.")
+        targets, positions = groups.setdefault(arrays.index[source], ([], []))
+        targets.append(arrays.index[target])
+        positions.append(position)
+    # Väčšie skupiny idú prvé, aby posledné úlohy boli krátke a procesy skončili naraz.
+    return sorted(((source, targets, positions) for source, (targets, positions) in groups.items()),
+                  key=lambda group: len(group[1]), reverse=True)
+
+
+def multi_query(arrays, pairs, workers=None, with_paths=True):
+    # Výsledok má pre každú dvojicu (zdroj, cieľ) n-ticu (vzdialenosť, cesta) v poradí vstupu;
+    # nedosiahnuteľný cieľ má vzdialenosť inf a prázdnu cestu.
+    if len(arrays.weights) and arrays.weights.min() < 0:
+        raise ValueError("Dávka dotazov používa Dijkstrov algoritmus, ktorý nepracuje so zápornými hranami.")
+    groups = group_by_source(arrays, pairs)
+    results = [None] * len(pairs)
+
+    def store(answered):
+        for positions, answers in answered:
+            for position, (distance, path) in zip(positions, answers):
+                results[position] = (distance, [arrays.nodes[i] for i in path])
+
+    workers = min(workers or os.cpu_count() or 1, len(groups))
+    if workers <= 1 or len(groups) < PARALLEL_MIN_SOURCES:
+        _worker.update(graph=arrays.adjacency_lists(), with_paths=with_paths)
+        try:
+            store(_query_groups(groups))
+        finally:
+            _worker.clear()
+        return results
+    chunk = max(1, len(groups) // (workers * 4))
+    chunks = [groups[start:start + chunk] for start in range(0, len(groups), chunk)]
+    # Procesy sa spúšťajú cez 'spawn' ako pri ostatných paralelných výpočtoch.
+    context = multiprocessing.get_context("spawn")
+    with SharedGraph(arrays) as shared:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=_attach,
+                                 initargs=shared.spec + (with_paths,)) as executor:
+            for answered in executor.map(_query_groups, chunks):
+                store(answered)
+    return results
+
+
+def main(argv=None):
+    from batch import read_pairs, resolve_node
+    from graph_arrays import GraphArrays
+    from graph_io import load_graph
+
+    parser = argparse.ArgumentParser(prog="multi_query.py",
+                                     description="Najkratšie cesty pre veľa dvojíc vrcholov nad jedným grafom.")
+    parser.add_argument("graph", help="súbor s grafom (natívny .txt, DIMACS, SNAP, CSV, GraphML)")
+    parser.add_argument("pairs", help="CSV s dvojicami zdroj, cieľ")
+    parser.add_argument("--output", default="query_results.jsonl", help="výstupný súbor JSONL")
+    parser.add_argument("--workers", type=int, default=None, help="počet pracovných procesov")
+    parser.add_argument("--directed", action=argparse.BooleanOptionalAction, default=None,
+                        help="považovať graf za orientovaný alebo neorientovaný (inak podľa formátu súboru)")
+    parser.add_argument("--no-paths", action="store_true", help="zapísať iba vzdialenosti bez ciest")
+    args = parser.parse_args(argv)
+
+    graph, positions = load_graph(args.graph, args.directed)
+    try:
+        pairs = [(resolve_node(graph, source), resolve_node(graph, target))
+                 for source, target in read_pairs(args.pairs)]
+    except ValueError as e:
+        parser.error(str(e))
+    if not pairs:
+        parser.error(f"Súbor {args.pairs} neobsahuje žiadne dvojice vrcholov.")
+    arrays = GraphArrays.from_networkx(graph)
+    started = time.perf_counter()
+    results = multi_query(arrays, pairs, args.workers, not args.no_paths)
+    elapsed = time.perf_counter() - started
+    with open(args.output, "w", encoding="utf-8") as output:
+        for (source, target), (distance, path) in zip(pairs, results):
+            record = {'source': source, 'target': target, 'distance': None if np.isinf(distance) else distance}
+            if not args.no_paths:
+                record['path'] = path
+            output.write(json.dumps(record, ensure_ascii=False) + "\n")
+    sources = len({source for source, _ in pairs})
+    print(f"{len(pairs)} dotazov z {sources} zdrojov za {elapsed:.2f} s ({len(pairs) / max(elapsed, 1e-9):.0f} dotazov/s).")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,134 @@
+from collections.abc import MutableMapping
+
+import numpy as np
+
+
+class PositionStore(MutableMapping):
+    # Súradnice všetkých vrcholov v jednom poli (kapacita, 2); vrchol si pamätá iba číslo riadku.
+    # Riadky zmazaných vrcholov sa označia NaN a znovu použijú pri ďalšom pridaní.
+    def __init__(self, positions=None, capacity=16):
+        self.xy = np.full((capacity, 2), np.nan)
+        self.index = {}
+        self.row_nodes = [None] * capacity
+        self.free = []
+        self.used = 0
+        if positions:
+            self.update(positions)
+
+    @classmethod
+    def from_array(cls, nodes, xy):
+        nodes = list(nodes)
+        store = cls(capacity=max(16, len(nodes)))
+        store.xy[:len(nodes)] = np.asarray(xy, dtype=np.float64).reshape(len(nodes), 2)
+        store.index = {node: i for i, node in enumerate(nodes)}
+        store.row_nodes[:len(nodes)] = nodes
+        store.used = len(nodes)
+        return store
+
+    def _grow(self, needed):
+        capacity = len(self.xy)
+        if needed <= capacity:
+            return
+        capacity = max(needed, 2 * capacity)
+        xy = np.full((capacity, 2), np.nan)
+        xy[:self.used] = self.xy[:self.used]
+        self.xy = xy
+        self.row_nodes.extend([None] * (capacity - len(self.row_nodes)))
+
+    def _allocate(self, node):
+        if self.free:
+            row = self.free.pop()
+        else:
+            self._grow(self.used + 1)
+            row = self.used
+            self.used += 1
+        self.index[node] = row
+        self.row_nodes[row] = node
+        return row
+
+    def __getitem__(self, node):
+        x, y = self.xy[self.index[node]].tolist()
+        return x, y
+
+    def __setitem__(self, node, pos):
+        row = self.index.get(node)
+        if row is None:
+            row = self._allocate(node)
+        self.xy[row, 0] = pos[0]
+        self.xy[row, 1] = pos[1]
+
+    def __delitem__(self, node):
+        row = self.index.pop(node)
+        self.xy[row] = np.nan
+        self.row_nodes[row] = None
+        self.free.append(row)
+
+    def __contains__(self, node):
+        return node in self.index
+
+    def __iter__(self):
+        return iter(self.index)
+
+    def __len__(self):
+        return len(self.index)
+
+    def __repr__(self):
+        return f"PositionStore({len(self)} vrcholov)"
+
+    def clear(self):
+        self.xy[:self.used] = np.nan
+        self.index = {}
+        self.row_nodes = [None] * len(self.xy)
+        self.free = []
+        self.used = 0
+
+    def update(self, other=(), **kwargs):
+        # Hromadné vloženie: nové vrcholy dostanú súvislý blok riadkov, súradnice sa zapíšu naraz.
+        items = other.items() if hasattr(other, 'items') else other
+        nodes = []
+        values = []
+        for node, pos in items:
+            nodes.append(node)
+            values.append((pos[0], pos[1]))
+        nodes.extend(kwargs)
+        values.extend((pos[0], pos[1]) for pos in kwargs.values())
+        if not nodes:
+            return
+        new = [node for node in dict.fromkeys(nodes) if node not in self.index]
+        if len(new) > len(self.free):
+            self._grow(self.used + len(new) - len(self.free))
+        for node in new:
+            self._allocate(node)
+        rows = np.fromiter((self.index[node] for node in nodes), dtype=np.int64, count=len(nodes))
+        self.xy[rows] = np.asarray(values, dtype=np.float64)
+
+    def copy(self):
+        store = PositionStore(capacity=len(self.xy))
+        store.xy = self.xy.copy()
+        store.index = dict(self.index)
+        store.row_nodes = list(self.row_nodes)
+        store.free = list(self.free)
+        store.used = self.used
+        return store
+
+    def rows(self, nodes, missing=-1):
+        return np.fromiter((self.index.get(node, missing) for node in nodes), dtype=np.int64)
+
+    def coords(self, nodes, default=0.0):
+        # Súradnice zadaných vrcholov ako pole (len(nodes), 2); chýbajúce vrcholy dostanú default.
+        rows = self.rows(nodes)
+        xy = self.xy[rows]
+        xy[rows < 0] = default
+        return xy
+
+    def nearest(self, x, y, threshold=float('inf')):
+        # Najbližší vrchol k bodu (x, y) v jednom prechode poľom; voľné riadky sú NaN a neuplatnia sa.
+        if not self.index:
+            return None
+        xy = self.xy[:self.used]
+        dist = np.hypot(xy[:, 0] - x, xy[:, 1] - y)
+        dist[np.isnan(dist)] = np.inf
+        row = int(np.argmin(dist))
+        if dist[row] >= threshold:
+            return None
+        return self.row_nodes[row]
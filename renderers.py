@@ -0,0 +1,727 @@
+import math
+import tkinter as tk
+from itertools import chain
+
+import networkx as nx
+import numpy as np
+
+from frame_cache import FrameCache, FramePrerenderer
+from spatial import ViewIndex
+
+FIXED_LIMITS = (-10, 10, -10, 10)
+NODE_COLOR = 'skyblue'
+# Farby palety tab10 z matplotlib, aby Tk plátno nemuselo matplotlib načítať.
+SCC_COLORS = ('#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd',
+              '#8c564b', '#e377c2', '#7f7f7f', '#bcbd22', '#17becf')
+LEGEND_UPDATED = ("Aktualizácia (Update)", 'green')
+LEGEND_NO_UPDATE = ("Bez aktualizácie", 'red')
+LEGEND_FORWARD = ("Dopredná hranica", 'lightgreen')
+LEGEND_BACKWARD = ("Spätná hranica", 'plum')
+
+
+def step_legend(step):
+    entries = []
+    if step.get('updated_edges', []):
+        entries.append(LEGEND_UPDATED)
+    if step.get('no_update_edges', []):
+        entries.append(LEGEND_NO_UPDATE)
+    if step.get('forward_frontier', []):
+        entries.append(LEGEND_FORWARD)
+    if step.get('backward_frontier', []):
+        entries.append(LEGEND_BACKWARD)
+    return entries
+
+
+class MatplotlibRenderer:
+    # Každé prekreslenie rasterizuje cez FigureCanvasTkAgg iba časť grafu v zábere.
+    # Kroky trasy sa ukladajú ako hotové obrázky; vrátenie sa na krok iba skopíruje obrázok
+    # na plátno a osi sa prekreslia až vtedy, keď ich niečo potrebuje (popisok, výber, posun).
+    name = "matplotlib"
+    ZOOM_STEP = 1.2
+
+    def __init__(self, parent, on_click, on_motion):
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from matplotlib.figure import Figure
+        self.on_click = on_click
+        self.on_motion = on_motion
+        self.figure = Figure(figsize=(6, 4))
+        self.ax = self.figure.add_subplot(111)
+        self.canvas = FigureCanvasTkAgg(self.figure, parent)
+        self.widget = self.canvas.get_tk_widget()
+        self.limits = list(FIXED_LIMITS)
+        self.graph = None
+        self.index = None
+        self.redraw = None
+        self.pan_start = None
+        self.selected = set()
+        self.frames = FrameCache()
+        self.prerenderer = FramePrerenderer(self.frames)
+        self.offscreen = None
+        self.stale = False
+        self.capture = None
+        self._reset_axes()
+        self._apply_limits()
+        self.canvas.draw()
+        self._after_clear(None, None)
+        self.canvas.mpl_connect("motion_notify_event", self._motion)
+        self.canvas.mpl_connect("button_press_event", self._click)
+        self.canvas.mpl_connect("button_release_event", self._release)
+        self.canvas.mpl_connect("scroll_event", self._scroll)
+        self.canvas.mpl_connect("resize_event", lambda event: self._materialize())
+
+    def _after_clear(self, graph, positions):
+        # ax.clear() odstráni aj popisok a zvýraznenie výberu, vytvoria sa nanovo.
+        self.selection = None
+        self.annot = self.ax.annotate("", xy=(0, 0), xytext=(10, 10),
+                                      textcoords="offset points",
+                                      bbox=dict(boxstyle="round", fc="w"),
+                                      arrowprops=dict(arrowstyle="->"))
+        self.annot.set_visible(False)
+        if graph is not None:
+            self._draw_selection(graph, positions)
+
+    def _reset_axes(self):
+        self.ax.clear()
+        self.ax.set_axis_on()
+        self.ax.grid(True)
+
+    def _apply_limits(self, ax=None, limits=None):
+        ax = self.ax if ax is None else ax
+        x0, x1, y0, y1 = self.limits if limits is None else limits
+        ax.set_aspect('equal')
+        ax.set_xlim(x0, x1)
+        ax.set_ylim(y0, y1)
+
+    def _begin(self, redraw):
+        self.redraw = redraw
+        self.stale = False
+        self.capture = None
+
+    def _frame_state(self, show_weights):
+        return (tuple(self.limits), self.canvas.get_width_height(physical=True), self.figure.dpi,
+                show_weights, frozenset(self.selected))
+
+    def _materialize(self):
+        # Na plátne je obrázok z vyrovnávacej pamäte, osi ešte obsahujú predchádzajúci stav.
+        if self.stale:
+            self.redraw()
+
+    def _blit(self, frame):
+        buffer = np.asarray(self.canvas.get_renderer().buffer_rgba())
+        if buffer.shape != frame.shape:
+            return False
+        buffer[...] = frame
+        self.canvas.blit()
+        return True
+
+    def _visible(self, graph, positions):
+        # Podgraf vrcholov a hrán, ktoré zasahujú do záberu; mimo neho sa nič nevykresľuje.
+        if graph is not self.graph or self.index is None:
+            self.graph = graph
+            self.index = ViewIndex(graph, positions)
+        x0, x1, y0, y1 = self.limits
+        nodes, edges = self.index.query(x0, y0, x1, y1, margin=0.5)
+        if len(nodes) == len(self.index.nodes) and len(edges) == len(self.index.edges):
+            return graph
+        keep = set(nodes)
+        keep.update(chain.from_iterable(edges))
+        return graph.subgraph(keep)
+
+    def _motion(self, event):
+        if self.pan_start is not None:
+            self._materialize()
+            x, y, limits = self.pan_start
+            scale = (limits[1] - limits[0]) / self.ax.bbox.width
+            dx, dy = (event.x - x) * scale, (event.y - y) * scale
+            self.limits = [limits[0] - dx, limits[1] - dx, limits[2] - dy, limits[3] - dy]
+            self._apply_limits()
+            self.canvas.draw_idle()
+            return
+        if event.inaxes != self.ax or event.xdata is None or event.ydata is None:
+            self.on_motion(None, None)
+        else:
+            self.on_motion(event.xdata, event.ydata)
+
+    def _click(self, event):
+        if event.button == 2 or (event.button == 1 and event.key == 'shift'):
+            self.pan_start = (event.x, event.y, list(self.limits))
+        elif event.inaxes == self.ax and event.xdata is not None and event.ydata is not None:
+            self.on_click(event.xdata, event.ydata)
+
+    def _release(self, event):
+        if self.pan_start is not None:
+            self.pan_start = None
+            self._redraw()
+
+    def _scroll(self, event):
+        if event.xdata is None or event.ydata is None:
+            return
+        factor = 1 / self.ZOOM_STEP if event.button == 'up' else self.ZOOM_STEP
+        x, y = event.xdata, event.ydata
+        x0, x1, y0, y1 = self.limits
+        self.limits = [x + (x0 - x) * factor, x + (x1 - x) * factor, y + (y0 - y) * factor, y + (y1 - y) * factor]
+        self._redraw()
+
+    def _redraw(self):
+        if self.redraw is not None:
+            self.redraw()
+        else:
+            self._apply_limits()
+        self.canvas.draw_idle()
+
+    def invalidate(self):
+        self.index = None
+        self.frames.clear()
+
+    def draw_graph(self, graph, positions, show_weights, directed):
+        self._begin(lambda: self.draw_graph(graph, positions, show_weights, directed))
+        self._reset_axes()
+        if len(graph.nodes) > 0:
+            view = self._visible(graph, positions)
+            nx.draw_networkx_nodes(view, positions, ax=self.ax, node_color=NODE_COLOR, node_size=500)
+            if directed:
+                nx.draw_networkx_edges(view, positions, ax=self.ax, arrows=True, arrowstyle='-|>',
+                                       arrowsize=12, connectionstyle='arc3,rad=0.1')
+            else:
+                nx.draw_networkx_edges(view, positions, ax=self.ax)
+            nx.draw_networkx_labels(view, positions, ax=self.ax)
+            if show_weights:
+                edge_labels = nx.get_edge_attributes(view, 'weight')
+                nx.draw_networkx_edge_labels(view, positions, edge_labels=edge_labels, ax=self.ax)
+        self._apply_limits()
+        self._after_clear(graph, positions)
+
+    def has_frame(self, frame_key, show_weights):
+        self.frames.validate(self._frame_state(show_weights))
+        return frame_key in self.frames
+
+    def draw_step(self, graph, positions, step, show_weights, frame_key=None):
+        from rendering import draw_step
+        self._begin(lambda: self.draw_step(graph, positions, step, show_weights))
+        if frame_key is not None:
+            self.frames.validate(self._frame_state(show_weights))
+            frame = self.frames.get(frame_key)
+            if frame is not None and self._blit(frame):
+                self.stale = True
+                return
+            self.capture = frame_key
+        draw_step(self.ax, self._visible(graph, positions), positions, step, show_weights)
+        self._apply_limits()
+        self._after_clear(graph, positions)
+
+    def draw_transition(self, graph, positions, step, frac):
+        from rendering import draw_transition_frame
+        self._begin(lambda: self.draw_transition(graph, positions, step, frac))
+        draw_transition_frame(self.ax, self._visible(graph, positions), positions, step, frac)
+        self._apply_limits()
+        self._after_clear(graph, positions)
+
+    def draw_scc(self, graph, positions, sccs, show_weights):
+        self._begin(lambda: self.draw_scc(graph, positions, sccs, show_weights))
+        self._reset_axes()
+        view = self._visible(graph, positions)
+        for i, component in enumerate(sccs):
+            nx.draw_networkx_nodes(view, positions, nodelist=[node for node in component if node in view],
+                                   node_color=[SCC_COLORS[i % len(SCC_COLORS)]], node_size=500, ax=self.ax)
+        nx.draw_networkx_edges(view, positions, ax=self.ax, arrows=True, arrowstyle='-|>',
+                               arrowsize=12, connectionstyle='arc3,rad=0.1')
+        nx.draw_networkx_labels(view, positions, ax=self.ax)
+        if show_weights:
+            edge_labels = nx.get_edge_attributes(view, 'weight')
+            nx.draw_networkx_edge_labels(view, positions, edge_labels=edge_labels, ax=self.ax)
+        self._apply_limits()
+        self._after_clear(graph, positions)
+
+    def draw_condensation(self, view, show_weights):
+        self._begin(lambda: self.draw_condensation(view, show_weights))
+        self._reset_axes()
+        graph, positions, radius = view['graph'], view['positions'], view['radius']
+        if len(graph) > 0:
+            # Väčšie super-vrcholy sa kreslia skôr, aby rozbalené vrcholy ostali navrchu.
+            nodes = sorted(graph, key=radius.get, reverse=True)
+            base = min(radius.values())
+            sizes = [500 * (radius[node] / base) ** 2 for node in nodes]
+            colors = [SCC_COLORS[view['colors'][node] % len(SCC_COLORS)] for node in nodes]
+            nx.draw_networkx_nodes(graph, positions, nodelist=nodes, node_size=sizes, node_color=colors, ax=self.ax)
+            widths = [1 + min(5, math.log2(weight)) for _, _, weight in graph.edges(data='weight')]
+            nx.draw_networkx_edges(graph, positions, ax=self.ax, nodelist=nodes, node_size=sizes, width=widths,
+                                   arrows=True, arrowstyle='-|>', arrowsize=12)
+            nx.draw_networkx_labels(graph, positions, labels=view['labels'], ax=self.ax)
+            if show_weights:
+                edge_labels = {(u, v): weight for u, v, weight in graph.edges(data='weight')}
+                nx.draw_networkx_edge_labels(graph, positions, edge_labels=edge_labels, ax=self.ax)
+        self._apply_limits()
+        self._after_clear(None, None)
+
+    def prerender(self, graph, positions, show_weights, keys, load_step):
+        # Kroky `keys` sa vykreslia na pozadí s rovnakým záberom, veľkosťou a výberom ako plátno.
+        self.frames.validate(self._frame_state(show_weights))
+        view = self._visible(graph, positions)
+        size, dpi = tuple(self.figure.get_size_inches()), self.figure.dpi
+        limits = tuple(self.limits)
+        selected = [node for node in self.selected if node in view]
+        self.prerenderer.schedule(
+            keys, lambda key: self._render_offscreen(size, dpi, limits, view, positions, load_step(key),
+                                                     show_weights, selected))
+
+    def _render_offscreen(self, size, dpi, limits, view, positions, step, show_weights, selected):
+        # Volá sa iba z vlákna na pozadí, ktoré ako jediné používa tento obrázok.
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+        from rendering import draw_step
+        if self.offscreen is None or self.offscreen[0] != (size, dpi):
+            figure = Figure(figsize=size, dpi=dpi)
+            FigureCanvasAgg(figure)
+            self.offscreen = ((size, dpi), figure, figure.add_subplot(111))
+        _, figure, ax = self.offscreen
+        draw_step(ax, view, positions, step, show_weights)
+        if selected:
+            nx.draw_networkx_nodes(view, positions, nodelist=selected, ax=ax, node_color='none',
+                                   edgecolors='red', linewidths=3, node_size=500)
+        self._apply_limits(ax, limits)
+        figure.canvas.draw()
+        return np.array(figure.canvas.buffer_rgba())
+
+    def _draw_selection(self, graph, positions):
+        if self.selection is not None:
+            self.selection.remove()
+            self.selection = None
+        nodes = [node for node in self.selected if node in graph]
+        if nodes:
+            self.selection = nx.draw_networkx_nodes(graph, positions, nodelist=nodes, ax=self.ax, node_color='none',
+                                                    edgecolors='red', linewidths=3, node_size=500)
+            self._apply_limits()
+
+    def set_selection(self, graph, positions, nodes):
+        self._materialize()
+        self.selected = set(nodes)
+        self._draw_selection(graph, positions)
+
+    def show_tooltip(self, xy, text):
+        self._materialize()
+        self.annot.xy = xy
+        self.annot.set_text(text)
+        self.annot.get_bbox_patch().set_facecolor("lightyellow")
+        self.annot.get_bbox_patch().set_alpha(0.9)
+        self.annot.set_visible(True)
+        self.canvas.draw_idle()
+
+    def hide_tooltip(self):
+        if self.annot.get_visible():
+            self.annot.set_visible(False)
+            self._materialize()
+            self.canvas.draw_idle()
+
+    def refresh(self):
+        if self.stale:
+            return
+        self.canvas.draw()
+        if self.capture is not None:
+            self.frames.put(self.capture, np.array(self.canvas.buffer_rgba()))
+            self.capture = None
+
+    def figure_size(self):
+        width, height = self.figure.get_size_inches()
+        return (width, height), self.figure.dpi
+
+    def destroy(self):
+        self.prerenderer.cancel()
+        self.widget.destroy()
+
+
+class TkCanvasRenderer:
+    # Vrcholy a hrany sú trvalé položky tk.Canvas s vlastnými ID. Položky existujú iba pre to,
+    # čo je v zábere; prekreslenie dopĺňa alebo maže zmenené položky a mení ich farby.
+    name = "tk"
+    MIN_LABEL_RADIUS = 7
+    ZOOM_STEP = 1.2
+
+    def __init__(self, parent, on_click, on_motion):
+        self.on_click = on_click
+        self.on_motion = on_motion
+        self.canvas = tk.Canvas(parent, background="white", highlightthickness=0)
+        self.widget = self.canvas
+        self.legend = tk.Frame(self.canvas, background="white", borderwidth=1, relief=tk.SOLID)
+        self.scale = 1.0
+        self.origin = (0.0, 0.0)
+        self.view_fitted = False
+        self.view_job = None
+        self.graph = None
+        self.directed = False
+        self.index = None
+        self.node_xy = {}
+        self.radius = 0.5
+        self.show_weights = False
+        self.nodes = {}
+        self.edges = {}
+        self.weights = {}
+        self.weight_values = {}
+        self.drawn = {}
+        self.drawn_edges = {}
+        self.node_fill = {}
+        self.edge_style = {}
+        self.edges_only = False
+        self.selection = set()
+        self.canvas.bind("<Configure>", self._configure)
+        self.canvas.bind("<Button-1>", self._click)
+        self.canvas.bind("<Motion>", self._motion)
+        self.canvas.bind("<Leave>", lambda event: self.on_motion(None, None))
+        self.canvas.bind("<MouseWheel>", self._wheel)
+        self.canvas.bind("<Button-4>", lambda event: self._zoom(event, self.ZOOM_STEP))
+        self.canvas.bind("<Button-5>", lambda event: self._zoom(event, 1 / self.ZOOM_STEP))
+        for press, drag in (("<ButtonPress-2>", "<B2-Motion>"), ("<Shift-ButtonPress-1>", "<Shift-B1-Motion>")):
+            self.canvas.bind(press, lambda event: self.canvas.scan_mark(event.x, event.y))
+            self.canvas.bind(drag, self._pan)
+
+    # ----- prevod súradníc a pohľad -----
+
+    def _to_canvas(self, x, y):
+        return x * self.scale + self.origin[0], self.origin[1] - y * self.scale
+
+    def _to_world(self, event):
+        cx, cy = self.canvas.canvasx(event.x), self.canvas.canvasy(event.y)
+        return (cx - self.origin[0]) / self.scale, (self.origin[1] - cy) / self.scale
+
+    def _visible_rect(self):
+        left, top = self.canvas.canvasx(0), self.canvas.canvasy(0)
+        right = left + self.canvas.winfo_width()
+        bottom = top + self.canvas.winfo_height()
+        return ((left - self.origin[0]) / self.scale, (self.origin[1] - bottom) / self.scale,
+                (right - self.origin[0]) / self.scale, (self.origin[1] - top) / self.scale)
+
+    def _fit(self, width, height):
+        x0, x1, y0, y1 = FIXED_LIMITS
+        scale = min(width / (x1 - x0), height / (y1 - y0))
+        origin = (width / 2 - (x0 + x1) / 2 * scale, height / 2 + (y0 + y1) / 2 * scale)
+        self._set_view(scale, origin)
+
+    def _set_view(self, scale, origin):
+        # Existujúce položky sa prepočítajú natívne v Tk, bez prechodu grafom v Pythone.
+        factor = scale / self.scale
+        self.canvas.delete('tooltip')
+        self.canvas.scale('graph', self.origin[0], self.origin[1], factor, factor)
+        self.canvas.move('graph', origin[0] - self.origin[0], origin[1] - self.origin[1])
+        self.scale = scale
+        self.origin = origin
+        self._update_label_visibility()
+        self._schedule_view_update()
+
+    def _schedule_view_update(self):
+        # Pri rýchlom posúvaní alebo točení kolieskom sa obsah záberu doplní raz po krátkej pauze.
+        if self.view_job is None:
+            self.view_job = self.canvas.after(30, self._view_changed)
+
+    def _view_changed(self):
+        self.view_job = None
+        if self.index is not None:
+            self._update_items()
+            self._update_label_visibility()
+
+    def _configure(self, event):
+        if not self.view_fitted:
+            self._fit(event.width, event.height)
+        else:
+            self._schedule_view_update()
+
+    def _click(self, event):
+        self.on_click(*self._to_world(event))
+
+    def _motion(self, event):
+        self.on_motion(*self._to_world(event))
+
+    def _pan(self, event):
+        self.view_fitted = True
+        self.canvas.scan_dragto(event.x, event.y, gain=1)
+        self._schedule_view_update()
+
+    def _wheel(self, event):
+        self._zoom(event, self.ZOOM_STEP if event.delta > 0 else 1 / self.ZOOM_STEP)
+
+    def _zoom(self, event, factor):
+        cx, cy = self.canvas.canvasx(event.x), self.canvas.canvasy(event.y)
+        self.view_fitted = True
+        self._set_view(self.scale * factor, (cx + (self.origin[0] - cx) * factor, cy + (self.origin[1] - cy) * factor))
+
+    def _update_label_visibility(self):
+        labels = self.radius * self.scale >= self.MIN_LABEL_RADIUS
+        self.canvas.itemconfigure('label', state=tk.NORMAL if labels else tk.HIDDEN)
+        weights = labels and self.show_weights
+        self.canvas.itemconfigure('weight', state=tk.NORMAL if weights else tk.HIDDEN)
+
+    # ----- synchronizácia položiek so záberom -----
+
+    def _edge_coords(self, u, v):
+        (x0, y0), (x1, y1) = self.node_xy[u], self.node_xy[v]
+        dx, dy = x1 - x0, y1 - y0
+        length = math.hypot(dx, dy) or 1.0
+        # Hrana začína a končí na okraji vrcholu, aby šípka nebola prekrytá.
+        trim = min(self.radius, length / 2) / length
+        start = self._to_canvas(x0 + dx * trim, y0 + dy * trim)
+        end = self._to_canvas(x1 - dx * trim, y1 - dy * trim)
+        if not self.directed:
+            return start + end, ((start[0] + end[0]) / 2, (start[1] + end[1]) / 2)
+        # Mierne zakrivenie ako arc3,rad=0.1 oddelí hrany u->v a v->u.
+        control = self._to_canvas((x0 + x1) / 2 + 0.1 * dy, (y0 + y1) / 2 - 0.1 * dx)
+        return start + control + end, control
+
+    def _edge_options(self, key):
+        options = {'fill': 'black', 'width': 1, 'dash': ''}
+        options.update(self.edge_style.get(key, {}))
+        return options
+
+    def _create_node(self, node):
+        cx, cy = self._to_canvas(*self.node_xy[node])
+        r = self.radius * self.scale
+        selected = node in self.selection
+        self.nodes[node] = (
+            self.canvas.create_oval(cx - r, cy - r, cx + r, cy + r, fill=self.node_fill.get(node, NODE_COLOR),
+                                    outline='red' if selected else '', width=3 if selected else 1,
+                                    tags=('graph', 'node')),
+            self.canvas.create_text(cx, cy, text=str(node), tags=('graph', 'label')),
+        )
+
+    def _create_edge(self, key):
+        coords, _ = self._edge_coords(*key)
+        if self.directed:
+            item = self.canvas.create_line(*coords, smooth=True, arrow=tk.LAST, tags=('graph', 'edge'),
+                                           **self._edge_options(key))
+        else:
+            item = self.canvas.create_line(*coords, tags=('graph', 'edge'), **self._edge_options(key))
+        self.canvas.tag_lower(item)
+        self.edges[key] = item
+
+    def _clear(self):
+        self.canvas.delete('graph')
+        self.index = None
+        self.nodes = {}
+        self.edges = {}
+        self.weights = {}
+        self.weight_values = {}
+        self.drawn = {}
+        self.drawn_edges = {}
+
+    def _sync(self, graph, positions, show_weights, directed=None):
+        if directed is None:
+            directed = self.directed if graph is self.graph else graph.is_directed()
+        if graph is not self.graph or directed != self.directed:
+            self._clear()
+            self.graph = graph
+            self.directed = directed
+            x0, x1, y0, y1 = FIXED_LIMITS
+            self.radius = min(0.5, 0.4 * math.sqrt((x1 - x0) * (y1 - y0) / max(1, len(graph))))
+        if self.index is None:
+            self.index = ViewIndex(graph, positions)
+            self.node_xy = self.index.node_positions()
+        self.show_weights = show_weights
+        self._update_items()
+        self._restyle()
+        self._update_label_visibility()
+
+    def _update_items(self):
+        # Práca závisí od počtu vrcholov a hrán v zábere, nie od veľkosti grafu.
+        canvas = self.canvas
+        nodes, edges = self.index.query(*self._visible_rect(), margin=self.radius)
+        if self.edges_only:
+            edges = [key for key in edges if key in self.edge_style]
+        visible_nodes = set(nodes)
+        visible_edges = set(edges)
+        for node in [node for node in self.nodes if node not in visible_nodes]:
+            canvas.delete(*self.nodes.pop(node))
+            del self.drawn[node]
+        for key in [key for key in self.edges if key not in visible_edges]:
+            canvas.delete(self.edges.pop(key))
+            del self.drawn_edges[key]
+            if key in self.weights:
+                canvas.delete(self.weights.pop(key))
+                del self.weight_values[key]
+
+        r = self.radius * self.scale
+        for node in nodes:
+            xy = self.node_xy[node]
+            if node not in self.nodes:
+                self._create_node(node)
+            elif self.drawn[node] != xy:
+                cx, cy = self._to_canvas(*xy)
+                oval, label = self.nodes[node]
+                canvas.coords(oval, cx - r, cy - r, cx + r, cy + r)
+                canvas.coords(label, cx, cy)
+            self.drawn[node] = xy
+        for key in edges:
+            ends = (self.node_xy[key[0]], self.node_xy[key[1]])
+            if key not in self.edges:
+                self._create_edge(key)
+            elif self.drawn_edges[key] != ends:
+                coords, (x, y) = self._edge_coords(*key)
+                canvas.coords(self.edges[key], *coords)
+                if key in self.weights:
+                    canvas.coords(self.weights[key], x, y)
+            self.drawn_edges[key] = ends
+        if self.show_weights:
+            for key in edges:
+                data = self.graph.get_edge_data(*key)
+                if data is None:
+                    continue
+                weight = data.get('weight', 1)
+                if key not in self.weights:
+                    _, (x, y) = self._edge_coords(*key)
+                    self.weights[key] = canvas.create_text(x, y, text=str(weight), fill='black',
+                                                           tags=('graph', 'weight'))
+                    self.weight_values[key] = weight
+                elif self.weight_values[key] != weight:
+                    self.weight_values[key] = weight
+                    canvas.itemconfigure(self.weights[key], text=str(weight))
+        canvas.tag_raise('node')
+        canvas.tag_raise('label')
+        canvas.tag_raise('weight')
+
+    def _restyle(self):
+        # Jedno volanie na značku vráti predvolené farby, potom sa upravia iba zvýraznené položky.
+        canvas = self.canvas
+        canvas.itemconfigure('node', fill=NODE_COLOR, outline='', width=1)
+        canvas.itemconfigure('edge', fill='black', width=1, dash='')
+        for node, color in self.node_fill.items():
+            items = self.nodes.get(node)
+            if items is not None:
+                canvas.itemconfigure(items[0], fill=color)
+        for node in self.selection:
+            items = self.nodes.get(node)
+            if items is not None:
+                canvas.itemconfigure(items[0], outline='red', width=3)
+        for key, options in self.edge_style.items():
+            item = self.edges.get(key)
+            if item is not None:
+                canvas.itemconfigure(item, **options)
+
+    def _set_styles(self, node_fill=None, edge_style=None, edges_only=False, legend=()):
+        self.node_fill = node_fill or {}
+        self.edge_style = edge_style or {}
+        self.edges_only = edges_only
+        self._set_legend(legend)
+
+    def _style_edges(self, styles, edges, **options):
+        # Neorientovaná hrana môže byť v kroku zapísaná v opačnom poradí ako v grafe.
+        for u, v in edges:
+            styles[(u, v)] = options
+            if not self.directed:
+                styles[(v, u)] = options
+
+    def _set_legend(self, entries):
+        for child in self.legend.winfo_children():
+            child.destroy()
+        if not entries:
+            self.legend.place_forget()
+            return
+        for text, color in entries:
+            tk.Label(self.legend, text=f"━━ {text}", foreground=color, background="white",
+                     anchor=tk.W).pack(fill=tk.X, padx=4)
+        self.legend.place(relx=1.0, x=-10, y=10, anchor=tk.NE)
+
+    # ----- rozhranie vykresľovača -----
+
+    def invalidate(self):
+        self.index = None
+
+    def draw_graph(self, graph, positions, show_weights, directed):
+        self._set_styles()
+        self._sync(graph, positions, show_weights, directed)
+
+    def has_frame(self, frame_key, show_weights):
+        return False
+
+    def prerender(self, graph, positions, show_weights, keys, load_step):
+        # Krok sa na plátne iba prefarbí, obrázky krokov sa neoplatí pripravovať vopred.
+        pass
+
+    def draw_step(self, graph, positions, step, show_weights, frame_key=None):
+        edge_style = {}
+        if step.get('edges'):
+            self._style_edges(edge_style, step['edges'], fill='green', width=2)
+        else:
+            self._style_edges(edge_style, step.get('updated_edges', []), fill='green', width=2)
+            self._style_edges(edge_style, step.get('no_update_edges', []), fill='red', width=2, dash=(6, 4))
+        node_fill = {}
+        for key, color in (('forward_frontier', 'lightgreen'), ('backward_frontier', 'plum'), ('highlight', 'yellow')):
+            node_fill.update(dict.fromkeys(step.get(key, []), color))
+        self._set_styles(node_fill, edge_style, bool(step.get('edges')), step_legend(step))
+        self._sync(graph, positions, show_weights)
+
+    def draw_transition(self, graph, positions, step, frac):
+        width = 1 + 3 * frac
+        edge_style = {}
+        self._style_edges(edge_style, step.get('updated_edges', []), fill='green', width=width)
+        self._style_edges(edge_style, step.get('no_update_edges', []), fill='red', width=width, dash=(6, 4))
+        self._set_styles(edge_style=edge_style)
+        self._sync(graph, positions, False)
+
+    def draw_scc(self, graph, positions, sccs, show_weights):
+        node_fill = {}
+        for i, component in enumerate(sccs):
+            node_fill.update(dict.fromkeys(component, SCC_COLORS[i % len(SCC_COLORS)]))
+        self._set_styles(node_fill)
+        self._sync(graph, positions, show_weights)
+
+    def draw_condensation(self, view, show_weights):
+        # Kondenzácia má iba toľko položiek, koľko je komponent, kreslí sa preto celá nanovo
+        # a hlavný graf sa pri ďalšom vykreslení zostaví znova.
+        self._clear()
+        self.graph = None
+        self._set_styles()
+        self.show_weights = show_weights
+        canvas = self.canvas
+        graph, positions, radius = view['graph'], view['positions'], view['radius']
+        self.radius = min(radius.values(), default=0.5)
+        for node in sorted(graph, key=radius.get, reverse=True):
+            cx, cy = self._to_canvas(*positions[node])
+            r = radius[node] * self.scale
+            canvas.create_oval(cx - r, cy - r, cx + r, cy + r, outline='',
+                               fill=SCC_COLORS[view['colors'][node] % len(SCC_COLORS)], tags=('graph', 'node'))
+            canvas.create_text(cx, cy, text=view['labels'][node], tags=('graph', 'label'))
+        for u, v, weight in graph.edges(data='weight'):
+            (x0, y0), (x1, y1) = positions[u], positions[v]
+            dx, dy = x1 - x0, y1 - y0
+            length = math.hypot(dx, dy) or 1.0
+            start = self._to_canvas(x0 + dx * radius[u] / length, y0 + dy * radius[u] / length)
+            end = self._to_canvas(x1 - dx * radius[v] / length, y1 - dy * radius[v] / length)
+            item = canvas.create_line(*start, *end, arrow=tk.LAST, width=1 + min(5, math.log2(weight)),
+                                      tags=('graph', 'edge'))
+            canvas.tag_lower(item)
+            canvas.create_text((start[0] + end[0]) / 2, (start[1] + end[1]) / 2, text=str(weight),
+                               tags=('graph', 'weight'))
+        canvas.tag_raise('node')
+        canvas.tag_raise('label')
+        canvas.tag_raise('weight')
+        self._update_label_visibility()
+
+    def set_selection(self, graph, positions, nodes):
+        self.selection = set(nodes)
+        self.canvas.itemconfigure('node', outline='', width=1)
+        for node in self.selection:
+            items = self.nodes.get(node)
+            if items is not None:
+                self.canvas.itemconfigure(items[0], outline='red', width=3)
+
+    def show_tooltip(self, xy, text):
+        self.canvas.delete('tooltip')
+        cx, cy = self._to_canvas(float(xy[0]), float(xy[1]))
+        label = self.canvas.create_text(cx + 14, cy - 14, text=text, anchor=tk.SW, tags=('tooltip',))
+        x0, y0, x1, y1 = self.canvas.bbox(label)
+        box = self.canvas.create_rectangle(x0 - 4, y0 - 3, x1 + 4, y1 + 3, fill="lightyellow",
+                                           outline="gray", tags=('tooltip',))
+        self.canvas.tag_raise(label, box)
+
+    def hide_tooltip(self):
+        self.canvas.delete('tooltip')
+
+    def refresh(self):
+        pass
+
+    def figure_size(self):
+        dpi = 100
+        width = max(self.canvas.winfo_width(), 600) / dpi
+        height = max(self.canvas.winfo_height(), 400) / dpi
+        return (width, height), dpi
+
+    def destroy(self):
+        if self.view_job is not None:
+            self.canvas.after_cancel(self.view_job)
+        self.canvas.destroy()
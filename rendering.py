@@ -0,0 +1,101 @@
+import matplotlib.lines as mlines
+import networkx as nx
+
+
+def draw_transition_frame(ax, graph, positions, step, frac):
+    ax.clear()
+    ax.set_axis_on()
+    ax.grid(True)
+    nx.draw_networkx_nodes(graph, positions, ax=ax, node_color='skyblue', node_size=500)
+    nx.draw_networkx_edges(graph, positions, ax=ax, edge_color='black', width=1)
+    nx.draw_networkx_labels(graph, positions, ax=ax)
+    updated_edges = step.get('updated_edges', [])
+    if updated_edges:
+        width = 1 + 3 * frac
+        nx.draw_networkx_edges(
+            graph, positions,
+            ax=ax,
+            edgelist=updated_edges,
+            edge_color='green',
+            width=width
+        )
+    no_update_edges = step.get('no_update_edges', [])
+    if no_update_edges:
+        width = 1 + 3 * frac
+        nx.draw_networkx_edges(
+            graph, positions,
+            ax=ax,
+            edgelist=no_update_edges,
+            edge_color='red',
+            width=width,
+            style='dashed'
+        )
+
+
+def draw_step(ax, graph, positions, step, show_weights):
+    ax.clear()
+    ax.set_axis_on()
+    ax.grid(True)
+
+    nx.draw_networkx_nodes(graph, positions, ax=ax, node_color='skyblue', node_size=500)
+
+    if 'edges' in step and step['edges']:
+        nx.draw_networkx_edges(
+            graph, positions, ax=ax,
+            edgelist=step['edges'], edge_color='green', width=2
+        )
+    else:
+        nx.draw_networkx_edges(graph, positions, ax=ax, edge_color='black', width=1)
+        updated_edges = step.get('updated_edges', [])
+        no_update_edges = step.get('no_update_edges', [])
+        if updated_edges:
+            nx.draw_networkx_edges(
+                graph, positions, ax=ax,
+                edgelist=updated_edges, edge_color='green', width=2
+            )
+        if no_update_edges:
+            nx.draw_networkx_edges(
+                graph, positions, ax=ax,
+                edgelist=no_update_edges, edge_color='red', width=2, style='dashed'
+            )
+
+    # Obojsmerné hľadanie: hranice oboch strán odlíšené farbou.
+    forward_frontier = step.get('forward_frontier', [])
+    if forward_frontier:
+        nx.draw_networkx_nodes(
+            graph, positions, nodelist=forward_frontier, ax=ax,
+            node_color='lightgreen', node_size=500
+        )
+    backward_frontier = step.get('backward_frontier', [])
+    if backward_frontier:
+        nx.draw_networkx_nodes(
+            graph, positions, nodelist=backward_frontier, ax=ax,
+            node_color='plum', node_size=500
+        )
+
+    highlight = step.get('highlight', [])
+    if highlight:
+        nx.draw_networkx_nodes(
+            graph, positions, nodelist=highlight, ax=ax,
+            node_color='yellow', node_size=500
+        )
+
+    nx.draw_networkx_labels(graph, positions, ax=ax)
+
+    if show_weights:
+        edge_labels = nx.get_edge_attributes(graph, 'weight')
+        nx.draw_networkx_edge_labels(graph, positions, edge_labels=edge_labels, ax=ax)
+
+    handles = []
+    if step.get('updated_edges', []):
+        green_line = mlines.Line2D([], [], color='green', linewidth=2, label='Aktualizácia (Update)')
+        handles.append(green_line)
+    if step.get('no_update_edges', []):
+        red_line = mlines.Line2D([], [], color='red', linewidth=2, linestyle='dashed', label='Bez aktualizácie')
+        handles.append(red_line)
+    if forward_frontier:
+        handles.append(mlines.Line2D([], [], color='lightgreen', marker='o', linestyle='None', markersize=10, label='Dopredná hranica'))
+    if backward_frontier:
+        handles.append(mlines.Line2D([], [], color='plum', marker='o', linestyle='None', markersize=10, label='Spätná hranica'))
+    if handles:
+        ax.legend(handles=handles, loc='upper right')
@@ -1,4 +1,7 @@
 import networkx as nx
+import numpy as np
+
+from positions import PositionStore
 
 def get_sample_graph_1():
     G = nx.Graph()
@@ -53,4 +56,198 @@ def get_complex_graph():
         (8, 9, 9), (9, 10, 10), (10, 1, 11)
     ]
     G.add_weighted_edges_from(edges)
-    return G, positions
\ No newline at end of file
+    return G, positions
+
+# ----------------------- Generátory veľkých grafov -----------------------
+
+GENERATED_EXTENT = 9.5
+
+
+def _scale_to_extent(xy):
+    xy = xy - xy.min(axis=0)
+    span = xy.max()
+    if span > 0:
+        xy = xy * (2 * GENERATED_EXTENT / span)
+    return xy - GENERATED_EXTENT
+
+
+def _positions_from_array(xy):
+    return PositionStore.from_array(range(1, len(xy) + 1), xy)
+
+
+def _build_graph(graph_class, n, src, dst, weights):
+    G = graph_class()
+    G.add_nodes_from(range(1, n + 1))
+    G.add_weighted_edges_from(zip((src + 1).tolist(), (dst + 1).tolist(), weights.tolist()))
+    return G
+
+
+def _euclidean(xy, src, dst):
+    return np.hypot(xy[src, 0] - xy[dst, 0], xy[src, 1] - xy[dst, 1])
+
+
+def _grid_shape(n):
+    cols = int(np.ceil(np.sqrt(n)))
+    rows = int(np.ceil(n / cols))
+    return rows, cols
+
+
+def _grid_edges(n, cols):
+    idx = np.arange(n)
+    right = idx[(idx % cols != cols - 1) & (idx + 1 < n)]
+    down = idx[idx + cols < n]
+    return right, down
+
+
+def generate_grid_graph(n):
+    _, cols = _grid_shape(n)
+    idx = np.arange(n)
+    xy = _scale_to_extent(np.column_stack((idx % cols, -(idx // cols))).astype(float))
+    right, down = _grid_edges(n, cols)
+    src = np.concatenate((right, down))
+    dst = np.concatenate((right + 1, down + cols))
+    weights = np.round(_euclidean(xy, src, dst), 3)
+    return _build_graph(nx.Graph, n, src, dst, weights), _positions_from_array(xy)
+
+
+def generate_road_graph(n, seed=None, removal=0.25, diagonal=0.3, detour=0.3):
+    rng = np.random.default_rng(seed)
+    _, cols = _grid_shape(n)
+    idx = np.arange(n)
+    xy = np.column_stack((idx % cols, -(idx // cols))).astype(float)
+    xy += rng.uniform(-0.35, 0.35, size=xy.shape)
+    xy = _scale_to_extent(xy)
+
+    right, down = _grid_edges(n, cols)
+    # Vertikálne hrany v prvom stĺpci ostávajú, takže graf zostane súvislý.
+    keep_down = (down % cols == 0) | (rng.random(len(down)) >= removal)
+    down = down[keep_down]
+    # Najviac jedna uhlopriečka na bunku zachová rovinnosť.
+    cells = idx[(idx % cols != cols - 1) & (idx + cols + 1 < n)]
+    cells = cells[rng.random(len(cells)) < diagonal]
+
+    src = np.concatenate((right, down, cells))
+    dst = np.concatenate((right + 1, down + cols, cells + cols + 1))
+    # Váha nie je menšia ako euklidovská vzdialenosť, heuristika A* ostáva prípustná.
+    weights = _euclidean(xy, src, dst) * (1 + rng.uniform(0, detour, size=len(src)))
+    return _build_graph(nx.Graph, n, src, dst, np.round(weights, 3)), _positions_from_array(xy)
+
+
+def _cell_pairs(cell_x, cell_y, grid_w, order, offset_x, offset_y, same_cell):
+    cell_ids = cell_y * grid_w + cell_x
+    sorted_ids = cell_ids[order]
+    target_x = cell_x[order] + offset_x
+    target_y = cell_y[order] + offset_y
+    valid = (target_x >= 0) & (target_x < grid_w) & (target_y >= 0) & (target_y <= cell_y.max())
+    target = np.where(valid, target_y * grid_w + target_x, -1)
+    starts = np.searchsorted(sorted_ids, target, side='left')
+    ends = np.searchsorted(sorted_ids, target, side='right')
+    counts = np.where(valid, ends - starts, 0)
+    if same_cell:
+        # V rovnakej bunke berieme iba dvojice (i, j) s i < j.
+        first = np.arange(len(order))
+        counts = np.maximum(ends - first - 1, 0)
+        starts = first + 1
+    total = int(counts.sum())
+    if total == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    src = np.repeat(np.arange(len(order)), counts)
+    offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+    dst = np.repeat(starts, counts) + offsets
+    return order[src], order[dst]
+
+
+def generate_random_geometric_graph(n, radius=None, seed=None):
+    rng = np.random.default_rng(seed)
+    if radius is None:
+        # Priemerný stupeň približne 8.
+        radius = np.sqrt(8 / (np.pi * n))
+    points = rng.random((n, 2))
+    cell_x = np.minimum((points[:, 0] / radius).astype(np.int64), int(1 / radius))
+    cell_y = np.minimum((points[:, 1] / radius).astype(np.int64), int(1 / radius))
+    grid_w = int(1 / radius) + 1
+    order = np.argsort(cell_y * grid_w + cell_x, kind='stable')
+
+    src_parts, dst_parts = [], []
+    for offset_x, offset_y, same_cell in ((0, 0, True), (1, 0, False), (-1, 1, False), (0, 1, False), (1, 1, False)):
+        src, dst = _cell_pairs(cell_x, cell_y, grid_w, order, offset_x, offset_y, same_cell)
+        close = np.hypot(*(points[src] - points[dst]).T) <= radius
+        src_parts.append(src[close])
+        dst_parts.append(dst[close])
+    src = np.concatenate(src_parts)
+    dst = np.concatenate(dst_parts)
+
+    xy = _scale_to_extent(points)
+    weights = np.round(_euclidean(xy, src, dst), 3)
+    return _build_graph(nx.Graph, n, src, dst, weights), _positions_from_array(xy)
+
+
+def generate_scc_dag(n, num_sccs=None, seed=None, extra_edges=1.0, dag_edges=1.0):
+    rng = np.random.default_rng(seed)
+    if num_sccs is None:
+        num_sccs = max(1, int(np.sqrt(n)))
+    num_sccs = int(min(max(num_sccs, 1), n))
+    component = np.sort(rng.integers(0, num_sccs, size=n))
+    component[:num_sccs] = np.arange(num_sccs)
+    component = np.sort(component)
+    starts = np.searchsorted(component, np.arange(num_sccs))
+    sizes = np.diff(np.append(starts, n))
+
+    # Cyklus v každej komponente ju robí silne súvislou.
+    idx = np.arange(n)
+    cycle_next = idx + 1
+    last = starts + sizes - 1
+    cycle_next[last] = starts
+    cyclic = sizes[component] > 1
+    src_parts = [idx[cyclic]]
+    dst_parts = [cycle_next[cyclic]]
+
+    extra = int(n * extra_edges)
+    if extra:
+        src = rng.integers(0, n, size=extra)
+        dst = starts[component[src]] + (rng.random(extra) * sizes[component[src]]).astype(np.int64)
+        src_parts.append(src)
+        dst_parts.append(dst)
+
+    # Hrany medzi komponentmi idú iba dopredu, kondenzácia je preto DAG.
+    between = int(n * dag_edges) if num_sccs > 1 else 0
+    if between:
+        src = rng.integers(0, starts[-1], size=between)
+        lo = component[src] + 1
+        target_comp = lo + (rng.random(between) * (num_sccs - lo)).astype(np.int64)
+        dst = starts[target_comp] + (rng.random(between) * sizes[target_comp]).astype(np.int64)
+        src_parts.append(src)
+        dst_parts.append(dst)
+
+    src = np.concatenate(src_parts)
+    dst = np.concatenate(dst_parts)
+    keep = src != dst
+    src, dst = src[keep], dst[keep]
+    weights = rng.integers(1, 10, size=len(src))
+
+    angle = 2 * np.pi * np.arange(num_sccs) / num_sccs
+    ring = np.column_stack((np.cos(angle), np.sin(angle))) * np.sqrt(num_sccs)
+    local = (idx - starts[component]) * 2 * np.pi / sizes[component]
+    spread = 0.35 * np.sqrt(sizes[component])
+    xy = ring[component] + np.column_stack((np.cos(local), np.sin(local))) * spread[:, None]
+    xy = _scale_to_extent(xy)
+    return _build_graph(nx.DiGraph, n, src, dst, weights), _positions_from_array(xy)
+
+
+def generate_negative_weight_graph(n, avg_degree=3, seed=None):
+    rng = np.random.default_rng(seed)
+    m = int(n * avg_degree)
+    src = rng.integers(0, n, size=m)
+    dst = rng.integers(0, n, size=m)
+    keep = src != dst
+    src, dst = src[keep], dst[keep]
+    # Potenciálový trik: w(u, v) = w'(u, v) + p(u) - p(v) s w' >= 1.
+    # Súčet váh po každom cykle je rovný súčtu w', takže záporný cyklus nevznikne.
+    base = rng.integers(1, 10, size=len(src))
+    potential = rng.integers(0, 10, size=n)
+    weights = base + potential[src] - potential[dst]
+
+    angle = rng.random(n) * 2 * np.pi
+    radius = np.sqrt(rng.random(n))
+    xy = _scale_to_extent(np.column_stack((radius * np.cos(angle), radius * np.sin(angle))))
+    return _build_graph(nx.DiGraph, n, src, dst, weights), _positions_from_array(xy)
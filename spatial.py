@@ -0,0 +1,102 @@
+from itertools import chain
+
+import numpy as np
+
+from positions import PositionStore
+
+
+class GridIndex:
+    # Rovnomerná mriežka nad obdĺžnikmi (x0, y0, x1, y1): obdĺžnik sa zapíše do všetkých buniek,
+    # ktoré prekrýva, a bunky jedného riadku mriežky ležia v poli za sebou (CSR).
+    # Obdĺžniky cez príliš veľa buniek (dlhé hrany) sa namiesto toho testujú pri každom dotaze.
+    MAX_CELLS_PER_ITEM = 64
+
+    def __init__(self, boxes):
+        self.boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+        n = len(self.boxes)
+        if n == 0:
+            self.origin = np.zeros(2)
+            self.cell = 1.0
+            self.cols = self.rows = 1
+            self.indptr = np.zeros(2, dtype=np.int64)
+            self.items = np.empty(0, dtype=np.int64)
+            self.large = np.empty(0, dtype=np.int64)
+            return
+        self.origin = self.boxes[:, :2].min(axis=0)
+        extent = self.boxes[:, 2:].max(axis=0) - self.origin
+        # Približne jedna položka na bunku pri rovnomernom rozložení.
+        self.cell = max(float(extent.max()) / max(1.0, np.sqrt(n)), 1e-9)
+        self.cols, self.rows = (np.floor(extent / self.cell).astype(np.int64) + 1).tolist()
+        first = self._cells(self.boxes[:, :2])
+        last = self._cells(self.boxes[:, 2:])
+        spans = last - first + 1
+        counts = spans[:, 0] * spans[:, 1]
+        large = counts > self.MAX_CELLS_PER_ITEM
+        self.large = np.flatnonzero(large)
+        small = np.flatnonzero(~large)
+        repeats = counts[small]
+        items = np.repeat(small, repeats)
+        offsets = np.arange(len(items)) - np.repeat(np.cumsum(repeats) - repeats, repeats)
+        width = np.repeat(spans[small, 0], repeats)
+        cx = np.repeat(first[small, 0], repeats) + offsets % width
+        cy = np.repeat(first[small, 1], repeats) + offsets // width
+        cell_ids = cy * self.cols + cx
+        order = np.argsort(cell_ids, kind='stable')
+        self.items = items[order]
+        self.indptr = np.zeros(self.cols * self.rows + 1, dtype=np.int64)
+        np.cumsum(np.bincount(cell_ids, minlength=self.cols * self.rows), out=self.indptr[1:])
+
+    def _cells(self, points):
+        cells = np.floor((points - self.origin) / self.cell).astype(np.int64)
+        return np.clip(cells, 0, [self.cols - 1, self.rows - 1])
+
+    def query(self, x0, y0, x1, y1):
+        # Indexy obdĺžnikov, ktoré sa prekrývajú so zadaným obdĺžnikom.
+        (cx0, cy0), (cx1, cy1) = self._cells(np.array([[x0, y0], [x1, y1]])).tolist()
+        parts = [self.large]
+        for row in range(cy0, cy1 + 1):
+            start = row * self.cols
+            parts.append(self.items[self.indptr[start + cx0]:self.indptr[start + cx1 + 1]])
+        candidates = np.unique(np.concatenate(parts))
+        boxes = self.boxes[candidates]
+        hit = (boxes[:, 0] <= x1) & (boxes[:, 2] >= x0) & (boxes[:, 1] <= y1) & (boxes[:, 3] >= y0)
+        return candidates[hit]
+
+
+class ViewIndex:
+    # Vrcholy a hrany grafu v dvoch mriežkach; vykresľovač sa pýta iba na to, čo je v zábere.
+    def __init__(self, graph, positions):
+        self.nodes = list(graph.nodes())
+        self.edges = list(graph.edges())
+        index = {node: i for i, node in enumerate(self.nodes)}
+        ends = np.fromiter(map(index.__getitem__, chain.from_iterable(self.edges)), dtype=np.int64,
+                           count=2 * len(self.edges))
+        src, dst = ends[0::2], ends[1::2]
+        if isinstance(positions, PositionStore):
+            self.xy = positions.coords(self.nodes)
+        else:
+            self.xy = np.array([(pos[0], pos[1]) for pos in map(positions.__getitem__, self.nodes)],
+                               dtype=np.float64).reshape(-1, 2)
+        self.node_grid = GridIndex(np.hstack((self.xy, self.xy)))
+        a, b = self.xy[src], self.xy[dst]
+        self.edge_grid = GridIndex(np.hstack((np.minimum(a, b), np.maximum(a, b))))
+
+    def node_positions(self):
+        return dict(zip(self.nodes, map(tuple, self.xy.tolist())))
+
+    def query(self, x0, y0, x1, y1, margin=0.0):
+        nodes = self.node_grid.query(x0 - margin, y0 - margin, x1 + margin, y1 + margin)
+        edges = self.edge_grid.query(x0 - margin, y0 - margin, x1 + margin, y1 + margin)
+        return [self.nodes[i] for i in nodes.tolist()], [self.edges[i] for i in edges.tolist()]
+
+    def nearest(self, x, y, threshold):
+        # Najbližší vrchol v okolí bodu; mriežka vráti iba kandidátov zo štvorca okolo neho.
+        rows = self.node_grid.query(x - threshold, y - threshold, x + threshold, y + threshold)
+        if len(rows) == 0:
+            return None
+        xy = self.xy[rows]
+        dist = np.hypot(xy[:, 0] - x, xy[:, 1] - y)
+        best = int(np.argmin(dist))
+        if dist[best] >= threshold:
+            return None
+        return self.nodes[int(rows[best])]
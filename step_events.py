@@ -0,0 +1,120 @@
+from collections.abc import Sequence
+
+# Kroky ukladajú udalosti ako n-tice (druh, argumenty...).
+# Text sa vytvára až pri zobrazení kroku v bočnom paneli.
+DETAIL_TEMPLATES = {
+    'dijkstra_node': "Spracovávaný vrchol: {0} (vzdialenosť: {1})",
+    'dijkstra_edge': "Zvažovaná hrana ({0} → {1}) s váhou {2}",
+    'dijkstra_update': "Aktualizácia: vzdialenosť {0} = {1}",
+    'predecessor': "Predchodca {0} = {1}",
+    'dijkstra_no_update': "Bez zmeny pre {0} (aktuálna vzdialenosť: {1})",
+    'bf_iteration': "Iterácia {0}: Relaxácia hrán",
+    'bf_edge': " Kontrola hrany ({0} → {1}), váha {2}",
+    'bf_update': "Aktualizácia: d({0}) = {1}",
+    'bf_no_update': "Bez zmeny pre {0} (d = {1})",
+    'bf_negative_cycle': " Detekovaný záporný cyklus na hrane ({0} → {1}) s váhou {2}",
+    'astar_node': "Spracovávame vrchol {0} (f = {1:.2f})",
+    'astar_update': "Aktualizácia: g({0}) = {1:.2f}, f({0}) = {2:.2f}",
+    'astar_no_update': "Bez aktualizácie pre {0} (g = {1:.2f})",
+    'astar_open_list': "Otvárací zoznam: {0}",
+    'astar_expansions': "Expandované vrcholy ({0} heuristika): {1}, bez heuristiky: {2}, ušetrené: {3}",
+    'astar_expansions_euclid': "Euklidovská heuristika expanduje {0} vrcholov, ALT ušetrila {1}",
+    'dijkstra_target_settled': "Cieľ {0} ustálený so vzdialenosťou {1}, hľadanie končí.",
+    'explored_nodes': "Preskúmané vrcholy: {0} z {1}",
+    'bidir_node': "Smer {0}: spracovávaný vrchol {1} (vzdialenosť: {2})",
+    'bidir_meet': "Stretnutie vo vrchole {0}: najlepšia cesta μ = {1}",
+    'bidir_stop': "Koniec: {0:.2f} + {1:.2f} ≥ μ = {2}",
+    'bidir_result': "Dĺžka najkratšej cesty: {0}",
+    'delta_phase': "Kôš {0} (vzdialenosti {1:g} až {2:g}): ustálených {3} vrcholov",
+    'delta_relaxations': "Ľahké hrany: {0} kôl, {1} relaxácií; ťažké hrany: {2} relaxácií",
+    'delta_updates': "Zlepšené vzdialenosti: {0} vrcholov",
+    'delta_result': "Dĺžka najkratšej cesty: {0:g} po {1} fázach",
+    'edge_value': "Hrana ({0}->{1}), hodnota {2}",
+    'prim_start': "Začiatok vo vrchole {0}",
+    'prim_initial_edges': "Počiatočné hrany: {0}",
+    'prim_node_added': "vrchol {0} pridaný do MST.",
+    'prim_queue': "Zoznam: {0}",
+    'kruskal_early_stop': "Kostra má {0} hrán, zvyšných {1} hrán sa už nekontroluje.",
+    'boruvka_round': "Kolo {0}: {1} komponentov zlúčených na {2}",
+    'boruvka_selected': "Vybraných {0} najlacnejších hrán, váha kostry zatiaľ {1:g}",
+    'boruvka_done': "Borůvkov algoritmus dokončený po {0} kolách: {1} hrán, celková váha {2:g}",
+    'boruvka_forest': "Graf nie je súvislý, výsledkom je les s {0} stromami.",
+    'kosaraju_visit': "Fáza 1: Návšteva vrcholu {0}",
+    'kosaraju_finished': "Fáza 1: vrchol {0} dokončený, pridaný do zásobníka",
+    'kosaraju_dfs': "Fáza 3: DFS z vrcholu {0} v prevrátenom grafe",
+    'kosaraju_visit_reversed': "Návšteva vrcholu {0}",
+    'kosaraju_push': "Pridaný sused {0} do zásobníka",
+    'kosaraju_scc': "Zistený silne súvislý komponent: {0}",
+    'kosaraju_done': "Kosarajuho algoritmus dokončený. Silne súvislé komponenty: {0}",
+    'tarjan_push': "vrchol {0} pridaný: index {1}, low-link {2}",
+    'tarjan_descend': "Prechod na suseda {0} z vrcholu {1}",
+    'tarjan_lowlink_child': "Aktualizácia low-link {0} na {1} po návšteve {2}",
+    'tarjan_lowlink_stack': "Sused {0} v zásobníku: aktualizácia low-link {1} na {2}",
+    'tarjan_root': "vrchol {0} je koreňom SCC, začíname vytvárať SCC.",
+    'tarjan_pop': "Vyradený vrchol {0} zo zásobníka, aktuálne SCC: {1}",
+    'tarjan_scc': "SCC dokončené: {0}",
+    'tarjan_done': "Tarjanov algoritmus dokončený. Silne súvislé komponenty: {0}",
+    'trace_truncated': "Záznam trasy zastavený po {0} krokoch, trasa by prekročila limit {1} MB na disku. "
+                       "Algoritmus dobehol bez zaznamenania ďalších krokov.",
+}
+
+
+def format_detail(detail):
+    if isinstance(detail, str):
+        return detail
+    kind, *args = detail
+    return DETAIL_TEMPLATES[kind].format(*args)
+
+
+def format_details(details):
+    return [format_detail(detail) for detail in details]
+
+
+class SharedSlice(Sequence):
+    # Pohľad na časť zdieľaného poľa trasy bez kopírovania.
+    def __init__(self, items, start=0, stop=None):
+        self.items = items
+        self.start = start
+        self.stop = len(items) if stop is None else stop
+
+    def __len__(self):
+        return self.stop - self.start
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("index mimo rozsahu")
+        return self.items[self.start + index]
+
+    def __iter__(self):
+        for index in range(self.start, self.stop):
+            yield self.items[index]
+
+    def __reduce__(self):
+        # Do iných procesov sa posiela iba vybraná časť, nie celé pole.
+        return (list, (list(self),))
+
+
+def resolve_step(step, shared, keys=None):
+    # Krok môže namiesto zoznamu obsahovať odkaz 'refs': {kľúč: [pole, začiatok, koniec]}
+    # do polí uložených v trase iba raz.
+    refs = step.get('refs')
+    if not refs:
+        return step
+    resolved = dict(step)
+    for key, (name, start, stop) in refs.items():
+        if keys is None or key in keys:
+            resolved[key] = SharedSlice(shared[name], start, stop)
+    return resolved
+
+
+def format_stack_item(item):
+    if isinstance(item, tuple):
+        if len(item) == 3:
+            return f"Hrana: Vrchol: {item[1]}->{item[2]}-> Ohodnotenie: {item[0]}"
+        if len(item) == 2:
+            return f"vrchol: {item[1]}, Vzdialenosť: {item[0]}"
+    return str(item)
@@ -0,0 +1,280 @@
+import hashlib
+import json
+import struct
+import threading
+import zlib
+from array import array
+from collections import OrderedDict
+
+MAGIC = b"GVTRACE1"
+INDEX_MAGIC = b"GVTRIDX1"
+FORMAT_VERSION = 1
+
+_LENGTH = struct.Struct("<I")
+_FOOTER = struct.Struct("<QQ8s")
+_TUPLE_KEYS = ('stack', 'edges', 'updated_edges', 'no_update_edges')
+# Udalosti, ktorých zoznamy obsahujú n-tice (položky frontov); ostatné zoznamy, napr. komponenty
+# SCC, ostávajú zoznamami, aby sa text kroku po načítaní nezmenil.
+_TUPLE_DETAILS = ('astar_open_list', 'prim_initial_edges', 'prim_queue')
+
+
+def graph_fingerprint(graph, positions):
+    digest = hashlib.sha1()
+    digest.update(b"D" if graph.is_directed() else b"U")
+    for node in sorted(graph.nodes(), key=repr):
+        pos = positions.get(node, (0.0, 0.0))
+        digest.update(f"{node!r}:{float(pos[0]):.6g},{float(pos[1]):.6g};".encode())
+    edges = sorted((repr(u), repr(v), repr(data.get('weight', 1))) for u, v, data in graph.edges(data=True))
+    for u, v, weight in edges:
+        digest.update(f"{u}>{v}:{weight};".encode())
+    return digest.hexdigest()
+
+
+def _to_tuple(value):
+    if isinstance(value, list):
+        return tuple(_to_tuple(item) for item in value)
+    return value
+
+
+def _restore_detail(detail):
+    if not isinstance(detail, list):
+        return detail
+    kind, *args = detail
+    if kind in _TUPLE_DETAILS:
+        args = [[_to_tuple(item) for item in arg] if isinstance(arg, list) else arg for arg in args]
+    return (kind, *args)
+
+
+def encode_step(step, compressed):
+    payload = json.dumps(step, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return zlib.compress(payload, 6) if compressed else payload
+
+
+def decode_step(payload, compressed):
+    if compressed:
+        payload = zlib.decompress(payload)
+    step = json.loads(payload.decode("utf-8"))
+    # JSON nepozná n-tice, hrany a položky štruktúr ich však potrebujú.
+    for key in _TUPLE_KEYS:
+        value = step.get(key)
+        if isinstance(value, list):
+            step[key] = [_to_tuple(item) for item in value]
+    if 'details' in step:
+        step['details'] = [_restore_detail(detail) for detail in step['details']]
+    return step
+
+
+class TraceWriter:
+    def __init__(self, file_path, header, compressed=True):
+        self.compressed = compressed
+        self.file = open(file_path, "wb")
+        self.offsets = array("Q")
+        header = dict(header, version=FORMAT_VERSION, compressed=compressed)
+        encoded = json.dumps(header, ensure_ascii=False).encode("utf-8")
+        self.file.write(MAGIC)
+        self.file.write(_LENGTH.pack(len(encoded)))
+        self.file.write(encoded)
+
+    def append(self, step):
+        self.offsets.append(self.file.tell())
+        write_record(self.file, step, self.compressed)
+
+    def extend(self, steps):
+        for step in steps:
+            self.append(step)
+
+    def close(self):
+        if self.file.closed:
+            return
+        index_offset = self.file.tell()
+        self.file.write(self.offsets.tobytes())
+        self.file.write(_FOOTER.pack(index_offset, len(self.offsets), INDEX_MAGIC))
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+def read_record(file, offset, compressed):
+    file.seek(offset)
+    (length,) = _LENGTH.unpack(file.read(_LENGTH.size))
+    return decode_step(file.read(length), compressed)
+
+
+def write_record(file, step, compressed):
+    payload = encode_step(step, compressed)
+    file.write(_LENGTH.pack(len(payload)))
+    file.write(payload)
+
+
+class LazyTrace:
+    # Spoločný základ pre trasy čítané zo súboru: LRU okno dekódovaných krokov
+    # a vlákno, ktoré dopredu načítava kroky v smere prehrávania.
+    def __init__(self, cache_size=64, prefetch=16):
+        self.cache = OrderedDict()
+        self.shared = {}
+        self.cache_size = cache_size
+        self.prefetch_count = prefetch
+        self.lock = threading.RLock()
+        self.closed = False
+        self._prefetch_target = None
+        self._prefetch_event = threading.Event()
+        self._prefetch_thread = None
+
+    def __len__(self):
+        raise NotImplementedError
+
+    def _is_on_disk(self, index):
+        return True
+
+    def _memory_step(self, index):
+        raise NotImplementedError
+
+    def _read_step(self, index):
+        raise NotImplementedError
+
+    def _remember(self, index, step):
+        self.cache[index] = step
+        while len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("index kroku mimo rozsahu")
+        if not self._is_on_disk(index):
+            return self._memory_step(index)
+        with self.lock:
+            step = self.cache.get(index)
+            if step is not None:
+                self.cache.move_to_end(index)
+                return step
+            step = self._read_step(index)
+            self._remember(index, step)
+            return step
+
+    def __iter__(self):
+        for index in range(len(self)):
+            if not self._is_on_disk(index):
+                yield self._memory_step(index)
+                continue
+            with self.lock:
+                step = self.cache.get(index)
+                if step is None:
+                    step = self._read_step(index)
+            yield step
+
+    def prefetch(self, index, direction):
+        if self.prefetch_count <= 0 or self.closed:
+            return
+        self._prefetch_target = (index, direction)
+        if self._prefetch_thread is None:
+            self._prefetch_thread = threading.Thread(target=self._prefetch_loop, daemon=True)
+            self._prefetch_thread.start()
+        self._prefetch_event.set()
+
+    def _prefetch_loop(self):
+        while True:
+            self._prefetch_event.wait()
+            self._prefetch_event.clear()
+            if self.closed:
+                return
+            index, direction = self._prefetch_target
+            for distance in range(1, self.prefetch_count + 1):
+                if self._prefetch_event.is_set() or self.closed:
+                    break
+                ahead = index + distance * direction
+                if not 0 <= ahead < len(self):
+                    break
+                if not self._is_on_disk(ahead):
+                    continue
+                with self.lock:
+                    if self.closed:
+                        return
+                    if ahead not in self.cache:
+                        self._remember(ahead, self._read_step(ahead))
+
+    def _close_file(self):
+        pass
+
+    def close(self):
+        self.closed = True
+        self._prefetch_event.set()
+        with self.lock:
+            self._close_file()
+            self.cache.clear()
+
+
+class TraceReader(LazyTrace):
+    # Kroky sa čítajú zo súboru až pri prístupe, v pamäti je iba index
+    # a niekoľko naposledy použitých krokov.
+    def __init__(self, file_path, cache_size=64, prefetch=16):
+        super().__init__(cache_size, prefetch)
+        self.file_path = file_path
+        self.file = open(file_path, "rb")
+        if self.file.read(len(MAGIC)) != MAGIC:
+            self.file.close()
+            raise ValueError("Súbor nie je trasa algoritmu.")
+        (length,) = _LENGTH.unpack(self.file.read(_LENGTH.size))
+        self.header = json.loads(self.file.read(length).decode("utf-8"))
+        self.shared = {name: [_to_tuple(item) for item in items]
+                       for name, items in self.header.pop("shared", {}).items()}
+        self.compressed = self.header.get("compressed", False)
+        self.data_start = self.file.tell()
+        self.offsets = self._read_index()
+
+    def _read_index(self):
+        self.file.seek(0, 2)
+        size = self.file.tell()
+        if size - self.data_start >= _FOOTER.size:
+            self.file.seek(size - _FOOTER.size)
+            index_offset, count, magic = _FOOTER.unpack(self.file.read(_FOOTER.size))
+            if magic == INDEX_MAGIC:
+                self.file.seek(index_offset)
+                offsets = array("Q")
+                offsets.frombytes(self.file.read(count * offsets.itemsize))
+                return offsets
+        return self._scan_records(size)
+
+    def _scan_records(self, size):
+        # Nedokončený zápis bez indexu: index sa obnoví prechodom cez záznamy.
+        offsets = array("Q")
+        position = self.data_start
+        while position + _LENGTH.size <= size:
+            self.file.seek(position)
+            (length,) = _LENGTH.unpack(self.file.read(_LENGTH.size))
+            if position + _LENGTH.size + length > size:
+                break
+            offsets.append(position)
+            position += _LENGTH.size + length
+        return offsets
+
+    @property
+    def pseudocode(self):
+        return self.header.get("pseudocode", "")
+
+    @property
+    def fingerprint(self):
+        return self.header.get("fingerprint")
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def _read_step(self, index):
+        return read_record(self.file, self.offsets[index], self.compressed)
+
+    def _close_file(self):
+        self.file.close()
+
+
+def save_trace(file_path, steps, header, compressed=True):
+    shared = getattr(steps, "shared", None)
+    if shared:
+        header = dict(header, shared=shared)
+    with TraceWriter(file_path, header, compressed) as writer:
+        writer.extend(steps)
@@ -0,0 +1,201 @@
+import tempfile
+import tracemalloc
+from array import array
+
+from trace_io import LazyTrace, read_record, write_record
+
+DEFAULT_MEMORY_BUDGET_MB = 256
+DEFAULT_DISK_BUDGET_MB = 4096
+# Pri meraní cez tracemalloc sa pamäť zisťuje iba raz za toľko krokov.
+TRACEMALLOC_INTERVAL = 256
+# Miesto na disku vyhradené pre súhrnný krok po zastavení záznamu.
+SUMMARY_RESERVE = 4096
+
+
+def format_memory_report(report):
+    megabyte = 1024 * 1024
+    text = (f"Pamäť trasy: max {report['peak_memory_bytes'] / megabyte:.1f} MB, "
+            f"na konci {report['final_memory_bytes'] / megabyte:.1f} MB")
+    if report['spilled_steps']:
+        text += (f", na disku {report['disk_bytes'] / megabyte:.1f} MB "
+                 f"({report['spilled_steps']} z {report['steps']} krokov)")
+    if report['dropped_steps']:
+        text += f". Záznam zastavený na limite disku, vynechaných {report['dropped_steps']} krokov"
+    return text + "."
+
+
+def _list_size(value):
+    size = 56 + 72 * len(value)
+    if value and isinstance(value[0], (list, tuple)):
+        # Zoznam n-tíc alebo komponentov: kópie zoznamov zdieľajú vnorené objekty, ráta sa
+        # iba odkaz na každú vnorenú položku. Dĺžky sa sčítajú bez slučky v Pythone.
+        size += 8 * sum(map(len, value))
+    return size
+
+
+def estimate_step_size(step):
+    # Hrubý odhad podľa počtu položiek; presné meranie by bolo drahšie ako samotný krok.
+    # Počítajú sa aj vnorené zoznamy: n-tice v zásobníku a zoznamy v argumentoch detailov,
+    # napr. komponenty v ('kosaraju_done', [[...], ...]).
+    # Ten istý zoznam (napr. front v 'stack' aj v detailoch) sa počíta raz.
+    size = 240 + 104 * len(step)
+    counted = set()
+    for key, value in step.items():
+        if not isinstance(value, (list, tuple)):
+            continue
+        values = [value]
+        if key == 'details':
+            values += [arg for detail in value if isinstance(detail, tuple)
+                       for arg in detail if isinstance(arg, (list, tuple))]
+        for item in values:
+            if id(item) not in counted:
+                counted.add(id(item))
+                size += _list_size(item)
+    return size
+
+
+class TraceStore(LazyTrace):
+    # Kroky sa najprv držia v pamäti. Po prekročení rozpočtu sa presunú do
+    # dočasného súboru, do ktorého sa iba pridáva, a čítajú sa z neho cez LRU okno.
+    # Keď by trasa prekročila aj limit na disku, záznam sa zastaví súhrnným krokom
+    # a ďalšie kroky sa už iba spočítajú; algoritmus dobehne a vráti výsledok.
+    # Pamäť sa odhaduje podľa veľkosti krokov, alebo sa s measure="tracemalloc" meria
+    # prírastok pamäte celého procesu od začiatku trasy.
+    def __init__(self, memory_budget_mb=DEFAULT_MEMORY_BUDGET_MB, cache_size=64, prefetch=16, compressed=False,
+                 disk_budget_mb=DEFAULT_DISK_BUDGET_MB, measure="estimate"):
+        if measure not in ("estimate", "tracemalloc"):
+            raise ValueError(f"Neznámy spôsob merania pamäte: {measure}")
+        super().__init__(cache_size, prefetch)
+        self.memory_budget = int(memory_budget_mb * 1024 * 1024)
+        self.disk_budget = int(disk_budget_mb * 1024 * 1024)
+        self.compressed = compressed
+        self.pending = []
+        self.pending_size = 0
+        self.offsets = array("Q")
+        self.file = None
+        self.disk_size = 0
+        self.peak_memory = 0
+        self.measured = 0
+        self.stopped = False
+        self.dropped = 0
+        self.measure = measure
+        self._started_tracemalloc = False
+        if measure == "tracemalloc":
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracemalloc = True
+            tracemalloc.reset_peak()
+            self.baseline = tracemalloc.get_traced_memory()[0]
+
+    def __len__(self):
+        return len(self.offsets) + len(self.pending)
+
+    @property
+    def spilled(self):
+        return len(self.offsets)
+
+    def append(self, step):
+        if self.stopped:
+            self.dropped += 1
+            return
+        self.pending.append(step)
+        self.pending_size += estimate_step_size(step)
+        if self.measure == "tracemalloc":
+            if len(self.pending) % TRACEMALLOC_INTERVAL:
+                return
+            self._measure()
+            over_budget = self.measured > self.memory_budget
+        else:
+            self.peak_memory = max(self.peak_memory, self.pending_size)
+            over_budget = self.pending_size > self.memory_budget
+        if over_budget:
+            # Na disk sa zapíšu iba kroky, ktoré sa zmestia do limitu; ak niektorý nie, záznam sa zastaví.
+            self.spill(self.disk_budget - SUMMARY_RESERVE)
+            if self.dropped:
+                self._stop_recording()
+
+    def _measure(self):
+        current, peak = tracemalloc.get_traced_memory()
+        self.measured = current - self.baseline
+        self.peak_memory = max(self.peak_memory, peak - self.baseline)
+
+    def _stop_recording(self):
+        # Posledný uložený krok zhrnie, prečo záznam skončil; čakajúce kroky, ktoré sa
+        # do limitu nezmestili, sú už zahodené.
+        self.stopped = True
+        self.pending.append({
+            'highlight': [],
+            'stack': [],
+            'details': [('trace_truncated', len(self), self.disk_budget // (1024 * 1024))],
+            'structure_type': ""
+        })
+        self.spill()
+
+    def extend(self, steps):
+        for step in steps:
+            self.append(step)
+
+    def spill(self, limit=None):
+        if not self.pending:
+            return
+        with self.lock:
+            if self.file is None:
+                self.file = tempfile.TemporaryFile(prefix="gv_trace_", suffix=".steps")
+            self.file.seek(0, 2)
+            for written, step in enumerate(self.pending):
+                offset = self.file.tell()
+                write_record(self.file, step, self.compressed)
+                if limit is not None and self.file.tell() > limit:
+                    self.file.truncate(offset)
+                    self.file.seek(offset)
+                    self.dropped += len(self.pending) - written
+                    break
+                self.offsets.append(offset)
+            self.file.flush()
+            self.disk_size = self.file.tell()
+        self.pending = []
+        self.pending_size = 0
+
+    def memory_usage(self):
+        return self.measured if self.measure == "tracemalloc" else self.pending_size
+
+    def finish(self):
+        # Koniec generovania: meranie sa ukončí a vráti sa súhrn pre stavový riadok a export.
+        if self.measure == "tracemalloc" and tracemalloc.is_tracing():
+            self._measure()
+            if self._started_tracemalloc:
+                tracemalloc.stop()
+                self._started_tracemalloc = False
+        return self.memory_report()
+
+    def memory_report(self):
+        return {
+            'steps': len(self),
+            'spilled_steps': self.spilled,
+            'dropped_steps': self.dropped,
+            'measure': self.measure,
+            'peak_memory_bytes': self.peak_memory,
+            'final_memory_bytes': self.memory_usage(),
+            'disk_bytes': self.disk_size,
+            'memory_budget_bytes': self.memory_budget,
+            'disk_budget_bytes': self.disk_budget,
+        }
+
+    def _is_on_disk(self, index):
+        return index < len(self.offsets)
+
+    def _memory_step(self, index):
+        return self.pending[index - len(self.offsets)]
+
+    def _read_step(self, index):
+        return read_record(self.file, self.offsets[index], self.compressed)
+
+    def _close_file(self):
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+        self.pending = []
+        self.offsets = array("Q")
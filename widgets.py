@@ -0,0 +1,146 @@
+import tkinter as tk
+from tkinter import ttk
+import tkinter.font as tkfont
+
+
+class VirtualListView(ttk.Frame):
+    # Listbox obsahuje iba viditeľné riadky. Položky sa formátujú až pri
+    # zobrazení a prepisujú sa len riadky, ktoré sa oproti minulosti zmenili.
+    def __init__(self, master, height=10, width=40, changed_color="#FFF3B0"):
+        super().__init__(master)
+        self.changed_color = changed_color
+        self.items = []
+        self.previous_items = []
+        self.header = []
+        self.formatter = str
+        self.offset = 0
+        self.rows = height
+        self.shown = []
+        self.shown_changed = []
+
+        controls = ttk.Frame(self)
+        controls.pack(side=tk.TOP, fill=tk.X)
+        ttk.Button(controls, text="Začiatok", width=8, command=self.scroll_to_top).pack(side=tk.LEFT)
+        ttk.Button(controls, text="Koniec", width=8, command=self.scroll_to_bottom).pack(side=tk.LEFT, padx=(2, 0))
+        ttk.Button(controls, text="Ďalšia zmena", command=self.scroll_to_next_change).pack(side=tk.LEFT, padx=(2, 0))
+        self.count_label = ttk.Label(controls, text="")
+        self.count_label.pack(side=tk.RIGHT)
+
+        self.scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self.yview)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.listbox = tk.Listbox(self, height=height, width=width, activestyle=tk.NONE)
+        self.listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.line_height = tkfont.Font(font=self.listbox.cget("font")).metrics("linespace") + 1
+
+        self.listbox.bind("<Configure>", self.on_resize)
+        self.listbox.bind("<MouseWheel>", self.on_mousewheel)
+        self.listbox.bind("<Button-4>", lambda event: self.scroll_by(-3))
+        self.listbox.bind("<Button-5>", lambda event: self.scroll_by(3))
+        self.listbox.bind("<Prior>", lambda event: self.scroll_by(-self.rows))
+        self.listbox.bind("<Next>", lambda event: self.scroll_by(self.rows))
+
+    def __len__(self):
+        return len(self.header) + len(self.items)
+
+    def clear(self):
+        self.set_items([], header=[])
+
+    def set_items(self, items, formatter=str, header=()):
+        self.previous_items = self.items
+        self.items = items
+        self.formatter = formatter
+        self.header = list(header)
+        self.offset = min(self.offset, self.max_offset())
+        self.render()
+
+    def max_offset(self):
+        return max(0, len(self) - self.rows)
+
+    def row_text(self, row):
+        if row < len(self.header):
+            return self.header[row]
+        return self.formatter(self.items[row - len(self.header)])
+
+    def is_changed(self, row):
+        index = row - len(self.header)
+        if index < 0 or self.items is self.previous_items:
+            return False
+        if index >= len(self.previous_items):
+            return True
+        return self.items[index] != self.previous_items[index]
+
+    def render(self):
+        end = min(len(self), self.offset + self.rows)
+        texts = [self.row_text(row) for row in range(self.offset, end)]
+        changed = [self.is_changed(row) for row in range(self.offset, end)]
+        for position, (text, is_changed) in enumerate(zip(texts, changed)):
+            if position < len(self.shown):
+                if self.shown[position] != text:
+                    self.listbox.delete(position)
+                    self.listbox.insert(position, text)
+                    self.shown_changed[position] = None
+            else:
+                self.listbox.insert(tk.END, text)
+                self.shown_changed.append(None)
+            if self.shown_changed[position] != is_changed:
+                self.listbox.itemconfig(position, background=self.changed_color if is_changed else "")
+                self.shown_changed[position] = is_changed
+        if len(self.shown) > len(texts):
+            self.listbox.delete(len(texts), tk.END)
+            del self.shown_changed[len(texts):]
+        self.shown = texts
+        self.update_scrollbar()
+
+    def update_scrollbar(self):
+        total = len(self)
+        if total == 0:
+            self.scrollbar.set(0.0, 1.0)
+            self.count_label.config(text="")
+            return
+        self.scrollbar.set(self.offset / total, min(1.0, (self.offset + self.rows) / total))
+        self.count_label.config(text=f"{len(self.items)} položiek")
+
+    def scroll_to(self, offset):
+        offset = max(0, min(int(offset), self.max_offset()))
+        if offset != self.offset:
+            self.offset = offset
+            self.render()
+
+    def scroll_by(self, amount):
+        self.scroll_to(self.offset + amount)
+        return "break"
+
+    def scroll_to_top(self):
+        self.scroll_to(0)
+
+    def scroll_to_bottom(self):
+        self.scroll_to(self.max_offset())
+
+    def scroll_to_next_change(self):
+        # Porovnávanie so starším krokom prebieha až na požiadanie.
+        start = max(self.offset + 1 - len(self.header), 0)
+        for index in range(start, len(self.items)):
+            if self.is_changed(index + len(self.header)):
+                self.scroll_to(index + len(self.header))
+                return
+        for index in range(0, min(start, len(self.items))):
+            if self.is_changed(index + len(self.header)):
+                self.scroll_to(index + len(self.header))
+                return
+
+    def yview(self, *args):
+        if args[0] == "moveto":
+            self.scroll_to(float(args[1]) * len(self))
+        elif args[0] == "scroll":
+            amount = int(args[1])
+            self.scroll_by(amount * self.rows if args[2] == "pages" else amount)
+
+    def on_mousewheel(self, event):
+        return self.scroll_by(-3 if event.delta > 0 else 3)
+
+    def on_resize(self, event):
+        rows = max(1, event.height // self.line_height)
+        if rows != self.rows:
+            self.rows = rows
+            self.offset = min(self.offset, self.max_offset())
+            self.render()